@@ -10,36 +10,63 @@ from circle_nom.systems.asset_loader import AssetLoader
 import circle_nom.helpers.player_utils as player_utils
 import circle_nom.helpers.other_utils as other_utils
 from circle_nom.helpers.asset_bank import AssetBank
-from circle_nom.systems.logging import get_logger
-from circle_nom.systems.timer import Timer
+from circle_nom.systems.logging import get_logger, INFO
+from circle_nom.systems.replay import NullReplay, Replay, ReplayHeader
+from circle_nom.systems.event_log import EventLog
+from circle_nom.systems.music import MusicService
+from circle_nom.systems.voice_pool import VoicePool
+from circle_nom.systems.collision import CollisionSystem
+from circle_nom.systems.entity_store import EntityStore
+from circle_nom.systems.controls import KeyInput, keyboard
+from circle_nom.systems.timer import Timer, FrameTime
 import circle_nom.helpers.debug as debug
 
 # Models
 from circle_nom.models.player import Player
-from circle_nom.models.dagger import Dagger
-from circle_nom.models.prey import Prey
+from circle_nom.models.dagger import Dagger, DaggerView
+from circle_nom.models.prey import Prey, PreyView
 
 # Others Game elements
 from circle_nom.ui.health_bar import HealthBar
 
 # Builtins & Third-party
+from typing import Callable, NamedTuple
+from functools import partial
+from datetime import datetime
 import random
 import pygame
-import math
 import time
 import sys
+import os
+
+class GameResult(NamedTuple):
+    """Outcome of a simulated game, returned by CircleNom.simulate()."""
+    time: float                 # Simulated time in seconds
+    steps: int                  # Simulation steps run
+    points: tuple[int, ...]     # Final points per Player
+    sizes: tuple[float, ...]    # Final size per Player
+    game_over: bool             # True if a Player reached the minimum size, False if the time limit was hit
+    seed: int                   # The game's seed - the same seed and inputs play the same game again
 
 class CircleNom():
     
-    # Static draw positions for different game elements - autoresized with screen resolution
-    _SCREEN_SIZE = pygame.display.get_window_size()
+    # Static draw positions for different game elements - screen size dependent ones are set in the init
     _TIMER_POS = (10, 50)
-    _DASH_ICO_POS_1 = (_SCREEN_SIZE[0] - 46, 18)
-    _DASH_ICO_POS_2 = (_SCREEN_SIZE[0] / 2.71, 18)
     _POINTS_POS = (10, 10)
-    _HLT_BAR_POS_1 = pygame.Vector2(_SCREEN_SIZE[0] - 330, 20)
     _HLT_BAR_POS_2 = pygame.Vector2(188, 20)
     
+    # Simulation rate used by simulate() in games with a variable time step
+    _HEADLESS_SIM_RATE = 120
+    
+    # Stress play mode - a Singleplayer game whose Prey and Dagger counts keep doubling, see _stress_ramp()
+    STRESS_PLAY_MODE = 2
+    
+    # Minimum Prey and Dagger count for the entity stores - below it the array overhead costs more than the bulk updates save
+    ENTITY_STORE_MIN_COUNT = 384
+    
+    # Fixed timestep - longest frame time fed to the simulation, avoids a spiral of catch-up updates after a stall
+    _MAX_FRAME_TIME = 0.25
+    
     # Logger reference
     _LOGGER = get_logger(name=__name__)
     
@@ -63,7 +90,20 @@ class CircleNom():
                  difficulty: int,
                  play_mode: int,
                  player_accessory: tuple[pygame.Vector2, pygame.Surface] | None,
-                 background_image: pygame.Surface
+                 background_image: pygame.Surface,
+                 sim_rate: int | None = None,
+                 headless: bool = False,
+                 input_source: Callable[["CircleNom", FrameTime], KeyInput] | None = None,
+                 prey_cd: float | None = None,
+                 dagger_cd: float | None = None,
+                 seed: int | None = None,
+                 easter_mode: bool | None = None,
+                 prey_count: int | None = None,
+                 dagger_count: int | None = None,
+                 stress: tuple[float, int, int] | None = None,
+                 entity_store: bool | None = None,
+                 event_log: str | None = None,
+                 record_replay: bool | None = None
                  ) -> None:
         """
         Initializes the Circle Nom game with settings and some assets given from the Menu.
@@ -72,13 +112,49 @@ class CircleNom():
             screen (pygame.Surface): The Pygame screen object, declared in main.
             fps_cap (int): The FPS the game should run at, selected in the Menu.
             difficulty (int): The game difficulty level, selected in the Menu. Can be 0, 1, 2 or 3 - corresponding to Easy, Medium, Hard and Impossible.
-            play_mode (int): The game mode, selected in the Menu. Can be 0 or 1 - corresponding to  Singleplayer or Multiplayer.
+            play_mode (int): The game mode, selected in the Menu. Can be 0, 1 or 2 - corresponding to Singleplayer, Multiplayer or Stress. \n
+                Stress is a Singleplayer game whose Prey and Dagger counts double every stress interval.
             player_accessory (tuple[pygame.Vector2, pygame.Surface] | None): The player's accessory data pair, randomly chosen in the Menu.
             background_image (pygame.Surface): The game's background image, randomly chosen in the Menu.
+            sim_rate (int | None): Fixed simulation rate in Hz, 0 for a variable time step. Read from the config if None.
+            headless (bool): Headless game - no music or sound effects, run with simulate() instead of start(). \n
+                The screen can be any offscreen surface, no display mode or window is needed.
+            input_source (Callable | None): Called with the game and the frame before every update, returns the pressed keys. \n
+                Reads the keyboard if None. Use it to drive the Players with scripts or bots.
+            prey_cd (float | None): Optional Prey spawned duration in seconds, overrides the difficulty's config value.
+            dagger_cd (float | None): Optional Dagger spawnrate in seconds, overrides the difficulty's config value.
+            seed (int | None): Seed of the game's RNGs. A random one is picked (and logged) if None.
+            easter_mode (bool | None): Optionally forces the easter mode roll's result. The roll itself still happens.
+            prey_count (int | None): Starting Prey count, 0 for the play mode's count. Read from the config if None.
+            dagger_count (int | None): Starting Dagger count, 0 for the play mode's count. Read from the config if None.
+            stress (tuple[float, int, int] | None): Stress mode count doubling interval in seconds, maximum Prey and Dagger counts. \n
+                Read from the config if None. Unused outside of the stress mode.
+            entity_store (bool | None): Keep the Prey and Dagger state in NumPy entity stores, stepped in bulk. \n
+                If None it's on if the config turns it on, in the stress mode and for ENTITY_STORE_MIN_COUNT or more Preys and Daggers. \n
+                Plays the same game either way.
+            event_log (str | None): Optional path to log the game's gameplay events to, see EventLog. \n
+                If None and event logging is enabled in the config, the events are logged in the 'events' folder.
+            record_replay (bool | None): Record the game's replay in self.replay, see Replay. If None it's only recorded \n
+                if replay recording is enabled in the config. start() also records it when given a replay path.
         """
         # -- Main Objects: declared in Main --
         self.screen = screen
         
+        # -- Screen size dependent draw positions --
+        self._DASH_ICO_POS_1 = (self.screen.width - 46, 18)
+        self._DASH_ICO_POS_2 = (self.screen.width / 2.71, 18)
+        self._HLT_BAR_POS_1 = pygame.Vector2(self.screen.width - 330, 20)
+        
+        # -- Headless mode and the Player input source --
+        self.HEADLESS = headless
+        self._input_source = input_source if input_source else keyboard
+        
+        # -- Game RNGs: seeded per game, every random pick of the game and its models is drawn from these --
+        # Gameplay and effects (sounds, texts, music) use separate streams, so muted headless games play out the same
+        self.SEED = seed if seed is not None else random.getrandbits(64)
+        self.rng = random.Random(self.SEED)
+        self.fx_rng = random.Random(self.rng.getrandbits(64))
+        
         # -- Menu Randoms: chosen by the Menus --
         self.PLAYER_ACCESSORY = player_accessory
         self.BACKGROUND_IMAGE = background_image
@@ -96,16 +172,54 @@ class CircleNom():
             self._LOGGER.error(msg="Invalid difficulty level. Falling back to 1 - Medium.")
             self.DIFFICULTY = 1
         
-        if play_mode in (0, 1):
+        if play_mode in (0, 1, self.STRESS_PLAY_MODE):
             self.PLAY_MODE = play_mode
         else:
             self._LOGGER.error("Invalid play mode level. Falling back to 0 - Singleplayer.")
             self.PLAY_MODE = 0
         
-        # -- Calculate game object counts based on the play mode --
+        # Stress mode plays as Singleplayer - the rest of the game only sees Singleplayer
+        self.STRESS = self.PLAY_MODE == self.STRESS_PLAY_MODE
+        if self.STRESS:
+            self.PLAY_MODE = 0
+        
+        # -- Simulation rate: fixed timestep updates with interpolated rendering, or one variable update per frame --
+        if sim_rate is None:
+            sim_rate = ConfigReader.get_sim_rate()
+        if type(sim_rate) == int and sim_rate >= 0:
+            self.SIM_RATE = sim_rate
+        else:
+            self._LOGGER.error("Invalid simulation rate. Falling back to 0 - Variable time step.")
+            self.SIM_RATE = 0
+        self.SIM_STEP = 1 / self.SIM_RATE if self.SIM_RATE else 0.00
+        
+        # -- Game object counts: Players from the play mode, Preys and Daggers from the arguments or the config --
         PLAYER_COUNT = self.PLAY_MODE + 1       # 1 or 2 players
-        PREY_COUNT = (self.PLAY_MODE  + 1) * 2  # 2 or 4 preys
-        DAGGER_COUNT = self.PLAY_MODE  + 1      # 1 or 2 daggers
+        config_prey_count, config_dagger_count = ConfigReader.get_entity_counts()
+        prey_count = config_prey_count if prey_count is None else prey_count
+        dagger_count = config_dagger_count if dagger_count is None else dagger_count
+        if type(prey_count) != int or type(dagger_count) != int or prey_count < 0 or dagger_count < 0:
+            self._LOGGER.error("Invalid Prey or Dagger count. Falling back to the play mode counts.")
+            prey_count = dagger_count = 0
+        self.PREY_COUNT = prey_count or PLAYER_COUNT * 2    # 2 or 4 preys by default
+        self.DAGGER_COUNT = dagger_count or PLAYER_COUNT    # 1 or 2 daggers by default
+        
+        # -- Stress mode settings: count doubling interval and the maximum counts --
+        self.STRESS_SETTINGS = stress if stress is not None else ConfigReader.get_stress()
+        if self.STRESS_SETTINGS[0] <= 0 or self.STRESS_SETTINGS[1] < 1 or self.STRESS_SETTINGS[2] < 1:
+            self._LOGGER.error("Invalid stress mode settings. Falling back to the config values.")
+            self.STRESS_SETTINGS = ConfigReader.get_stress()
+        self._next_ramp = self.STRESS_SETTINGS[0]
+        self._ramp_wall_time = 0.00
+        self._ramp_steps = 0
+        
+        # -- Entity stores: Prey and Dagger state in NumPy columns, see PreyView and DaggerView --
+        if entity_store is None:
+            entity_store = ConfigReader.get_entity_store() or self.STRESS or \
+                self.PREY_COUNT + self.DAGGER_COUNT >= self.ENTITY_STORE_MIN_COUNT
+        self.ENTITY_STORE = bool(entity_store)
+        self.prey_store = EntityStore(PreyView.STORE_COLUMNS, capacity=self.PREY_COUNT) if self.ENTITY_STORE else None
+        self.dagger_store = EntityStore(DaggerView.STORE_COLUMNS, capacity=self.DAGGER_COUNT) if self.ENTITY_STORE else None
         
         # -- Difficulty selector:  adjusts balancing attributes --
         # Prey
@@ -118,6 +232,8 @@ class CircleNom():
             Prey.set_spawned_duration(new_duration=HARD_CD)
         elif self.DIFFICULTY == 3:  # Impossible
             Prey.set_spawned_duration(new_duration=IMPOSSIBLE_CD)
+        if prey_cd is not None:     # Override
+            Prey.set_spawned_duration(new_duration=prey_cd)
             
         # Dagger
         EASY_CD, MEDIUM_CD, HARD_CD, IMPOSSIBLE_CD = ConfigReader.get_dagger_difficulty()
@@ -129,26 +245,35 @@ class CircleNom():
             Dagger.set_spawnrate(new_spawnrate=HARD_CD)
         elif self.DIFFICULTY == 3:  # Impossible
             Dagger.set_spawnrate(new_spawnrate=IMPOSSIBLE_CD)
+        if dagger_cd is not None:   # Override
+            Dagger.set_spawnrate(new_spawnrate=dagger_cd)
             
         # -- Engine objects: Declared in the Engine --
-        self.game_timer = Timer(name="EngineTimerThread")
+        self.game_timer = Timer(name="EngineTimer", threaded=False)
+        
+        # Fixed timestep state - unsimulated frame time and the last simulated frame
+        self._accumulator = 0.00
+        self._sim_frame = self.game_timer.last_snapshot
 
         # -- Declaring game models --
         # Player
         # Decide if Easter mode will be active - if it is, reverse Player/Prey images
-        self.EASTER_MODE = random.randint(a=0, b=100) < ConfigReader.get_easter_chance()
+        self.EASTER_MODE = self.rng.randint(a=0, b=100) < ConfigReader.get_easter_chance()
+        if easter_mode is not None:
+            self.EASTER_MODE = easter_mode
         if not self.EASTER_MODE: 
             self.tuple_players: tuple[Player, ...] = other_utils.declare_objects(
                 PLAYER_COUNT, 
-                Player, self.screen, self.game_timer, self.EASTER_MODE,
-                self._AB.player_image, self._AB.player_image_dead, self._AB.player_eat_sequence, self.PLAYER_ACCESSORY
+                Player, self.screen, self.game_timer, self.fx_rng, self.EASTER_MODE,
+                self._AB.player_image, self._AB.player_image_dead, self._AB.player_eat_sequence, self.PLAYER_ACCESSORY,
+                muted=self.HEADLESS
             )
         else:            
-            TEMP_easter_player_image = random.choice(self._AB.prey_images)
+            TEMP_easter_player_image = self.rng.choice(self._AB.prey_images)
             self.tuple_players: tuple[Player, ...] = other_utils.declare_objects(
                 PLAYER_COUNT, 
-                Player, self.screen, self.game_timer, self.EASTER_MODE,
-                TEMP_easter_player_image, TEMP_easter_player_image, None, None
+                Player, self.screen, self.game_timer, self.fx_rng, self.EASTER_MODE,
+                TEMP_easter_player_image, TEMP_easter_player_image, None, None, muted=self.HEADLESS
             ) # Dont use player eat sequence and player accessory for easter mode
             
             # Create a new temporary prey images list
@@ -158,126 +283,582 @@ class CircleNom():
             TEMP_prey_images.append(pygame.transform.smoothscale(self._AB.player_image, (64, 64)))
             TEMP_prey_images.append(pygame.transform.smoothscale(self._AB.player_image_dead, (64, 64)))
         
-        # Preys declaration
-        if not self.EASTER_MODE:
-            self.tuple_preys: tuple[Prey] = other_utils.declare_objects(
-                PREY_COUNT, Prey, self.screen, self.game_timer,
-                self._AB.prey_images, self._AB.prey_aura
-            )
-        else:
-            self.tuple_preys: tuple[Prey] = other_utils.declare_objects(
-                PREY_COUNT, Prey, self.screen, self.game_timer,
-                TEMP_prey_images, self._AB.prey_aura
-            )
+        # Preys declaration - kept images are used for the Preys added by the stress mode
+        self._prey_images = self._AB.prey_images if not self.EASTER_MODE else TEMP_prey_images
+        self._prey_images_name = "prey_images" if not self.EASTER_MODE else "easter_prey_images"
+        self.tuple_preys: tuple[Prey, ...] = self._declare_preys(self.PREY_COUNT)
             
         # Health bar declaration
         self.health_bar = HealthBar(self._AB.health_bar, self.screen)
 
+        # Music service - plays the game themes, headless games have no music
+        self._music = MusicService(self._AB.game_themes, self._AL) if not self.HEADLESS else None
+
         # Dagger/s declaration
-        self.tuple_daggers: tuple[Dagger] = other_utils.declare_objects(
-            DAGGER_COUNT, Dagger, self.screen, self.game_timer,
-            self._AB.dagger_images, self._AB.dagger_sounds, self._AB.flame_sequence
-        )
+        self.tuple_daggers: tuple[Dagger, ...] = self._declare_daggers(self.DAGGER_COUNT)
         
         # Dagger/s initial grace period
         for dagger in self.tuple_daggers:
-            dagger.grace_spawn(random.uniform(3, 4))
+            dagger.grace_spawn(self.rng.uniform(3, 4))
+            
+        # Collision system - eat and hit checks of every Player against every Prey and Dagger
+        self.collisions = CollisionSystem(
+            self.tuple_players, self.tuple_preys, self.tuple_daggers, prey_store=self.prey_store, dagger_store=self.dagger_store
+        )
+            
+        # Replay - records the input of every simulation step, see start(), simulate() and from_replay()
+        # Games that won't save their replay use a NullReplay, which records nothing
+        if record_replay is None:
+            record_replay = ConfigReader.get_record_replays()
+        self.replay = (Replay if record_replay else NullReplay)(ReplayHeader(
+            seed=self.SEED, play_mode=self.STRESS_PLAY_MODE if self.STRESS else self.PLAY_MODE, difficulty=self.DIFFICULTY,
+            easter_mode=self.EASTER_MODE, sim_rate=self.SIM_RATE, screen_size=self.screen.get_size(),
+            prey_cd=Prey.SPAWNED_DUR, dagger_cd=Dagger._SPAWN_RATE, prey_count=self.PREY_COUNT, dagger_count=self.DAGGER_COUNT,
+            stress=self.STRESS_SETTINGS
+        ))
+        
+        # Event log - binary records of the gameplay events, written as they happen. See _attach_event_log()
+        if event_log is None and ConfigReader.get_record_events():
+            event_log = f"{os.getcwd()}/events/{datetime.now().strftime('%Y-%m-%d_%H-%M-%S')}_{self.SEED}.cne"
+        self.events = EventLog(event_log, self.SEED) if event_log else None
+        self._frame = self._sim_frame     # Frame of the update being simulated, the time of the recorded events
+        self._attach_event_log(0, 0)
         
         # Log the Circle Nom init
         TEMP_diff_to_str = {0: "Easy", 1: "Medium", 2: "Hard", 3: "Impossible"}
         TEMP_mode_to_str = {0: "Singleplayer", 1: "Multiplayer"}
         log_str = (
             "Circle Nom game initialized successfully with " 
-            f"difficulty {TEMP_diff_to_str[self.DIFFICULTY]}, play mode {TEMP_mode_to_str[self.PLAY_MODE]}, "
-            f"easter mode {self.EASTER_MODE}, FPS Cap {self.FPS_CAP}."
+            f"difficulty {TEMP_diff_to_str[self.DIFFICULTY]}, play mode {'Stress' if self.STRESS else TEMP_mode_to_str[self.PLAY_MODE]}, "
+            f"{self.PREY_COUNT} preys, {self.DAGGER_COUNT} daggers, entity store {self.ENTITY_STORE}, "
+            f"easter mode {self.EASTER_MODE}, FPS Cap {self.FPS_CAP}, simulation rate {self.SIM_RATE or 'variable'}, "
+            f"headless {self.HEADLESS}, seed {self.SEED}, event log {self.events is not None}."
         )
         self._LOGGER.info(log_str)
         
     def _try_eat_prey(self) -> None:
         """
-        Checks if any Player is near any Prey object using the Player's eat position, eat tolerance and math.isclose. \n
+        Checks if any Player is near any Prey object using the Player's eat position and eat tolerance, see CollisionSystem. \n
         If it is, apply size, speed and points increase to the Player and reset the Prey to effectively "eat" it.
         """
-        for player in self.tuple_players:
-            for prey in self.tuple_preys:
-                if math.isclose(player.eat_pos.x, prey.position.x, abs_tol=player.eat_tol) and \
-                    math.isclose(player.eat_pos.y, prey.position.y, abs_tol=player.eat_tol) and \
-                        prey.eatable and player.can_eat:
+        for player_idx, prey_idx in self.collisions.eat_pairs():
+            player, prey = self.tuple_players[player_idx], self.tuple_preys[prey_idx]
                     
-                    # Bonus points for aura'd prey
-                    if prey.aura:
-                        player.size += 20
-                        player.speed += 16
-                        player.speed_before_dash += 16
-                        player.points += 2
-                    else:
-                        player.size += 10
-                        player.speed += 8
-                        player.speed_before_dash += 8
-                        player.points += 1
+            # Bonus points for aura'd prey
+            if prey.aura:
+                player.size += 20
+                player.speed += 16
+                player.speed_before_dash += 16
+                player.points += 2
+            else:
+                player.size += 10
+                player.speed += 8
+                player.speed_before_dash += 8
+                player.points += 1
+            
+            # Record the eat before the prey moves
+            if self.events is not None:
+                self.events.record(self._frame, EventLog.EAT, player_idx, prey_idx, prey.position, 2 if prey.aura else 1)
                             
-                    # Play eat random sound
-                    random.choice(self._AB.player_eat_sounds).play()
+            # Play eat random sound
+            if not self.HEADLESS:
+                VoicePool.play("eat", self.fx_rng.choice(self._AB.player_eat_sounds))
                     
-                    # Reset player and prey
-                    prey.reset_prey()
-                    player.reset_eat_attributes()
+            # Reset player and prey
+            prey.reset_prey()
+            player.reset_eat_attributes()
                     
-                    # Log the prey eat
-                    self._LOGGER.info(f"Player ate prey at X {prey.position.x:.2f} Y {prey.position.y:.2f}, aura {prey.aura}.")
+            # Log the prey eat
+            if self._LOGGER.isEnabledFor(INFO):
+                position = prey.position
+                self._LOGGER.info("Player ate prey at X %.2f Y %.2f, aura %s.", position.x, position.y, prey.aura)
         
     def _try_hit_dagger(self) -> None:
         """
-        Checks if any Player is near any Dagger object using the Player's hit position, hit tolerance and math.isclose. \n
+        Checks if any Player is near any Dagger object using the Player's hit position and hit tolerance, see CollisionSystem. \n
         If it is, apply size, speed reductions to the Player and reset the Dagger to effectively make the Player get hit by the Dagger. 
         """
-        for player in self.tuple_players:
-            for dagger in self.tuple_daggers:
-                if math.isclose(player.hit_pos.x, dagger.position.x, abs_tol=player.hit_tol) and \
-                    math.isclose(player.hit_pos.y, dagger.position.y, abs_tol=player.hit_tol):
+        for player_idx, dagger_idx in self.collisions.hit_pairs():
+            player, dagger = self.tuple_players[player_idx], self.tuple_daggers[dagger_idx]
                         
-                    # Bigger penalty if its a flaming dagger
-                    if dagger.flame:
-                        player.size -= 15
-                        player.speed -= 5
-                    else:
-                        player.size -= 10
+            # Bigger penalty if its a flaming dagger
+            if dagger.flame:
+                player.size -= 15
+                player.speed -= 5
+            else:
+                player.size -= 10
+            
+            # Record the hit before the dagger moves
+            if self.events is not None:
+                self.events.record(self._frame, EventLog.HIT, player_idx, dagger_idx, dagger.position, 15 if dagger.flame else 10)
                         
-                    # First reset dagger & player
-                    dagger.reset_dagger()
-                    player.reset_hurt_attributes()
+            # First reset dagger & player
+            dagger.reset_dagger()
+            player.reset_hurt_attributes()
                     
-                    # If player is hit dagger spawn will have a grace period where no Dagger will spawn
-                    dagger.grace_spawn(random.uniform(1, 2))
+            # If player is hit dagger spawn will have a grace period where no Dagger will spawn
+            dagger.grace_spawn(self.rng.uniform(1, 2))
                     
-                    # Play random sound 
-                    random.choice(self._AB.player_hit_sounds).play()
+            # Play random sound 
+            if not self.HEADLESS:
+                VoicePool.play("hit", self.fx_rng.choice(self._AB.player_hit_sounds))
                     
-                    # Log the hit
-                    self._LOGGER.info(f"Player hit with dagger at X {dagger.position.x:.2f} Y {dagger.position.y:.2f}, flame {dagger.flame}.")
+            # Log the hit
+            if self._LOGGER.isEnabledFor(INFO):
+                position = dagger.position
+                self._LOGGER.info("Player hit with dagger at X %.2f Y %.2f, flame %s.", position.x, position.y, dagger.flame)
                     
     def _music_player(self, index: int) -> str:
-        """Plays music from the game_themes list with the given index. Returns the song name."""
+        """
+        Plays music from the game_themes list with the given index. Returns the song name. \n
+        The themes next to it are read ahead of time by the music service, so the next switch doesn't wait on the disk.
+        """
         if type(index) != int:
             raise ValueError("Index must be integer!")
             
-        pygame.mixer.music.unload()
-        music_name, music_path = self._AB.game_themes[index % len(self._AB.game_themes)]
-        self._AL.load_music(music_path)
-        pygame.mixer.music.play()
-        self._LOGGER.info(f"Playing music {music_name} with index {index}.")
+        music_name = self._music.play(index)
+        self.replay.record_event(Replay.MUSIC, index)
         return music_name
 
-    def start(self) -> None:
-        """Starts the Circle Nom game."""
+    def _declare_preys(self, count: int, frame: FrameTime | None = None) -> tuple[Prey, ...]:
+        """
+        Declares the given count of Preys, as PreyViews of the Prey store if the game uses entity stores.
+        
+        Args:
+            count (int): The number of Preys to declare.
+            frame (FrameTime | None): The frame the Preys are created on. The game timer's last snapshot if None.
+        """
+        args = (self.screen, self.game_timer, self.rng, self._prey_images, self._AB.prey_aura)
+        if self.prey_store is not None:
+            return other_utils.declare_objects(count, PreyView, self.prey_store, *args, frame=frame, images_name=self._prey_images_name)
+        return other_utils.declare_objects(count, Prey, *args, frame=frame, images_name=self._prey_images_name)
+    
+    def _declare_daggers(self, count: int, frame: FrameTime | None = None) -> tuple[Dagger, ...]:
+        """
+        Declares the given count of Daggers, as DaggerViews of the Dagger store if the game uses entity stores.
+        
+        Args:
+            count (int): The number of Daggers to declare.
+            frame (FrameTime | None): The frame the Daggers are created on. The game timer's last snapshot if None.
+        """
+        args = (
+            self.screen, self.game_timer, self.rng, self.fx_rng,
+            self._AB.dagger_images_rotated, self._AB.dagger_sounds, self._AB.flame_sequence_rotated
+        )
+        if self.dagger_store is not None:
+            return other_utils.declare_objects(count, DaggerView, self.dagger_store, *args, frame=frame)
+        return other_utils.declare_objects(count, Dagger, *args, frame=frame)
+
+    def _attach_event_log(self, first_prey: int, first_dagger: int) -> None:
+        """
+        Hooks the event log to the Preys and Daggers from the given indexes on, and records their current state and spawn. \n
+        Does nothing if the game has no event log.
+        
+        Args:
+            first_prey (int): Index of the first Prey to hook.
+            first_dagger (int): Index of the first Dagger to hook.
+        """
+        if self.events is None:
+            return
+        for idx in range(first_prey, len(self.tuple_preys)):
+            self.tuple_preys[idx].on_state_change = partial(self._record_prey_state, idx)
+            self._record_prey_state(idx, self.tuple_preys[idx].state)
+        for idx in range(first_dagger, len(self.tuple_daggers)):
+            self.tuple_daggers[idx].on_reset = partial(self._record_dagger_spawn, idx)
+            self._record_dagger_spawn(idx)
+    
+    def _record_prey_state(self, idx: int, state: str) -> None:
+        """Records the state change of the Prey with the given index in the event log."""
+        self.events.record(self._frame, EventLog.PREY_STATE, -1, idx, self.tuple_preys[idx].position, Prey.STATES.index(state))
+    
+    def _record_dagger_spawn(self, idx: int) -> None:
+        """Records the new spawn of the Dagger with the given index in the event log."""
+        dagger = self.tuple_daggers[idx]
+        self.events.record(self._frame, EventLog.DAGGER_SPAWN, -1, idx, dagger.position, dagger.speed_multiplier)
+
+    def _stress_ramp(self, frame: FrameTime) -> None:
+        """
+        Doubles the Prey and Dagger counts of a stress mode game, up to the maximum counts. \n
+        Logs the wall time per update since the last ramp (rendering included), to find where the game stops keeping up.
+        
+        Args:
+            frame (FrameTime): The frame the new models are added on.
+        """
+        interval, max_prey, max_daggers = self.STRESS_SETTINGS
+        self._next_ramp += interval
+        
+        # Wall time per update at the counts before this ramp
+        now = time.perf_counter()
+        step_ms = (now - self._ramp_wall_time) / max(self._ramp_steps, 1) * 1000
+        self._LOGGER.info(
+            f"Stress mode ran {self._ramp_steps} updates with {len(self.tuple_preys)} preys and {len(self.tuple_daggers)} daggers "
+            f"at {step_ms:.3f}ms per update."
+        )
+        self._ramp_wall_time, self._ramp_steps = now, 0
+        
+        new_prey = min(len(self.tuple_preys) * 2, max_prey) - len(self.tuple_preys)
+        new_daggers = min(len(self.tuple_daggers) * 2, max_daggers) - len(self.tuple_daggers)
+        if new_prey <= 0 and new_daggers <= 0:
+            return
+        
+        # New models start their timings from the simulated frame, not the game timer - replays add them at the same time
+        first_prey, first_dagger = len(self.tuple_preys), len(self.tuple_daggers)
+        self.tuple_preys += self._declare_preys(max(new_prey, 0), frame=frame)
+        self.tuple_daggers += self._declare_daggers(max(new_daggers, 0), frame=frame)
+        self._attach_event_log(first_prey, first_dagger)
+        
+        # The collision system picks its broadphase from the new counts
+        self.collisions = CollisionSystem(
+            self.tuple_players, self.tuple_preys, self.tuple_daggers, prey_store=self.prey_store, dagger_store=self.dagger_store
+        )
+        self._LOGGER.info(f"Stress mode ramped up to {len(self.tuple_preys)} preys and {len(self.tuple_daggers)} daggers.")
+
+    def _update(self, frame: FrameTime) -> None:
+        """
+        Advances the game simulation by one frame: models, eat/hit checks and Player controls. Draws nothing.
+        
+        Args:
+            frame (FrameTime): The game timer snapshot for the current frame.
+        """
+        dt = frame.dt
+        self._frame = frame
+        
+        # Stress mode - add models once the ramp interval passes, time the updates at every count
+        if self.STRESS:
+            if frame.now >= self._next_ramp:
+                self._stress_ramp(frame)
+            if not self._ramp_steps:
+                self._ramp_wall_time = time.perf_counter()
+            self._ramp_steps += 1
+        
+        # Read and record the Player input for this update
+        keys = self._input_source(self, frame)
+        self.replay.record_step(frame, keys)
+        
+        # Update all Game models
+        if self.dagger_store is not None:
+            DaggerView.update_all(self.dagger_store, self.tuple_daggers, frame, screen=None if self.HEADLESS else self.screen)
+        else:
+            for dagger in self.tuple_daggers:
+                dagger.update(frame)
+            
+                # Play sound if its on screen
+                if not self.HEADLESS and 0 <= dagger.position.x <= self.screen.width and \
+                    0 <= dagger.position.y <= self.screen.height:
+                    dagger.play_sound()
+                
+        for player in self.tuple_players:
+            player.update(frame)
+            
+            # Reduce Player size and speed
+            player.size -= player_utils.get_size_reduct(player, dt)  
+            player.speed -= 5 * dt
+            
+        if self.prey_store is not None:
+            PreyView.update_all(self.prey_store, self.tuple_preys, frame)
+        else:
+            for prey in self.tuple_preys:
+                prey.update(frame)
+            
+        # Run the other methods required - the collision arrays are synced once the models are updated
+        self.collisions.sync()
+        self._try_eat_prey()
+        self._try_hit_dagger()
+        
+        # Dash availability before the controls - a Player whose dash stops being available dashed this update
+        dash_available = [player.dash_available for player in self.tuple_players] if self.events is not None else None
+        
+        # Controls for Player/s
+        # Singleplayer case
+        if self.PLAY_MODE == 0:
+            
+            # Enable both control options for singleplayer since we have only one player
+            player_utils.control_movement(self.tuple_players[0], dt, arrows=True, wasd=True, keys=keys)
+            player_utils.check_bounds(self.screen, self.tuple_players[0]) # Keeps player in screen area
+        
+        # Multiplayer case
+        elif self.PLAY_MODE == 1:
+            
+            # Player 1 gets only WASD controls
+            player_utils.control_movement(player=self.tuple_players[0], dt=dt, arrows=False, wasd=True, keys=keys)
+            player_utils.check_bounds(screen=self.screen, player=self.tuple_players[0])
+            
+            # Player 2 gets ARROWS controls
+            player_utils.control_movement(player=self.tuple_players[1], dt=dt, arrows=True, wasd=False, keys=keys)
+            player_utils.check_bounds(screen=self.screen, player=self.tuple_players[1])
+            
+            # This checks if both players are near eachother and pushes them appart if they are
+            player_utils.check_collision(player_1=self.tuple_players[0], player_2=self.tuple_players[1], dt=dt)
+        
+        # Record the dashes
+        if dash_available is not None:
+            for player_idx, player in enumerate(self.tuple_players):
+                if dash_available[player_idx] and not player.dash_available:
+                    self.events.record(frame, EventLog.DASH, player_idx, -1, player.position, player.speed)
+            
+    def _step(self, frame: FrameTime) -> float:
+        """
+        Advances the game simulation by the frame's delta time. \n
+        With a fixed simulation rate it runs as many fixed size updates as the accumulated frame time allows and keeps the rest
+        for the next frame, otherwise it runs a single update with the frame's delta time.
+        
+        Args:
+            frame (FrameTime): The game timer snapshot for the current frame.
+        
+        Returns:
+            float: How far between the last two simulated states the frame is, 0.0 to 1.0. Always 1.0 for the variable time step.
+        """
+        if not self.SIM_RATE:
+            self._update(frame)
+            return 1.00
+        
+        # Accumulate the real frame time, clamped so a long stall doesn't cause a burst of catch-up updates
+        self._accumulator += min(frame.dt, self._MAX_FRAME_TIME)
+        
+        # Consume it in fixed steps - simulated time only moves in whole steps
+        while self._accumulator >= self.SIM_STEP:
+            last = self._sim_frame
+            self._sim_frame = FrameTime(last.now + self.SIM_STEP, self.SIM_STEP, last.frame + 1)
+            self._update(self._sim_frame)
+            self._accumulator -= self.SIM_STEP
+        
+        return self._accumulator / self.SIM_STEP
+    
+    def _render(self, clock: pygame.Clock, music_name: str, alpha: float = 1.00) -> None:
+        """
+        Draws the current game state on the screen: background, models, debug info and the HUD. Changes no game state.
+        
+        Args:
+            clock (pygame.Clock): The game clock, used for the FPS display.
+            music_name (str): The currently playing song name.
+            alpha (float): Interpolation factor between the last two simulated states, see _step().
+        """
+        # Fill the screen with background image to wipe away anything from last frame
+        self.screen.blit(self.BACKGROUND_IMAGE, (0, 0))
+        
+        # Render all Game models in draw order Daggers -> Players -> Preys
+        for dagger in self.tuple_daggers:
+            dagger.render(self.screen, alpha)
+            
+        for player in self.tuple_players:
+            player.render(self.screen, alpha)
+            
+        for prey in self.tuple_preys:
+            prey.render(self.screen)
+            
+        # Debug functions
+        debug.player(players=self.tuple_players, player_n=0, screen=self.screen)
+        debug.prey(preys=self.tuple_preys, prey_n=0, screen=self.screen)
+        debug.dagger(daggers=self.tuple_daggers, dagger_n=0, screen=self.screen) 
+
+        # FPS Text display
+        other_utils.draw_fps(self.screen, clock, self.FONT_SMALL)
+        
+        # Time elapsed display
+        self.screen.blit(self.FONT_SMALL.render(f"Time elapsed: {self.game_timer.get_formatted_time()}", True, self.WHITE), self._TIMER_POS)
+
+        # Song name display
+        other_utils.draw_music_name(self.screen, music_name, self.FONT_SMALL)
+        
+        # Dash image display
+        # Singleplayer case
+        if self.PLAY_MODE == 0:
+            if self.tuple_players[0].dash_available:
+                self.screen.blit(self._AB.dash_images["AVAIL"], self._DASH_ICO_POS_1)
+            else:
+                self.screen.blit(self._AB.dash_images["UNAVAIL"], self._DASH_ICO_POS_1)
+        # Multiplayer case
+        elif self.PLAY_MODE == 1:
+            # Player 1
+            if self.tuple_players[0].dash_available:
+                self.screen.blit(self._AB.dash_images["AVAIL"], self._DASH_ICO_POS_2)
+            else:
+                self.screen.blit(self._AB.dash_images["UNAVAIL"], self._DASH_ICO_POS_2)
+            # Player 2
+            if self.tuple_players[1].dash_available:
+                self.screen.blit(self._AB.dash_images["AVAIL"], self._DASH_ICO_POS_1)
+            else:
+                self.screen.blit(self._AB.dash_images["UNAVAIL"], self._DASH_ICO_POS_1)
+
+        # Points text display - only for singleplayer
+        if self.PLAY_MODE == 0:
+            points_text = self.FONT.render(f'Points: {self.tuple_players[0].points}', True, self.WHITE)
+            self.screen.blit(points_text, self._POINTS_POS)
+        
+        # Health bar display
+        # Singleplayer case
+        if self.PLAY_MODE == 0:
+            self.health_bar.draw("Health:", self.tuple_players[0].size, self.tuple_players[0].MAX_SIZE, self.tuple_players[0].MIN_SIZE, 
+                            coords=self._HLT_BAR_POS_1)
+        
+        # Multiplayer case
+        elif self.PLAY_MODE == 1:   
+            self.health_bar.draw("Player 1 Health:", 
+                            self.tuple_players[0].size, self.tuple_players[0].MAX_SIZE, self.tuple_players[0].MIN_SIZE, 
+                            coords=self._HLT_BAR_POS_2)
+            self.health_bar.draw("Player 2 Health:", 
+                            self.tuple_players[1].size, self.tuple_players[1].MAX_SIZE, self.tuple_players[1].MIN_SIZE, 
+                            coords=self._HLT_BAR_POS_1)
+
+    def _game_over(self) -> bool:
+        """Returns True if the Game is over - a Player is at or below the minimum size."""
+        return any(player.size <= player.MIN_SIZE for player in self.tuple_players)
+    
+    def simulate(self, max_time: float | None = None) -> GameResult:
+        """
+        Runs a headless game as fast as possible, without rendering, audio or events. \n
+        Every update is one fixed simulation step of simulated time - the game timer is not used. \n
+        Runs until the Game is over or max_time simulated seconds pass. Can be called again to continue the same game. \n
+        The event log is closed once the Game is over.
+        
+        Args:
+            max_time (float | None): Optional simulated time limit in seconds.
+            
+        Returns:
+            GameResult: The simulated time, step count and the Players' final points and sizes.
+        """
+        if not self.HEADLESS:
+            self._LOGGER.error("Method 'simulate' is only available for headless games.")
+            raise RuntimeError("Method 'simulate' is only available for headless games.")
+        
+        if max_time is not None and max_time <= 0:
+            self._LOGGER.error("Invalid simulation time limit.")
+            raise ValueError("Invalid simulation time limit.")
+        
+        # Step the simulation until the Game is over or the time limit is reached
+        sim_step = self.SIM_STEP if self.SIM_RATE else 1 / self._HEADLESS_SIM_RATE
+        frame = self._sim_frame
+        while not self._game_over() and (max_time is None or frame.now < max_time):
+            frame = FrameTime(frame.now + sim_step, sim_step, frame.frame + 1)
+            self._update(frame)
+        self._sim_frame = frame
+        
+        # The log is closed once the Game is over, a game that can continue only writes its buffered events
+        if self.events is not None:
+            if self._game_over():
+                self.events.close()
+            else:
+                self.events.flush()
+        
+        result = self._get_result(frame)
+        self._LOGGER.info(f"Headless game simulated {result.time:.2f}s in {result.steps} steps, points {result.points}, game over {result.game_over}.")
+        return result
+    
+    def _get_result(self, frame: FrameTime) -> GameResult:
+        """Returns the GameResult of the Game after the given simulated frame."""
+        return GameResult(
+            time=frame.now,
+            steps=frame.frame + 1,
+            points=tuple(player.points for player in self.tuple_players),
+            sizes=tuple(player.size for player in self.tuple_players),
+            game_over=self._game_over(),
+            seed=self.SEED
+        )
+    
+    @classmethod
+    def from_replay(cls, replay: Replay, screen: pygame.Surface | None = None,
+                    background_image: pygame.Surface | None = None) -> "CircleNom":
+        """
+        Creates the recorded game of a replay, to be played with run_replay(). \n
+        Headless on an offscreen surface if no screen is given, rendered on the screen otherwise.
+        
+        Args:
+            replay (Replay): The replay to play.
+            screen (pygame.Surface | None): Optional screen to render on. Must be the size of the recorded game's screen.
+            background_image (pygame.Surface | None): Optional background image for rendered replays.
+        """
+        header = replay.header
+        if screen is not None and screen.get_size() != header.screen_size:
+            cls._LOGGER.error(f"Replay screen size {header.screen_size} doesn't match the given screen {screen.get_size()}.")
+            raise ValueError(f"Replay screen size {header.screen_size} doesn't match the given screen {screen.get_size()}.")
+        
+        game = cls(
+            screen=screen if screen is not None else pygame.Surface(header.screen_size),
+            fps_cap=0, difficulty=header.difficulty, play_mode=header.play_mode, player_accessory=None,
+            background_image=background_image if background_image else cls._AB.background_images[0],
+            sim_rate=header.sim_rate, headless=screen is None, prey_cd=header.prey_cd, dagger_cd=header.dagger_cd,
+            seed=header.seed, easter_mode=header.easter_mode, prey_count=header.prey_count, dagger_count=header.dagger_count,
+            stress=header.stress, record_replay=True
+        )
+        game._source_replay = replay
+        return game
+    
+    def run_replay(self) -> GameResult:
+        """
+        Plays the replay the game was created from with from_replay() as fast as possible. \n
+        Every recorded step is simulated again with its recorded frame and keys, rendered games also draw every step. \n
+        The game is recorded again while playing, so self.replay can be compared against the source replay.
+        
+        Returns:
+            GameResult: The replayed game's result.
+        """
+        replay = getattr(self, "_source_replay", None)
+        if replay is None:
+            self._LOGGER.error("Method 'run_replay' is only available for games created with from_replay().")
+            raise RuntimeError("Method 'run_replay' is only available for games created with from_replay().")
+        
+        # Input source returns the keys of the step being simulated
+        keys = None
+        self._input_source = lambda game, frame: keys
+        clock = pygame.time.Clock()
+        music_name = ""
+        frame = self._sim_frame
+        
+        for frame, keys, events in replay.steps():
+            
+            # A correct replay ends on its last step, an earlier Game over means it went out of sync
+            if self._game_over():
+                self._LOGGER.warning(f"Replay out of sync, the game ended at step {frame.frame} of {replay.step_count}.")
+                break
+            
+            # Pause events only affected the recorded time, music is only played when rendering - both are recorded again
+            for event, value in events:
+                if event == Replay.MUSIC and not self.HEADLESS:
+                    music_name = self._music_player(value)
+                else:
+                    self.replay.record_event(event, value)
+            
+            self._update(frame)
+            
+            # Rendered replays - draw every step and allow quitting
+            if not self.HEADLESS:
+                if any(event.type == pygame.QUIT or (event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE)
+                       for event in pygame.event.get()):
+                    break
+                self._render(clock, music_name)
+                pygame.display.flip()
+                clock.tick()
+                
+        if not self.HEADLESS:
+            pygame.mixer.music.fadeout(1000)
+        if self.events is not None:
+            self.events.close()
+        
+        result = self._get_result(frame)
+        self._LOGGER.info(f"Replay played {result.time:.2f}s in {result.steps} steps, points {result.points}, game over {result.game_over}.")
+        return result
+
+    def start(self, replay_path: str | None = None) -> None:
+        """
+        Starts the Circle Nom game.
+        
+        Args:
+            replay_path (str | None): Optional path to save the game's replay to when it ends. \n
+                If None and replay recording is enabled in the config, the replay is saved in the 'replays' folder.
+        """
+        if self.HEADLESS:
+            self._LOGGER.error("Headless games can't be started, use simulate() instead.")
+            raise RuntimeError("Headless games can't be started, use simulate() instead.")
+        
+        # A replay saved when the game ends is recorded from its first step
+        if replay_path and isinstance(self.replay, NullReplay):
+            self.replay = Replay(self.replay.header)
+        
         # Play random theme song from the game themes
-        song_index = random.randint(0, len(self._AB.game_themes) - 1)
+        song_index = self.fx_rng.randint(0, len(self._AB.game_themes) - 1)
         music_name = self._music_player(song_index)
 
-        # Delta time from last game frame
-        dt = 0.00
-        
-        # Pygame clock - used for limiting the FPS and calculating dt
+        # Pygame clock - used for limiting the FPS
         clock = pygame.time.Clock()
         
         # Pause - Skips over game loop, excluding event checker and pause screen
@@ -286,6 +867,9 @@ class CircleNom():
         # Running - Keeps the entire game loop running
         running = True
         
+        # Interpolation factor of the last simulated frame - kept for the pause screen
+        alpha = 1.00
+        
         # Start game_timer before entering game loop
         self.game_timer.start()
         
@@ -295,6 +879,9 @@ class CircleNom():
         # ------------------------------------------------------------------------------------------------
         # MAIN LOOP - HOUSES THE EVENT CHECKER, GAME LOOP, PAUSE AND GAME OVER SCREENS
         while running:
+            
+            # Sample the game timer once - every model sees the same time and delta time this frame
+            frame = self.game_timer.snapshot()
 
             # --------------------------------------------------------------------------------------------
             # EVENT CHECKER - MUST ALWAYS RUN
@@ -302,6 +889,8 @@ class CircleNom():
                     
                 # Quit Window / Alt + F4
                 if event.type == pygame.QUIT:
+                    if self.events is not None:
+                        self.events.close()
                     pygame.quit()
                     sys.exit()
 
@@ -324,9 +913,11 @@ class CircleNom():
                         if paused:
                             self.game_timer.stop()
                             pygame.mixer.music.pause()
+                            self.replay.record_event(Replay.PAUSE)
                         else:
                             self.game_timer.start()
                             pygame.mixer.music.unpause()
+                            self.replay.record_event(Replay.UNPAUSE)
 
                     # Music changer - works only when game is not paused
                     if not paused:
@@ -345,111 +936,13 @@ class CircleNom():
             # GAME LOOP - CAN BE PAUSED
             if not paused:
                 
-                # Fill the screen with background image to wipe away anything from last frame
-                self.screen.blit(self.BACKGROUND_IMAGE, (0, 0))
+                # Simulate every game model first, then render the resulting state
+                alpha = self._step(frame)
+                self._render(clock, music_name, alpha)
                 
-                # Process all Game models in draw order Daggers -> Players -> Preys
-                for dagger in self.tuple_daggers:
-                    dagger.draw(dt)
-                    
-                    # Play sound if its on screen
-                    if 0 <= dagger.position.x <= self.screen.width and \
-                        0 <= dagger.position.y <= self.screen.height:
-                        dagger.play_sound()
-                        
-                for player in self.tuple_players:
-                    player.draw(dt)
-                    
-                    # Reduce Player size and speed
-                    player.size -= player_utils.get_size_reduct(player, dt)  
-                    player.speed -= 5 * dt
-                    
-                for prey in self.tuple_preys:
-                    prey.draw(dt)
-                    
-                # Run the other methods required
-                self._try_eat_prey()
-                self._try_hit_dagger()
-                    
-                # After all model processing is done check if the Game is over (Player is < the minimum size)
-                if player.size <= player.MIN_SIZE:
+                # After all model processing is done check if the Game is over (a Player is < the minimum size)
+                if self._game_over():
                     running = False
-                        
-                # Debug functions
-                debug.player(players=self.tuple_players, player_n=0, screen=self.screen)
-                debug.prey(preys=self.tuple_preys, prey_n=0, screen=self.screen)
-                debug.dagger(daggers=self.tuple_daggers, dagger_n=0, screen=self.screen) 
-
-                # FPS Text display
-                other_utils.draw_fps(self.screen, clock, self.FONT_SMALL)
-                
-                # Time elapsed display
-                self.screen.blit(self.FONT_SMALL.render(f"Time elapsed: {self.game_timer.get_formatted_time()}", True, self.WHITE), self._TIMER_POS)
-
-                # Song name display
-                other_utils.draw_music_name(self.screen, music_name, self.FONT_SMALL)
-                
-                # Dash image display
-                # Singleplayer case
-                if self.PLAY_MODE == 0:
-                    if self.tuple_players[0].dash_available:
-                        self.screen.blit(self._AB.dash_images["AVAIL"], self._DASH_ICO_POS_1)
-                    else:
-                        self.screen.blit(self._AB.dash_images["UNAVAIL"], self._DASH_ICO_POS_1)
-                # Multiplayer case
-                elif self.PLAY_MODE == 1:
-                    # Player 1
-                    if self.tuple_players[0].dash_available:
-                        self.screen.blit(self._AB.dash_images["AVAIL"], self._DASH_ICO_POS_2)
-                    else:
-                        self.screen.blit(self._AB.dash_images["UNAVAIL"], self._DASH_ICO_POS_2)
-                    # Player 2
-                    if self.tuple_players[1].dash_available:
-                        self.screen.blit(self._AB.dash_images["AVAIL"], self._DASH_ICO_POS_1)
-                    else:
-                        self.screen.blit(self._AB.dash_images["UNAVAIL"], self._DASH_ICO_POS_1)
-
-                # Points text display - only for singleplayer
-                if self.PLAY_MODE == 0:
-                    points_text = self.FONT.render(f'Points: {self.tuple_players[0].points}', True, self.WHITE)
-                    self.screen.blit(points_text, self._POINTS_POS)
-                
-                # Health bar display
-                # Singleplayer case
-                if self.PLAY_MODE == 0:
-                    self.health_bar.draw("Health:", self.tuple_players[0].size, self.tuple_players[0].MAX_SIZE, self.tuple_players[0].MIN_SIZE, 
-                                    coords=self._HLT_BAR_POS_1)
-                
-                # Multiplayer case
-                elif self.PLAY_MODE == 1:   
-                    self.health_bar.draw("Player 1 Health:", 
-                                    self.tuple_players[0].size, self.tuple_players[0].MAX_SIZE, self.tuple_players[0].MIN_SIZE, 
-                                    coords=self._HLT_BAR_POS_2)
-                    self.health_bar.draw("Player 2 Health:", 
-                                    self.tuple_players[1].size, self.tuple_players[1].MAX_SIZE, self.tuple_players[1].MIN_SIZE, 
-                                    coords=self._HLT_BAR_POS_1)
-
-                # Controls for Player/s
-                # Singleplayer case
-                if self.PLAY_MODE == 0:
-                    
-                    # Enable both control options for singleplayer since we have only one player
-                    player_utils.control_movement(self.tuple_players[0], dt, arrows=True, wasd=True)
-                    player_utils.check_bounds(self.screen, self.tuple_players[0]) # Keeps player in screen area
-                
-                # Multiplayer case
-                elif self.PLAY_MODE == 1:
-                    
-                    # Player 1 gets only WASD controls
-                    player_utils.control_movement(player=self.tuple_players[0], dt=dt, arrows=False, wasd=True)
-                    player_utils.check_bounds(screen=self.screen, player=self.tuple_players[0])
-                    
-                    # Player 2 gets ARROWS controls
-                    player_utils.control_movement(player=self.tuple_players[1], dt=dt, arrows=True, wasd=False)
-                    player_utils.check_bounds(screen=self.screen, player=self.tuple_players[1])
-                    
-                    # This checks if both players are near eachother and pushes them appart if they are
-                    player_utils.check_collision(player_1=self.tuple_players[0], player_2=self.tuple_players[1], dt=dt)
                     
             # -------------------------------------------------------------------------------------------- 
             # PAUSE SCREEN
@@ -457,7 +950,7 @@ class CircleNom():
                 
                 # Background and Player/s
                 self.screen.blit(self.BACKGROUND_IMAGE, (0, 0))
-                for player in self.tuple_players: player.draw(dt)
+                for player in self.tuple_players: player.render(self.screen, alpha)
 
                 # Game paused text
                 paused_text = self.FONT_BIG.render('Game Paused', True, self.WHITE)
@@ -472,8 +965,8 @@ class CircleNom():
             # flip() the display to put work on screen
             pygame.display.flip()
 
-            # Limit FPS to cap. Set delta time.
-            dt = clock.tick(self.FPS_CAP) / 1000
+            # Limit FPS to cap
+            clock.tick(self.FPS_CAP)
 
         # --------------------------------------------------------------------------------------------
         # GAME OVER SCREEN
@@ -486,7 +979,7 @@ class CircleNom():
         if self.PLAY_MODE == 0:
 
             # Draw dead player
-            self.tuple_players[0].draw_dead()
+            self.tuple_players[0].render_dead(self.screen)
 
             # Game over text
             game_over = self.FONT_BIG.render('Game Over!', True, self.WHITE)
@@ -503,16 +996,16 @@ class CircleNom():
             
             # Case if Player 1 died first (his size is < than the minumum)
             if self.tuple_players[0].size <= self.tuple_players[0].MIN_SIZE:
-                self.tuple_players[0].draw_dead()
-                self.tuple_players[1].draw(dt)
+                self.tuple_players[0].render_dead(self.screen)
+                self.tuple_players[1].render(self.screen)
                 game_over = self.FONT_BIG.render('Player 1 Lost!', True, self.WHITE)
                 game_over_rect = game_over.get_rect(center=(self.screen.width / 2, self.screen.height / 2 - 30))
                 self.screen.blit(game_over, game_over_rect)
                 
             # Case if Player 2 died first (his size is < than the minumum)
             elif self.tuple_players[1].size <= self.tuple_players[1].MIN_SIZE:
-                self.tuple_players[0].draw(dt)
-                self.tuple_players[1].draw_dead()
+                self.tuple_players[0].render(self.screen)
+                self.tuple_players[1].render_dead(self.screen)
                 game_over = self.FONT_BIG.render('Player 2 Lost!', True, self.WHITE)
                 game_over_rect = game_over.get_rect(center=(self.screen.width / 2, self.screen.height / 2 - 30))
                 self.screen.blit(game_over, game_over_rect)
@@ -523,7 +1016,7 @@ class CircleNom():
                 game_over = self.FONT_BIG.render('Draw!', True, self.WHITE)
                 game_over_rect = game_over.get_rect(center=(self.screen.width / 2, self.screen.height / 2 - 30))
                 self.screen.blit(game_over, game_over_rect)
-                for player in self.tuple_players: player.draw_dead()
+                for player in self.tuple_players: player.render_dead(self.screen)
                 
         # Draw time survived text for both singleplayer and multiplayer cases
         time_survived = self.FONT.render(f'Time survived: {self.game_timer.get_formatted_time()}', True, self.WHITE)
@@ -537,7 +1030,17 @@ class CircleNom():
         time.sleep(3)
         
         # Log the game end
-        self._LOGGER.info(f"Circle Nom game ended. Total in-game time {self.game_timer.get_time():.2f}s, final score {player.points}.")
+        self._LOGGER.info(f"Circle Nom game ended. Total in-game time {self.game_timer.get_time():.2f}s, final score {self.tuple_players[0].points}.")
+        
+        # Save the game's replay if asked to
+        if replay_path is None and ConfigReader.get_record_replays():
+            replay_path = f"{os.getcwd()}/replays/{datetime.now().strftime('%Y-%m-%d_%H-%M-%S')}.cnr"
+        if replay_path:
+            self.replay.save(replay_path)
+        
+        # Write the rest of the game's event log
+        if self.events is not None:
+            self.events.close()
         
         # Reset the game_timer object before returning to caller
         self.game_timer.reset()
@@ -1,11 +1,104 @@
 from circle_nom.systems.asset_loader import AssetLoader
+from circle_nom.systems.sprite_cache import TextureAtlas, prerotate
 from circle_nom.systems.logging import get_logger
+from typing import Any, Callable, Iterable, Sequence
+from functools import partial
 import pygame
 
+class LazyTuple(Sequence):
+    
+    def __init__(self, loaders: tuple[Callable[[], Any], ...],
+                 load_many: Callable[[tuple[int, ...]], tuple[Any, ...]] | None = None) -> None:
+        """
+        Read-only sequence whose items are loaded on their first access and kept, \n
+        for asset groups where only a few items are used at a time (like the backgrounds).
+        
+        Args:
+            loaders (tuple[Callable, ...]): Loads the item at the same index.
+            load_many (Callable | None): Optionally loads the items at the given indexes at once, used by load_rest().
+        """
+        self._loaders = loaders
+        self._load_many = load_many
+        self._items: dict[int, Any] = {}
+    
+    @property
+    def loaded(self) -> int:
+        """Number of items loaded so far."""
+        return len(self._items)
+    
+    def __len__(self) -> int:
+        return len(self._loaders)
+    
+    def __getitem__(self, idx: int | slice) -> Any:
+        if isinstance(idx, slice):
+            return tuple(self[i] for i in range(*idx.indices(len(self))))
+        idx = range(len(self))[idx]
+        if idx not in self._items:
+            self._items[idx] = self._loaders[idx]()
+        return self._items[idx]
+    
+    def load_next(self) -> bool:
+        """
+        Load the first item not loaded yet.
+        
+        Returns:
+            bool: False if every item was already loaded.
+        """
+        for idx in range(len(self)):
+            if idx not in self._items:
+                self[idx]
+                return True
+        return False
+    
+    def load_rest(self) -> None:
+        """Load every item not loaded yet, all at once if the sequence has a load_many."""
+        missing = tuple(idx for idx in range(len(self)) if idx not in self._items)
+        if self._load_many is not None and len(missing) > 1:
+            self._items.update(zip(missing, self._load_many(missing)))
+        for idx in missing:
+            self[idx]
+
+class LazyAsset:
+    
+    def __init__(self, group: str, sounds: bool = False) -> None:
+        """
+        Decorator turning an AssetBank load method into a read-only property, loaded on its first access and kept. \n
+        The method's name is the asset's name, its docstring is the property's.
+        
+        Args:
+            group (str): The preload group of the asset, see AssetBank.preload().
+            sounds (bool): The asset is a tuple or dict of sounds, kept at the bank's sound volume.
+        """
+        self._group = group
+        self.sounds = sounds
+    
+    def __call__(self, load: Callable[["AssetBank"], Any]) -> "LazyAsset":
+        self._load = load
+        self.__doc__ = load.__doc__
+        return self
+    
+    def __set_name__(self, owner: type, name: str) -> None:
+        self._name = name
+        owner._GROUPS.setdefault(self._group, []).append(name)
+    
+    def __get__(self, obj: Any, objtype: type | None = None) -> Any:
+        if obj is None:
+            return self
+        assets = obj._ASSETS
+        if self._name not in assets:
+            assets[self._name] = self._load(obj)
+            if self.sounds:
+                obj._apply_volume(assets[self._name])
+        return assets[self._name]
+    
+    def __set__(self, obj: Any, value: Any) -> None:
+        raise AttributeError(f"Asset '{self._name}' is read-only.")
+
 class AssetBank:
     """
     Initializes the AssetBank, containing all assets of the game, which are READ-ONLY. \n
-    Use the property methods of AssetBank to access them.
+    Use the property methods of AssetBank to access them. Every asset is loaded on its first access, \n
+    preload() loads them ahead of time - whole groups at once, or a few per frame behind a running loop.
     """
     # Asset loader
     _AL = AssetLoader()
@@ -13,164 +106,325 @@ class AssetBank:
     # Loggger reference
     _LOGGER = get_logger(name=__name__)
     
-    # Assets
-    _ICON = _AL.load_image('assets/images/icon/icon.ico')
-    _PLAYER_EAT_SOUNDS = _AL.load_sounds(_AL.traverse_folder('assets/sounds/effects/player/eat/'), 6)
-    _GAME_THEMES = _AL.load_playlist(_AL.traverse_folder('assets/sounds/themes/in_game/'), 16)
-    _PLAYER_IMAGE = _AL.load_image('assets/images/player/alive/player_alive_image.png')
-    _PLAYER_IMAGE_DEAD = _AL.load_image('assets/images/player/dead/player_dead_image.png')
-    _PLAYER_EAT_SEQUENCE = _AL.load_images(_AL.traverse_folder('assets/images/player/eat_sequence/'), 10)
-    _PLAYER_ACCESSORIES = (
-        # const XY offset from player topleft, pygame image pairs
-        (pygame.Vector2(x=90, y=70), _AL.load_image('assets/images/player/accessories/glasses.png')),
-        (pygame.Vector2(x=90, y=3), _AL.load_image('assets/images/player/accessories/fedora.png')),
-        (pygame.Vector2(x=90, y=-8), _AL.load_image('assets/images/player/accessories/propeller_hat.png')),
-        (pygame.Vector2(x=90, y=70), _AL.load_image('assets/images/player/accessories/3d_glasses.png')),
-        (pygame.Vector2(x=88, y=100), _AL.load_image('assets/images/player/accessories/blonde_wig.png')),
-        (pygame.Vector2(x=110, y=88), _AL.load_image('assets/images/player/accessories/moustache_n_monacle.png')),
-    )
-    _PREY_IMAGES = _AL.load_images(_AL.traverse_folder('assets/images/prey/alive/'), 11)
-    _PREY_AURA = _AL.load_image('assets/images/prey/aura/prey_aura_image.png')
-    _BACKGROUND_IMAGES = _AL.load_images(_AL.traverse_folder('assets/images/backgrounds/'), 10)
-    _HEALTH_BAR = {
-        "OUTER": _AL.load_image('assets/images/health_bar/bar_outer_image.png'),
-        "INNER": _AL.load_image('assets/images/health_bar/bar_inner_image.png')
-    }
-    _DAGGER_IMAGES = _AL.load_images(_AL.traverse_folder('assets/images/dagger/'), 7)
-    _DAGGER_SOUNDS = _AL.load_sounds(_AL.traverse_folder('assets/sounds/effects/dagger/fly'), 5)
-    _PLAYER_HIT_SOUNDS = _AL.load_sounds(_AL.traverse_folder('assets/sounds/effects/player/hit/'), 5)
-    _PLAYER_AURA = _AL.load_image('assets/images/player/aura/player_aura_image.png')
-    _MENU_THEMES = _AL.load_playlist(_AL.traverse_folder('assets/sounds/themes/menu/'), 2)
-    _MENU_CLICK_SOUNDS = {
-        "UPDOWN": _AL.load_sound('assets/sounds/effects/menu/menu_click_up_down.ogg'),
-        "LEFTRIGHT": _AL.load_sound('assets/sounds/effects/menu/menu_click_left_right.ogg'),
-        "UNKNOWN": _AL.load_sound('assets/sounds/effects/menu/menu_click_unknown.ogg')
-    }
-    _DASH_IMAGES = {
-        "AVAIL": _AL.load_image('assets/images/player/dash/dash_available_image.png'),
-        "UNAVAIL": _AL.load_image('assets/images/player/dash/dash_unavailable_image.png')
-    }
-    _DASH_SOUNDS = _AL.load_sounds(_AL.traverse_folder('assets/sounds/effects/player/dash/'), 4)
-    _FLAME_SEQUENCE = _AL.load_images(_AL.traverse_folder('assets/images/flame_sequence'), 6)
-    _CURSOR = _AL.load_image('assets/images/cursor/cursor_image.png')
-    _COMIC_SANS_MS = _AL.resource_path("assets/fonts/comic_sans_ms.ttf")
-    
-    # Check if all assets are loaded and log it - current file target count is 102
+    # Preload groups - the Menu's assets, and the ones only the game needs (loaded behind the Menu)
+    MENU = "menu"
+    GAME = "game"
+    
+    # Loaded assets by name, and the asset names of every preload group - shared by every AssetBank
+    _ASSETS: dict[str, Any] = {}
+    _GROUPS: dict[str, list[str]] = {}
+    
+    # Volume of every sound asset, applied to the ones loaded later too - None keeps the pygame default
+    _SOUND_VOLUME: float | None = None
+    
+    # Pre-rotated dagger images and flame frames - daggers only fly at these angles
+    _DAGGER_ANGLES = 0, 90, 180, 270
+    
+    # Largest texture atlas page width and height in pixels
+    _ATLAS_PAGE_SIZE = 2048
+    
+    # Asset file target count, checked once every asset is loaded
     _TOTAL_ASSETS_TRGT = 101
-    if _AL.total_assets_loaded == _TOTAL_ASSETS_TRGT:
-        _LOGGER.info(f"All {_TOTAL_ASSETS_TRGT} assets successfully loaded.")
-    elif _AL.total_assets_loaded < _TOTAL_ASSETS_TRGT:
-        _LOGGER.warning(f"{_TOTAL_ASSETS_TRGT - _AL.total_assets_loaded} assets could not be loaded, out of {_TOTAL_ASSETS_TRGT}.")
-    else:
-        _LOGGER.warning(f"Loaded {_AL.total_assets_loaded} assets, {_AL.total_assets_loaded - _TOTAL_ASSETS_TRGT} more than the target of {_TOTAL_ASSETS_TRGT}.")
+    _total_checked = False
+    
+    def _lazy_images(self, path: str, count: int) -> LazyTuple:
+        """
+        Lazily loaded images of a folder, like AssetLoader.load_images(). Placeholders are added if there are less than count.
+        
+        Args:
+            path (str): The folder's path.
+            count (int): Expected image count.
+        """
+        paths = self._AL.traverse_folder(path)
+        if count > len(paths):
+            self._LOGGER.warning(f"Image files count lower than expected! Adding {count - len(paths)} placeholder/s.")
+            paths += self._AL.add_placeholders(count - len(paths), 'IMAGE')
+        elif count < len(paths):
+            self._LOGGER.warning(f"Image files count higher than expected: {len(paths)} / {count}!")
+        return LazyTuple(
+            tuple(partial(self._AL.load_image, path) for path in paths),
+            load_many=lambda idxs: self._AL.load_images(tuple(paths[idx] for idx in idxs))
+        )
+    
+    @classmethod
+    def _apply_volume(cls, sounds: tuple[pygame.Sound, ...] | dict[str, pygame.Sound]) -> None:
+        """Set the bank's sound volume on the given sounds, if it was set."""
+        if cls._SOUND_VOLUME is None:
+            return
+        for sound in (sounds.values() if isinstance(sounds, dict) else sounds):
+            sound.set_volume(cls._SOUND_VOLUME)
+    
+    @classmethod
+    def set_sound_volume(cls, volume: float) -> None:
+        """
+        Set the volume of every sound asset, including the ones not loaded yet.
+        
+        Args:
+            volume (float): The volume, 0.0 to 1.0.
+        """
+        cls._SOUND_VOLUME = volume
+        for name, asset in cls._ASSETS.items():
+            if getattr(cls, name).sounds:
+                cls._apply_volume(asset)
+    
+    @classmethod
+    def preload(cls, groups: Iterable[str] = (MENU, GAME), limit: int | None = None) -> bool:
+        """
+        Load the assets of the given groups ahead of their first access. \n
+        With a limit, at most that many assets (single images of the lazily loaded sequences count on their own) \n
+        are loaded per call - call it once per frame to load the groups behind a running loop.
+        
+        Args:
+            groups (Iterable[str]): The preload groups, see the group consts. Every group if not given.
+            limit (int | None): Optional maximum count of assets loaded by this call.
         
+        Returns:
+            bool: True if every asset of the groups is loaded.
+        """
+        bank = cls()
+        loaded = 0
+        for group in groups:
+            if group not in cls._GROUPS:
+                cls._LOGGER.error(f"Invalid asset group '{group}'.")
+                raise ValueError(f"Invalid asset group '{group}'.")
+            
+            for name in cls._GROUPS[group]:
+                if name not in cls._ASSETS:
+                    if limit is not None and loaded >= limit:
+                        return False
+                    getattr(bank, name)
+                    loaded += 1
+                
+                # Lazily loaded sequences load their items all at once, or one by one with a limit
+                asset = cls._ASSETS[name]
+                if isinstance(asset, LazyTuple) and limit is None:
+                    loaded += len(asset) - asset.loaded
+                    asset.load_rest()
+                while isinstance(asset, LazyTuple) and asset.loaded < len(asset):
+                    if limit is not None and loaded >= limit:
+                        return False
+                    asset.load_next()
+                    loaded += 1
+        
+        if loaded:
+            cls._check_total()
+        return True
+    
+    @classmethod
+    def _check_total(cls) -> None:
+        """Check if all assets are loaded and log it, once every asset of every group is. Saves the asset cache then."""
+        if cls._total_checked:
+            return
+        for names in cls._GROUPS.values():
+            for name in names:
+                asset = cls._ASSETS.get(name)
+                if asset is None or (isinstance(asset, LazyTuple) and asset.loaded < len(asset)):
+                    return
+        cls._total_checked = True
+        
+        # Current file target count is 101
+        total = cls._AL.total_assets_loaded
+        if total == cls._TOTAL_ASSETS_TRGT:
+            cls._LOGGER.info(f"All {cls._TOTAL_ASSETS_TRGT} assets successfully loaded.")
+        elif total < cls._TOTAL_ASSETS_TRGT:
+            cls._LOGGER.warning(f"{cls._TOTAL_ASSETS_TRGT - total} assets could not be loaded, out of {cls._TOTAL_ASSETS_TRGT}.")
+        else:
+            cls._LOGGER.warning(f"Loaded {total} assets, {total - cls._TOTAL_ASSETS_TRGT} more than the target of {cls._TOTAL_ASSETS_TRGT}.")
+        cls._AL.save_cache()
+    
     # Asset properties
-    @property
+    @LazyAsset(MENU)
     def icon(self) -> pygame.Surface:
         """Game icon (pygame.Surface). Used for window icon."""
-        return self._ICON
-
-    @property
+        return self._AL.load_image('assets/images/icon/icon.ico')
+    
+    @LazyAsset(GAME, sounds=True)
     def player_eat_sounds(self) -> tuple[pygame.Sound]:
         """Player eating sounds."""
-        return self._PLAYER_EAT_SOUNDS
-
-    @property
+        return self._AL.load_sounds(self._AL.traverse_folder('assets/sounds/effects/player/eat/'), 6)
+    
+    @LazyAsset(GAME)
     def game_themes(self) -> tuple[tuple[str, str], ...]:
         """Playlist of in-game themes as tuples containing the path of the theme and its name."""
-        return self._GAME_THEMES
-
-    @property
+        return self._AL.load_playlist(self._AL.traverse_folder('assets/sounds/themes/in_game/'), 16)
+    
+    @LazyAsset(MENU)
     def player_image(self) -> pygame.Surface:
         """Player image when alive."""
-        return self._PLAYER_IMAGE
-
-    @property
+        return self._AL.load_image('assets/images/player/alive/player_alive_image.png')
+    
+    @LazyAsset(GAME)
     def player_image_dead(self) -> pygame.Surface:
         """Player image when dead."""
-        return self._PLAYER_IMAGE_DEAD
-
-    @property
+        return self._AL.load_image('assets/images/player/dead/player_dead_image.png')
+    
+    # Texture atlas images - decoded on their own first, one image per preload step, so only the packing is left to the atlas
+    @LazyAsset(GAME)
+    def _atlas_prey_images(self) -> LazyTuple:
+        """Source Prey images of the sprite atlas."""
+        return self._lazy_images('assets/images/prey/alive/', 11)
+    
+    @LazyAsset(GAME)
+    def _atlas_eat_sequence(self) -> LazyTuple:
+        """Source eat sequence of the sprite atlas."""
+        return self._lazy_images('assets/images/player/eat_sequence/', 10)
+    
+    @LazyAsset(GAME)
+    def _atlas_dagger_images(self) -> LazyTuple:
+        """Source Dagger images of the sprite atlas, before their rotation."""
+        return self._lazy_images('assets/images/dagger/', 7)
+    
+    @LazyAsset(GAME)
+    def _atlas_flame_sequence(self) -> LazyTuple:
+        """Source flame frames of the sprite atlas, before their rotation."""
+        return self._lazy_images('assets/images/flame_sequence', 6)
+    
+    @LazyAsset(GAME)
+    def _atlas_dash_images(self) -> LazyTuple:
+        """Source dash icons of the sprite atlas - available, then unavailable."""
+        return LazyTuple((
+            partial(self._AL.load_image, 'assets/images/player/dash/dash_available_image.png'),
+            partial(self._AL.load_image, 'assets/images/player/dash/dash_unavailable_image.png')
+        ))
+    
+    @LazyAsset(GAME)
+    def _atlas_health_bar(self) -> LazyTuple:
+        """Source health bar images of the sprite atlas - outer, then inner."""
+        return LazyTuple((
+            partial(self._AL.load_image, 'assets/images/health_bar/bar_outer_image.png'),
+            partial(self._AL.load_image, 'assets/images/health_bar/bar_inner_image.png')
+        ))
+    
+    @LazyAsset(GAME)
+    def sprite_atlas(self) -> TextureAtlas:
+        """
+        Texture atlas of the small sprites drawn every frame - Prey images, Dagger images and flame frames pre-rotated \n
+        to every dagger angle, the eat sequence, dash icons and health bar. Those assets are subsurfaces of its pages. \n
+        Its source images are separate assets, preloaded before it.
+        """
+        sources = {
+            "prey": self._atlas_prey_images,
+            "eat_sequence": self._atlas_eat_sequence,
+            "dagger": self._atlas_dagger_images,
+            "flame": self._atlas_flame_sequence,
+            "dash": self._atlas_dash_images,
+            "health_bar": self._atlas_health_bar
+        }
+        for images in sources.values():
+            images.load_rest()
+        images = {name: tuple(images) for name, images in sources.items()}
+        
+        daggers = prerotate(images.pop("dagger"), self._DAGGER_ANGLES)
+        flames = prerotate(images.pop("flame"), self._DAGGER_ANGLES)
+        return TextureAtlas({
+            **images,
+            **{f"dagger_{angle}": images for angle, images in daggers.items()},
+            **{f"flame_{angle}": images for angle, images in flames.items()}
+        }, self._ATLAS_PAGE_SIZE)
+    
+    @LazyAsset(GAME)
     def player_eat_sequence(self) -> tuple[pygame.Surface, ...]:
         """Sequence of images for the player's eating animation."""
-        return self._PLAYER_EAT_SEQUENCE
-
-    @property
+        return self.sprite_atlas["eat_sequence"]
+    
+    @LazyAsset(MENU)
     def player_accessories(self) -> tuple[tuple[pygame.Vector2, pygame.Surface], ...]:
         """Player accessories as tuples containing an offset used for allignment with the player and the accessory image"""
-        return self._PLAYER_ACCESSORIES
-
-    @property
+        return (
+            # const XY offset from player topleft, pygame image pairs
+            (pygame.Vector2(x=90, y=70), self._AL.load_image('assets/images/player/accessories/glasses.png')),
+            (pygame.Vector2(x=90, y=3), self._AL.load_image('assets/images/player/accessories/fedora.png')),
+            (pygame.Vector2(x=90, y=-8), self._AL.load_image('assets/images/player/accessories/propeller_hat.png')),
+            (pygame.Vector2(x=90, y=70), self._AL.load_image('assets/images/player/accessories/3d_glasses.png')),
+            (pygame.Vector2(x=88, y=100), self._AL.load_image('assets/images/player/accessories/blonde_wig.png')),
+            (pygame.Vector2(x=110, y=88), self._AL.load_image('assets/images/player/accessories/moustache_n_monacle.png')),
+        )
+    
+    @LazyAsset(GAME)
     def prey_images(self) -> tuple[pygame.Surface, ...]:
         """Prey images."""
-        return self._PREY_IMAGES
-
-    @property
+        return self.sprite_atlas["prey"]
+    
+    @LazyAsset(GAME)
     def prey_aura(self) -> pygame.Surface:
         """Prey aura image."""
-        return self._PREY_AURA
-
-    @property
-    def background_images(self) -> tuple[pygame.Surface, ...]:
-        """Background images."""
-        return self._BACKGROUND_IMAGES
-
-    @property
+        return self._AL.load_image('assets/images/prey/aura/prey_aura_image.png')
+    
+    @LazyAsset(GAME)
+    def background_images(self) -> LazyTuple:
+        """Background images. Every image is loaded on its own first access."""
+        return self._lazy_images('assets/images/backgrounds/', 10)
+    
+    @LazyAsset(GAME)
     def health_bar(self) -> dict[str, pygame.Surface]:
         """Dictionary with health bar images, keys: 'OUTER' and 'INNER'."""
-        return self._HEALTH_BAR
-
-    @property
+        return dict(zip(("OUTER", "INNER"), self.sprite_atlas["health_bar"]))
+    
+    @LazyAsset(GAME)
     def dagger_images(self) -> tuple[pygame.Surface, ...]:
         """Dagger images."""
-        return self._DAGGER_IMAGES
-
-    @property
+        return self.sprite_atlas["dagger_0"]
+    
+    @LazyAsset(GAME, sounds=True)
     def dagger_sounds(self) -> tuple[pygame.Sound, ...]:
         """Daggers flying sounds."""
-        return self._DAGGER_SOUNDS
-
-    @property
+        return self._AL.load_sounds(self._AL.traverse_folder('assets/sounds/effects/dagger/fly'), 5)
+    
+    @LazyAsset(GAME, sounds=True)
     def player_hit_sounds(self) -> tuple[pygame.Sound, ...]:
         """Player sounds when hit by a dagger"""
-        return self._PLAYER_HIT_SOUNDS
-
-    @property
+        return self._AL.load_sounds(self._AL.traverse_folder('assets/sounds/effects/player/hit/'), 5)
+    
+    @LazyAsset(MENU)
     def player_aura(self) -> pygame.Surface:
         """Player aura image."""
-        return self._PLAYER_AURA
-
-    @property
+        return self._AL.load_image('assets/images/player/aura/player_aura_image.png')
+    
+    @LazyAsset(MENU)
     def menu_themes(self) -> tuple[tuple[str, str], ...]:
         """Playlist of menu themes as tuples containing the path of the theme and its name."""
-        return self._MENU_THEMES
-
-    @property
+        return self._AL.load_playlist(self._AL.traverse_folder('assets/sounds/themes/menu/'), 2)
+    
+    @LazyAsset(MENU, sounds=True)
     def menu_click_sounds(self) -> dict[str, pygame.Sound]:
         """Dictionary of menu click sounds. Keys: 'UPDOWN', 'LEFTRIGHT', 'UNKNOWN'."""
-        return self._MENU_CLICK_SOUNDS
-
-    @property
+        return {
+            "UPDOWN": self._AL.load_sound('assets/sounds/effects/menu/menu_click_up_down.ogg'),
+            "LEFTRIGHT": self._AL.load_sound('assets/sounds/effects/menu/menu_click_left_right.ogg'),
+            "UNKNOWN": self._AL.load_sound('assets/sounds/effects/menu/menu_click_unknown.ogg')
+        }
+    
+    @LazyAsset(GAME)
     def dash_images(self) -> dict[str, pygame.Surface]:
         """Images representing dash availability. Keys: 'AVAIL', 'UNAVAIL'."""
-        return self._DASH_IMAGES
-
-    @property
+        return dict(zip(("AVAIL", "UNAVAIL"), self.sprite_atlas["dash"]))
+    
+    @LazyAsset(GAME, sounds=True)
     def dash_sounds(self) -> tuple[pygame.Sound]:
         """Player sounds when dashing."""
-        return self._DASH_SOUNDS
-
-    @property
+        return self._AL.load_sounds(self._AL.traverse_folder('assets/sounds/effects/player/dash/'), 4)
+    
+    @LazyAsset(GAME)
     def flame_sequence(self) -> tuple[pygame.Surface]:
         """Sequence of images for the dagger's flame animation."""
-        return self._FLAME_SEQUENCE
-
-    @property
+        return self.sprite_atlas["flame_0"]
+    
+    @LazyAsset(GAME)
+    def dagger_images_rotated(self) -> dict[int, tuple[pygame.Surface, ...]]:
+        """Dagger images rotated to every dagger angle. Keys: 0, 90, 180, 270."""
+        return {angle: self.sprite_atlas[f"dagger_{angle}"] for angle in self._DAGGER_ANGLES}
+    
+    @LazyAsset(GAME)
+    def flame_sequence_rotated(self) -> dict[int, tuple[pygame.Surface, ...]]:
+        """Dagger flame animation frames rotated to every dagger angle. Keys: 0, 90, 180, 270."""
+        return {angle: self.sprite_atlas[f"flame_{angle}"] for angle in self._DAGGER_ANGLES}
+    
+    @LazyAsset(MENU)
     def cursor(self) -> pygame.Surface:
         """Image for the Pygame cursor."""
-        return self._CURSOR
-
-    @property
+        return self._AL.load_image('assets/images/cursor/cursor_image.png')
+    
+    @LazyAsset(MENU)
     def comic_sans_ms(self) -> str:
         """Path to the Comic Sans MS font."""
-        return self._COMIC_SANS_MS
\ No newline at end of file
+        return self._AL.resource_path("assets/fonts/comic_sans_ms.ttf")
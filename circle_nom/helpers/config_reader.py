@@ -1,9 +1,10 @@
-from circle_nom.systems.logging import get_logger, reconfigure_logging
+from circle_nom.systems.logging import get_logger, reconfigure_logging, SUBSYSTEMS
 from genericpath import exists
 from pathlib import Path
 import configparser
 import traceback
 import platform
+import logging
 import sys
 import os
 
@@ -51,10 +52,15 @@ class ConfigReader:
             "easter_chance": 10
         },
         
-        # Logging options - Enable/Disable booleans
+        # Logging options - Enable/Disable booleans, log level per subsystem
         "LOGGING": {
             "console_logging": True,
-            "file_logging": False
+            "file_logging": False,
+            "core_level": "DEBUG",
+            "models_level": "DEBUG",
+            "systems_level": "DEBUG",
+            "helpers_level": "DEBUG",
+            "ui_level": "DEBUG"
         },
         
         # Debug options - Enable/Disable booleans
@@ -67,6 +73,29 @@ class ConfigReader:
         # Performance profiler options - Enable/Disable booleans
         "PROFILE": {
             "perf_profile": False
+        },
+        
+        # Engine options - fixed simulation rate in Hz (0 uses a variable time step), save every game's replay and event log
+        "ENGINE": {
+            "sim_rate": 120,
+            "record_replays": False,
+            "record_events": False
+        },
+        
+        # Entity counts - 0 uses the play mode's counts, stress mode doubles them every interval (seconds) up to the max counts,
+        # entity store keeps the Prey and Dagger state in NumPy arrays for every game (always on in stress mode and for large counts)
+        "ENTITIES": {
+            "prey_count": 0,
+            "dagger_count": 0,
+            "stress_interval": 10.0,
+            "stress_max_prey": 1024,
+            "stress_max_daggers": 512,
+            "entity_store": False
+        },
+        
+        # Asset options - keep the decoded images and sounds in a cache file next to this config
+        "ASSETS": {
+            "asset_cache": True
         }
     }
     
@@ -148,7 +177,7 @@ class ConfigReader:
                     cls._loaded = True
                     cls._logger.info(f"{NAME} config loaded at '{PATH}'.")
                     # Modify logger settings once with the user specified ones
-                    reconfigure_logging(*cls.get_logging())
+                    reconfigure_logging(*cls.get_logging(), levels=cls.get_log_levels())
                     return
                 except Exception:
                     cls._logger.error(f"An error occured while trying to load the {NAME} config at '{PATH}'.")
@@ -246,6 +275,22 @@ class ConfigReader:
             cls._safe_getbool(section=section, key="file_logging", fallback=bool(cls._DEFAULT_CONFIG["LOGGING"]["file_logging"]))
         )
         
+    @classmethod
+    def get_log_levels(cls) -> dict[str, int]:
+        """
+        Get the log level of every subsystem (circle_nom subpackage) by its name. \n
+        Levels are set by name (DEBUG, INFO, WARNING, ERROR or CRITICAL), invalid names fall back to the default level.
+        """
+        section = cls._safe_section("LOGGING")
+        levels = {}
+        for subsystem in SUBSYSTEMS:
+            key = f"{subsystem}_level"
+            name = section.get(key, fallback=cls._DEFAULT_CONFIG["LOGGING"][key]).strip().upper()
+            if name not in logging.getLevelNamesMapping():
+                name = cls._DEFAULT_CONFIG["LOGGING"][key]
+            levels[subsystem] = logging.getLevelNamesMapping()[name]
+        return levels
+        
     @classmethod
     def get_debug(cls) -> tuple[bool, bool, bool]:
         """Get the debug setting values. 3 booleans corresponding to toggling Player, Prey and Dagger debug options."""
@@ -260,4 +305,72 @@ class ConfigReader:
     def get_profile(cls) -> bool:
         """Get the performace profile toggle setting value."""
         section = cls._safe_section("PROFILE")
-        return cls._safe_getbool(section=section, key="perf_profile", fallback=bool(cls._DEFAULT_CONFIG["PROFILE"]["perf_profile"]))
\ No newline at end of file
+        return cls._safe_getbool(section=section, key="perf_profile", fallback=bool(cls._DEFAULT_CONFIG["PROFILE"]["perf_profile"]))
+        
+    @classmethod
+    def get_sim_rate(cls) -> int:
+        """Get the fixed simulation rate in Hz. 0 means the game simulates with a variable time step, once per frame."""
+        section = cls._safe_section("ENGINE")
+        sim_rate = cls._safe_getint(section=section, key="sim_rate", fallback=int(cls._DEFAULT_CONFIG["ENGINE"]["sim_rate"]))
+        return sim_rate if sim_rate >= 0 else int(cls._DEFAULT_CONFIG["ENGINE"]["sim_rate"])
+        
+    @classmethod
+    def get_record_replays(cls) -> bool:
+        """Get the replay recording toggle setting value. If on, every game's replay is saved in the 'replays' folder."""
+        section = cls._safe_section("ENGINE")
+        return cls._safe_getbool(section=section, key="record_replays", fallback=bool(cls._DEFAULT_CONFIG["ENGINE"]["record_replays"]))
+        
+    @classmethod
+    def get_record_events(cls) -> bool:
+        """Get the event log toggle setting value. If on, every game's gameplay events are logged in the 'events' folder."""
+        section = cls._safe_section("ENGINE")
+        return cls._safe_getbool(section=section, key="record_events", fallback=bool(cls._DEFAULT_CONFIG["ENGINE"]["record_events"]))
+        
+    @classmethod
+    def get_entity_counts(cls) -> tuple[int, int]:
+        """Get the Prey and Dagger counts. 0 means the play mode's count is used, invalid (negative) counts fall back to 0."""
+        section = cls._safe_section("ENTITIES")
+        counts = (
+            cls._safe_getint(section=section, key="prey_count", fallback=int(cls._DEFAULT_CONFIG["ENTITIES"]["prey_count"])),
+            cls._safe_getint(section=section, key="dagger_count", fallback=int(cls._DEFAULT_CONFIG["ENTITIES"]["dagger_count"]))
+        )
+        return tuple(max(count, 0) for count in counts)
+        
+    @classmethod
+    def get_stress(cls) -> tuple[float, int, int]:
+        """
+        Get the stress mode settings - the interval in seconds between count doublings and the maximum Prey and Dagger counts. \n
+        Invalid (non positive) values fall back to their defaults.
+        """
+        section = cls._safe_section("ENTITIES")
+        defaults = cls._DEFAULT_CONFIG["ENTITIES"]
+        interval = cls._safe_getfloat(section=section, key="stress_interval", fallback=float(defaults["stress_interval"]))
+        max_prey = cls._safe_getint(section=section, key="stress_max_prey", fallback=int(defaults["stress_max_prey"]))
+        max_daggers = cls._safe_getint(section=section, key="stress_max_daggers", fallback=int(defaults["stress_max_daggers"]))
+        return (
+            interval if interval > 0 else float(defaults["stress_interval"]),
+            max_prey if max_prey > 0 else int(defaults["stress_max_prey"]),
+            max_daggers if max_daggers > 0 else int(defaults["stress_max_daggers"])
+        )
+        
+    @classmethod
+    def get_entity_store(cls) -> bool:
+        """
+        Get the entity store toggle setting value. If on, the Prey and Dagger state of every game is kept in NumPy arrays \n
+        and stepped in bulk. Off still uses them for the stress mode and large entity counts.
+        """
+        section = cls._safe_section("ENTITIES")
+        return cls._safe_getbool(section=section, key="entity_store", fallback=bool(cls._DEFAULT_CONFIG["ENTITIES"]["entity_store"]))
+        
+    @classmethod
+    def get_asset_cache(cls) -> Path | None:
+        """
+        Get the asset cache file's path, next to the config file (the root folder, or Documents for a frozen app). \n
+        None if the asset cache is turned off or there is no config path.
+        """
+        section = cls._safe_section("ASSETS")
+        if not cls._safe_getbool(section=section, key="asset_cache", fallback=bool(cls._DEFAULT_CONFIG["ASSETS"]["asset_cache"])):
+            return None
+        if not cls._CONFIG_NAME_AND_PATH:
+            return None
+        return cls._CONFIG_NAME_AND_PATH[1].parent / "asset_cache.cnac"
\ No newline at end of file
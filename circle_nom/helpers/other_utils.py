@@ -1,8 +1,8 @@
-from random import uniform, randint
 from typing import Any, Callable
+import random
 import pygame
 
-def declare_objects(count: int, func: Callable, *args: Any) -> tuple:
+def declare_objects(count: int, func: Callable, *args: Any, **kwargs: Any) -> tuple:
     """
     Declares a given count of objects and returns a tuple.
             
@@ -13,18 +13,20 @@ def declare_objects(count: int, func: Callable, *args: Any) -> tuple:
         count (int): The number of objects to declare.
         func (Callable): The given function, method or Class to invoke.
         *args (Any): The arguments for the func.
+        **kwargs (Any): The keyword arguments for the func.
                 
     Returns:
         tuple: A tuple containing the declared objects.
     """
-    return tuple(func(*args) for _ in range(count))
+    return tuple(func(*args, **kwargs) for _ in range(count))
 
-def rand_screen_pos(screen: pygame.Surface) -> pygame.Vector2:
+def rand_screen_pos(screen: pygame.Surface, rng: random.Random) -> pygame.Vector2:
     """
     Generate a random position on the screen with a bias towards screen edges.
     
     Args:
         screen (pygame.Surface): Reference to the game screen.
+        rng (random.Random): The random number generator to draw from.
 
     Returns:
         Vector2: A pygame.Vector2 obj containing the x and y coordinates of the random position.
@@ -34,7 +36,8 @@ def rand_screen_pos(screen: pygame.Surface) -> pygame.Vector2:
     HEIGHT = screen.height
     
     # 4/5 Times should return screen position closer to one of the screen edges
-    bias_edge = randint(0, 100)
+    uniform = rng.uniform
+    bias_edge = rng.randint(0, 100)
     
     # Return closer to top left
     if bias_edge <= 20:
@@ -1,3 +1,4 @@
+from circle_nom.systems.controls import KeyInput
 from math import isclose
 import pygame
 
@@ -83,7 +84,7 @@ def check_collision(player_1, player_2, dt: float) -> None:
         player_1.position.y += dy * dt
         player_2.position.y -= dy * dt
         
-def control_movement(player, dt: float, arrows: bool, wasd: bool) -> None:
+def control_movement(player, dt: float, arrows: bool, wasd: bool, keys: KeyInput | None = None) -> None:
     """
     Control the player movement and dash based on keyboard input.
 
@@ -92,10 +93,12 @@ def control_movement(player, dt: float, arrows: bool, wasd: bool) -> None:
         dt (float): Delta time, used for frame-independent drawing.
         arrows (bool): Arrows control mode.
         wasd (bool): WASD control mode.
+        keys (KeyInput | None): Pressed keys, indexable by pygame key constants. Reads the keyboard if None.
     """
     MOVEMENT_RATE = get_movement_rate(player, dt)
     direction = pygame.Vector2(0, 0)
-    keys = pygame.key.get_pressed()
+    if keys is None:
+        keys = pygame.key.get_pressed()
 
     # Dictionary with Key: Movement pairs
     movement_keys = {
@@ -1,7 +1,10 @@
-from cycler import V
-from circle_nom.systems.logging import get_logger
-from random import randint, uniform, choice
-from circle_nom.systems.timer import Timer
+from circle_nom.systems.entity_store import EntityStore, StoreColumn
+from circle_nom.systems.voice_pool import VoicePool
+from circle_nom.systems.logging import get_logger, INFO
+from circle_nom.systems.timer import Timer, FrameTime
+from typing import Callable, Sequence
+import numpy as np
+import random
 import pygame
 
 class Dagger():
@@ -10,6 +13,9 @@ class Dagger():
     _MARGIN = 100
     _BASE_SPEED = 700
     
+    # Movement direction of every dagger angle - 0: up (y-), 180: down (y+), 90: left (x-), 270: right (x+)
+    _DIRECTIONS = {0: (0, -1), 180: (0, 1), 90: (-1, 0), 270: (1, 0)}
+    
     # Logger
     _LOGGER = get_logger(name=__name__)
     
@@ -18,22 +24,32 @@ class Dagger():
     
     def __init__(self, 
                  screen: pygame.Surface, game_timer: Timer,
-                 dagger_images: list[pygame.Surface], 
+                 rng: random.Random, fx_rng: random.Random,
+                 dagger_images: dict[int, tuple[pygame.Surface, ...]], 
                  dagger_sounds: list[pygame.Sound],
-                 flame_sequence: list[pygame.Surface]) -> None:
+                 flame_sequence: dict[int, tuple[pygame.Surface, ...]],
+                 frame: FrameTime | None = None) -> None:
         """
         Initialize a Dagger object with direction and other attributes.
 
         Args:
             screen (pygame.Surface): The game screen object reference.
-            game_timer (Timer): The game timer. Used for different cooldowns.
-            dagger_images (list[pygame.Surface]): List of dagger images.
+            game_timer (Timer): The game timer. Its last snapshot is used until the first draw.
+            rng (random.Random): The game's gameplay RNG. Used for the direction, position, speed and timing of every spawn.
+            fx_rng (random.Random): The game's effects RNG. Used for the dagger image and sound picks.
+            dagger_images (dict[int, tuple[pygame.Surface, ...]]): Dagger images pre-rotated to every dagger angle.
             dagger_sounds (list[pygame.Sounds]): List of dagger sounds.
-            flame_sequence (list[pygame.Surface]): Flame sequence animation.
+            flame_sequence (dict[int, tuple[pygame.Surface, ...]]): Flame sequence animation pre-rotated to every dagger angle.
+            frame (FrameTime | None): The frame the dagger is created on. The game timer's last snapshot if None.
         """
         # Objects from engine
         self._screen = screen
         self._game_timer = game_timer
+        self._rng = rng
+        self._fx_rng = fx_rng
+        
+        # Frame time snapshot - updated on every draw, used for spawn timings
+        self._frame = frame if frame is not None else game_timer.last_snapshot
         
         # Assets
         self._dagger_images = dagger_images
@@ -41,6 +57,8 @@ class Dagger():
         self._flame_sequence = flame_sequence
         
         # Set dagger attributes
+        self._on_move: Callable[[pygame.Vector2], None] | None = None
+        self._on_reset: Callable[[], None] | None = None
         self.reset_dagger()
     
     @property
@@ -103,6 +121,46 @@ class Dagger():
         """
         return self._despawn_timestamp
     
+    @property
+    def on_move(self) -> Callable[[pygame.Vector2], None] | None:
+        """
+        Return the dagger's move callback. Called with the new position every time the dagger moves or resets.
+        
+        Returns:
+            Callable | None: The move callback, None if there is none.
+        """
+        return self._on_move
+    
+    @on_move.setter
+    def on_move(self, callback: Callable[[pygame.Vector2], None] | None) -> None:
+        """
+        Set the dagger's move callback. Used to keep the collision broadphase up to date without polling every dagger.
+        
+        Args:
+            callback (Callable | None): Called with the new position every time the dagger moves. None to remove it.
+        """
+        self._on_move = callback
+    
+    @property
+    def on_reset(self) -> Callable[[], None] | None:
+        """
+        Return the dagger's reset callback. Called every time the dagger resets to a new spawn, once the reset is done.
+        
+        Returns:
+            Callable | None: The reset callback, None if there is none.
+        """
+        return self._on_reset
+    
+    @on_reset.setter
+    def on_reset(self, callback: Callable[[], None] | None) -> None:
+        """
+        Set the dagger's reset callback. Used to record the dagger's spawns in the game's event log.
+        
+        Args:
+            callback (Callable | None): Called every time the dagger resets. None to remove it.
+        """
+        self._on_reset = callback
+    
     @property
     def angle(self) -> int:
         """
@@ -138,61 +196,71 @@ class Dagger():
         """
         Resets the dagger's position, direction, and image.
         """
-        self._position = pygame.Vector2(float('inf'), float('inf'))
+        position = pygame.Vector2(float('inf'), float('inf'))
         self._created = True
 
         # Decide dagger direction
-        direction = randint(0, 3)
+        direction = self._rng.randint(0, 3)
 
         # Up - Vertical
         if direction == 0:
             self._angle = 0
-            self._position.x = uniform(self._MARGIN, self._screen.width - self._MARGIN)
-            self._position.y = self._screen.height + self._MARGIN
+            position.x = self._rng.uniform(self._MARGIN, self._screen.width - self._MARGIN)
+            position.y = self._screen.height + self._MARGIN
             
         # Down - Vertical
         elif direction == 1:
             self._angle = 180
-            self._position.x = uniform(self._MARGIN, self._screen.width - self._MARGIN)
-            self._position.y = - self._MARGIN
+            position.x = self._rng.uniform(self._MARGIN, self._screen.width - self._MARGIN)
+            position.y = - self._MARGIN
             
         # Left - Horizontal
         elif direction == 2:
             self._angle = 90
-            self._position.x = self._screen.width + self._MARGIN
-            self._position.y = uniform(self._MARGIN, self._screen.height - self._MARGIN)
+            position.x = self._screen.width + self._MARGIN
+            position.y = self._rng.uniform(self._MARGIN, self._screen.height - self._MARGIN)
             
         # Right - Horizontal
         elif direction == 3:
             self._angle = 270
-            self._position.x = - self._MARGIN
-            self._position.y = uniform(self._MARGIN, self._screen.height - self._MARGIN)
+            position.x = - self._MARGIN
+            position.y = self._rng.uniform(self._MARGIN, self._screen.height - self._MARGIN)
 
+        # No interpolation from the previous position after a reset
+        self._position = position
+        self._prev_position = position.copy()
+        if self._on_move is not None:
+            self._on_move(self._position)
+        
         # Speed multiplier and flame based on it
-        self._speed_multiplier = uniform(1, 1.8)
+        self._speed_multiplier = self._rng.uniform(1, 1.8)
         self._flame = self._speed_multiplier >= 1.6
         
+        # Velocity in pixels per second - moving only needs a multiplication by dt
+        self._velocity = pygame.Vector2(self._DIRECTIONS[self._angle]) * (self._BASE_SPEED * self._speed_multiplier)
+        
         # Spawn timestamp
-        self._spawn_timestamp = self._game_timer.get_time() + uniform(self._SPAWN_RATE, self._SPAWN_RATE * 2)
+        self._spawn_timestamp = self._frame.now + self._rng.uniform(self._SPAWN_RATE, self._SPAWN_RATE * 2)
         
         # Despawn timestamp - calculate based on the spawn time and decided dagger speed
         # Different numerator based on the dagger movement direction and screen size
         NUMERATOR = self._screen.width / 540 if direction in (2, 3) else self._screen.height / 450
         self._despawn_timestamp = self._spawn_timestamp + NUMERATOR / self._speed_multiplier
         
-        # Choose dagger image from list and rotate
-        self._image:pygame.Surface = pygame.transform.rotate(choice(self._dagger_images), self._angle)
+        # Choose dagger image from the ones pre-rotated to the dagger's angle
+        self._image: pygame.Surface = self._fx_rng.choice(self._dagger_images[self._angle])
 
         # Played sound flag
         self._played_sound = False
         
         # Log the dagger init
-        log_str = (
-            f"Dagger with spawn/despawn timestamps {self._spawn_timestamp:.2f}/{self._despawn_timestamp:.2f}s, "
-            f"X {self._position.x:.2f} Y {self._position.y:.2f}, "
-            f"speed multiplier {self._speed_multiplier:.2f} and angle {self._angle} initialized."
-        )
-        self._LOGGER.info(log_str)
+        if self._LOGGER.isEnabledFor(INFO):
+            self._LOGGER.info(
+                "Dagger with spawn/despawn timestamps %.2f/%.2fs, X %.2f Y %.2f, speed multiplier %.2f and angle %d initialized.",
+                self._spawn_timestamp, self._despawn_timestamp, position.x, position.y, self._speed_multiplier, self._angle
+            )
+        if self._on_reset is not None:
+            self._on_reset()
         
     def grace_spawn(self, value: int|float) -> None:
         """
@@ -204,53 +272,172 @@ class Dagger():
         if isinstance(value, (int, float)):
             self._spawn_timestamp += value
             self._despawn_timestamp += value
-            self._LOGGER.info(f"Dagger grace spawn/despawn value ({value:.2f}) applied.")
+            self._LOGGER.info("Dagger grace spawn/despawn value (%.2f) applied.", value)
         else:
             raise ValueError("Method 'grace_spawn' accepts int/float only!")
     
-    def draw(self, dt: float) -> None:
+    def update(self, frame: FrameTime) -> None:
         """
-        Draw the dagger on the screen.
+        Move the dagger for the current frame, resetting it once its despawn time is reached. \n
+        Draws nothing, use render() for that.
         
         Args:
-            dt (float): Delta time, used for frame independent drawing.
+            frame (FrameTime): The game timer snapshot for the current frame. Its dt is used for frame independent movement.
         """
+        self._frame = frame
+        dt = frame.dt
         
         # Reset dagger and cancel next frame calculations if its despawn time
-        if self._game_timer.get_time() >= self._despawn_timestamp:
+        if self._frame.now >= self._despawn_timestamp:
             self.reset_dagger()
             return
         
-        # Calculate next frame position and draw if dagger is spawnewd
-        if self._game_timer.get_time() >= self._spawn_timestamp:
-            
-            # Calculate delta movement
-            delta_movement: dict[float, float] = { # type: ignore
-                0:   (0, -self._BASE_SPEED * self._speed_multiplier * dt), # angle 0: up (x, y-)
-                180: (0, +self._BASE_SPEED * self._speed_multiplier * dt), # angle 180: down (x, y+)
-                90:  (-self._BASE_SPEED * self._speed_multiplier * dt, 0), # angle 90: left (x-, y)
-                270: (+self._BASE_SPEED * self._speed_multiplier * dt, 0)  # angle 270: right (x+, y)
-            }
+        # Keep the position from before this update for interpolated rendering
+        self._prev_position = self._position.copy()
+        
+        # Calculate next frame position if dagger is spawned
+        if self._frame.now >= self._spawn_timestamp:
+            self._position += self._velocity * dt
+            if self._on_move is not None:
+                self._on_move(self._position)
+        return
+    
+    def render(self, surface: pygame.Surface, alpha: float = 1.00) -> None:
+        """
+        Draw the dagger and its flame (if on) on the given surface if it's spawned. Changes no dagger state.
+        
+        Args:
+            surface (pygame.Surface): The surface to draw on.
+            alpha (float): Interpolation factor between the previous (0.0) and the current (1.0) update position.
+        """
+        if self._frame.now >= self._spawn_timestamp:
             
-            # Update position based on angle
-            self._position.xy += delta_movement.get(self._angle) # type: ignore
+            # Draw position - interpolated between the last two updates
+            position = self._position if alpha >= 1 else self._prev_position.lerp(self._position, max(alpha, 0.00))
             
             # Draw flame if its on
             if self._flame:
                 
-                # Select from flame_sequence and rotate
-                flame_image = pygame.transform.rotate(self._flame_sequence[int(self._game_timer.get_time() / 0.12 % len(self._flame_sequence))], self._angle)
-                self._screen.blit(flame_image, self._get_blit_pos(self._position, flame_image))
+                # Select from the flame_sequence pre-rotated to the dagger's angle
+                flame_sequence = self._flame_sequence[self._angle]
+                flame_image = flame_sequence[int(self._frame.now / 0.12 % len(flame_sequence))]
+                surface.blit(flame_image, self._get_blit_pos(position, flame_image))
             
             # Draw dagger
-            self._screen.blit(self._image, self._get_blit_pos(self._position, self._image))
-        return
+            surface.blit(self._image, self._get_blit_pos(position, self._image))
         
     def play_sound(self) -> None:
         """
         Play a random dagger sound if it hasn't been played yet.
         """
         if self._played_sound == False:
-            choice(self._dagger_sounds).play()
+            VoicePool.play("dagger", self._fx_rng.choice(self._dagger_sounds))
             self._played_sound = True
-            self._LOGGER.info(f"Started playing Dagger sound at X {self._position.x:.2f} Y {self._position.y:.2f}.")
\ No newline at end of file
+            if self._LOGGER.isEnabledFor(INFO):
+                position = self._position
+                self._LOGGER.info("Started playing Dagger sound at X %.2f Y %.2f.", position.x, position.y)
+
+
+class DaggerView(Dagger):
+    
+    # Store columns of the dagger's movement and timing attributes - name: (dtype, width)
+    STORE_COLUMNS = {
+        "position": (float, 2),
+        "prev_position": (float, 2),
+        "velocity": (float, 2),
+        "angle": (np.int16, 1),
+        "speed_multiplier": (float, 1),
+        "flame": (bool, 1),
+        "spawn_timestamp": (float, 1),
+        "despawn_timestamp": (float, 1),
+        "played_sound": (bool, 1),
+        "has_on_move": (bool, 1)
+    }
+    
+    # Dagger attributes backed by the store
+    _position = StoreColumn("position")
+    _prev_position = StoreColumn("prev_position")
+    _velocity = StoreColumn("velocity")
+    _angle = StoreColumn("angle")
+    _speed_multiplier = StoreColumn("speed_multiplier")
+    _flame = StoreColumn("flame")
+    _spawn_timestamp = StoreColumn("spawn_timestamp")
+    _despawn_timestamp = StoreColumn("despawn_timestamp")
+    _played_sound = StoreColumn("played_sound")
+    
+    def __init__(self, store: EntityStore,
+                 screen: pygame.Surface, game_timer: Timer,
+                 rng: random.Random, fx_rng: random.Random,
+                 dagger_images: dict[int, tuple[pygame.Surface, ...]], 
+                 dagger_sounds: list[pygame.Sound],
+                 flame_sequence: dict[int, tuple[pygame.Surface, ...]],
+                 frame: FrameTime | None = None) -> None:
+        """
+        A Dagger whose movement and timings live in a row of an EntityStore made with STORE_COLUMNS, \n
+        so the daggers of a store can be read and stepped as arrays. Behaves like a Dagger otherwise.
+
+        Args:
+            store (EntityStore): The store the dagger adds its row to.
+            screen (pygame.Surface): The game screen object reference.
+            game_timer (Timer): The game timer. Its last snapshot is used until the first draw.
+            rng (random.Random): The game's gameplay RNG. Used for the direction, position, speed and timing of every spawn.
+            fx_rng (random.Random): The game's effects RNG. Used for the dagger image and sound picks.
+            dagger_images (dict[int, tuple[pygame.Surface, ...]]): Dagger images pre-rotated to every dagger angle.
+            dagger_sounds (list[pygame.Sounds]): List of dagger sounds.
+            flame_sequence (dict[int, tuple[pygame.Surface, ...]]): Flame sequence animation pre-rotated to every dagger angle.
+            frame (FrameTime | None): The frame the dagger is created on. The game timer's last snapshot if None.
+        """
+        self._store = store
+        self._store_idx = store.add()
+        super().__init__(screen, game_timer, rng, fx_rng, dagger_images, dagger_sounds, flame_sequence, frame=frame)
+    
+    @Dagger.on_move.setter
+    def on_move(self, callback: Callable[[pygame.Vector2], None] | None) -> None:
+        """
+        Set the dagger's move callback. Used to keep the collision broadphase up to date without polling every dagger. \n
+        Flagged in the store, so update_all() only calls back the daggers that have a callback.
+        
+        Args:
+            callback (Callable | None): Called with the new position every time the dagger moves. None to remove it.
+        """
+        self._on_move = callback
+        self._store.columns["has_on_move"][self._store_idx] = callback is not None
+    
+    @classmethod
+    def update_all(cls, store: EntityStore, daggers: Sequence["DaggerView"], frame: FrameTime,
+                   screen: pygame.Surface | None = None) -> None:
+        """
+        Bulk update() of every dagger in the store - despawn checks and movement are one array operation each, \n
+        only the despawned daggers are reset one by one. Same results as calling update() on every dagger in order.
+        
+        Args:
+            store (EntityStore): The daggers' store.
+            daggers (Sequence[DaggerView]): Every dagger of the store, in row order.
+            frame (FrameTime): The game timer snapshot for the current frame.
+            screen (pygame.Surface | None): Moved daggers within the screen play their sound, see play_sound(). No sounds if None.
+        """
+        for dagger in daggers:
+            dagger._frame = frame
+        now, dt = frame.now, frame.dt
+        position, prev_position = store["position"], store["prev_position"]
+        
+        # Despawned daggers are reset, the others keep their position for interpolated rendering and move once spawned
+        despawn = now >= store["despawn_timestamp"]
+        prev_position[~despawn] = position[~despawn]
+        moving = ~despawn & (now >= store["spawn_timestamp"])
+        position[moving] += store["velocity"][moving] * dt
+        for idx in np.flatnonzero(moving & store["has_on_move"]):
+            daggers[idx].on_move(daggers[idx].position)
+        
+        # Moved daggers that entered the screen play their sound
+        sound = np.zeros_like(despawn)
+        if screen is not None:
+            x, y = position[:, 0], position[:, 1]
+            sound = ~despawn & ~store["played_sound"] & (0 <= x) & (x <= screen.width) & (0 <= y) & (y <= screen.height)
+        
+        # Resets and sounds in row order - both pick from the effects RNG, in the same order as the one by one updates
+        for idx in np.flatnonzero(despawn | sound):
+            if despawn[idx]:
+                daggers[idx].reset_dagger()
+            else:
+                daggers[idx].play_sound()
\ No newline at end of file
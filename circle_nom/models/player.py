@@ -1,9 +1,11 @@
 import circle_nom.helpers.player_utils as player_utils
 from circle_nom.helpers.asset_bank import AssetBank
-from circle_nom.systems.logging import get_logger
-from circle_nom.systems.timer import Timer
-from random import choice
+from circle_nom.systems.sprite_cache import SpriteCache
+from circle_nom.systems.voice_pool import VoicePool
+from circle_nom.systems.logging import get_logger, INFO
+from circle_nom.systems.timer import Timer, FrameTime
 import numpy as np
+import random
 import pygame
 
 class Player():
@@ -38,26 +40,36 @@ class Player():
     # Game asset bank
     _AB = AssetBank()
     
-    def __init__(self, screen:pygame.Surface, game_timer: Timer, easter_mode: bool, 
+    # Scaled images cache - shared between all players
+    _SC = SpriteCache(capacity=128)
+    
+    def __init__(self, screen:pygame.Surface, game_timer: Timer, rng: random.Random, easter_mode: bool, 
                  image_alive: pygame.Surface, image_dead: pygame.Surface, 
                  eat_sequence: list[pygame.Surface] | None, 
-                 accessory: tuple[pygame.Vector2, pygame.Surface] | None) -> None:
+                 accessory: tuple[pygame.Vector2, pygame.Surface] | None, muted: bool = False) -> None:
         """
         Initializes the Player object with images, easter mode, and screen.
         
         Args:
-            screen (pygame.Surface): The game screen. Used in the different draw methods.
-            game_timer (Timer): The game timer. Used for different cooldowns.
+            screen (pygame.Surface): The game screen.
+            game_timer (Timer): The game timer. Its last snapshot is used until the first draw.
+            rng (random.Random): The game's effects RNG. Used for the eat/hurt texts and dash sounds.
             easter_mode (bool): Flag for easter mode. Changes blitting methods to better fit other images.
             image_alive (pygame.Surface): The player's alive image.
             image_dead (pygame.Surface): The player's dead image.
             eat_sequence (list(pygame.Surface) | None): The player's eat sequence animation.
             player_accessory (tuple(pygame.Vector2, pygame.Surface) | None): The player's accessory data pair.
+            muted (bool): Play no dash sounds - for headless games.
         """
         
         # Objects from engine
         self._screen = screen
         self._game_timer = game_timer
+        self._rng = rng
+        self._muted = muted
+        
+        # Frame time snapshot - updated on every draw, used for different cooldowns
+        self._frame = game_timer.last_snapshot
         
         # Easter mode flag from engine
         self._easter = easter_mode
@@ -73,8 +85,9 @@ class Player():
         # Below are the starting attributes
         # Core size, scale, position and speed of the player
         self._size = Player.STARTING_SIZE
-        self._scale = [self._size * 3, self._size * 3]
+        self._scale = self._get_scale()
         self._position = pygame.Vector2(640, 140)
+        self._prev_position = self._position.copy()
         self._speed = Player.STARTING_SPEED
         
         # Dash attributes
@@ -94,6 +107,7 @@ class Player():
         # Hurt attributes - simillar to eat
         self._hurt_pos = self._position
         self._hurt_tol = self._size * 1.25
+        self._collision_tol = self._size * 1.5
         
         # Timestamps for eat/hurt draws & animations
         # using -1 since 0 shows them for a few frames at beggining of game
@@ -101,8 +115,8 @@ class Player():
         self._last_hurt_timestamp = -1
         
         # Texts to display as part of the eat/hurt animations
-        self._eat_text = choice(Player.EAT_TEXTS)
-        self._hurt_text = choice(Player.HURT_TEXTS)
+        self._eat_text = self._rng.choice(Player.EAT_TEXTS)
+        self._hurt_text = self._rng.choice(Player.HURT_TEXTS)
         
         # Initial player points
         self._points = 0
@@ -199,7 +213,7 @@ class Player():
         Returns:
             bool: True if internal dash CD is <= 0, false otherwise.
         """
-        return (self._game_timer.get_time() - self._last_dash_timestamp) >= Player.DASH_CD
+        return (self._frame.now - self._last_dash_timestamp) >= Player.DASH_CD
     
     @property
     def position(self) -> pygame.Vector2:
@@ -229,7 +243,7 @@ class Player():
         Returns:
             bool: The can_eat boolean.
         """
-        return self._game_timer.get_time() - self._last_eat_timestamp > Player.EAT_DUR
+        return self._frame.now - self._last_eat_timestamp > Player.EAT_DUR
     
     @size.setter
     def size(self, value: float) -> None:
@@ -242,7 +256,7 @@ class Player():
         if value < Player.MIN_SIZE: self._size = Player.MIN_SIZE
         elif value > Player.MAX_SIZE: self._size = Player.MAX_SIZE
         else: self._size = value            
-        self._scale = [self._size * 3, self._size * 3]
+        self._scale = self._get_scale()
 
     @speed.setter
     def speed(self, value:float) -> None:
@@ -315,6 +329,21 @@ class Player():
         """
         cls.DASH_CD = cd
         
+    def _get_scale(self) -> tuple[int, int]:
+        """
+        Get the player's draw scale from its size. Quantized to whole sizes so the scaled images can be cached.
+        """
+        scale = round(self._size) * 3
+        return scale, scale
+        
+    def _get_render_pos(self, alpha: float) -> pygame.Vector2:
+        """
+        Get the player's draw position, interpolated between the previous and the current update by alpha.
+        """
+        if alpha >= 1:
+            return self._position
+        return self._prev_position.lerp(self._position, max(alpha, 0.00))
+    
     def _modify_hit(self) -> pygame.Surface:
         """
         Modifies the player's image to be more reddish. Used in the init.
@@ -352,28 +381,34 @@ class Player():
             
         return reddish_image
         
-    def _draw_text(self, text: str, image: pygame.Surface) -> None:
+    def _draw_text(self, surface: pygame.Surface, text: str, image: pygame.Surface, position: pygame.Vector2) -> None:
         """
-        Draws the specified text on the screen.
+        Draws the specified text on the given surface.
         
         Args:
+            surface (pygame.Surface): The surface to draw on.
             text (str): The text to draw.
             image (pygame.Surface): The image to offset the text from.
+            position (pygame.Vector2): The player's draw position.
         """
         rendered_text = self._text_font.render(f"{text}", True, (255, 255, 255))
-        text_rect = rendered_text.get_rect(center=(self._position.x, self._position.y - image.height / 2 - self._size * 0.8))
-        self._screen.blit(rendered_text, text_rect)
+        text_rect = rendered_text.get_rect(center=(position.x, position.y - image.height / 2 - self._size * 0.8))
+        surface.blit(rendered_text, text_rect)
 
     def _new_texts(self) -> None:
         """
         Selects new strings for _eat_text and _hurt_text.
         """
-        self._eat_text = choice(Player.EAT_TEXTS)
-        self._hurt_text = choice(Player.HURT_TEXTS)
+        self._eat_text = self._rng.choice(Player.EAT_TEXTS)
+        self._hurt_text = self._rng.choice(Player.HURT_TEXTS)
         
-    def _draw_accessory(self) -> None:
+    def _draw_accessory(self, surface: pygame.Surface, position: pygame.Vector2) -> None:
         """
-        Draw player's accessory if it exists.
+        Draw player's accessory on the given surface if it exists.
+        
+        Args:
+            surface (pygame.Surface): The surface to draw on.
+            position (pygame.Vector2): The player's draw position.
         """
         if self._accessory:
             # Calculate scale factor relative to menu player size (180)
@@ -385,11 +420,11 @@ class Player():
                 (self._accessory[1].width * scale_factor),
                 (self._accessory[1].height * scale_factor)
             )
-            scaled_image = pygame.transform.smoothscale(self._accessory[1], accessory_size)
+            scaled_image = self._SC.scale(self._accessory[1], accessory_size)
             # Calculate the top-left of the player image
-            player_topleft = self._position - pygame.Vector2(self._scale[0] / 2, self._scale[1] / 2)
+            player_topleft = position - pygame.Vector2(self._scale[0] / 2, self._scale[1] / 2)
             # Blit at the correct position
-            self._screen.blit(
+            surface.blit(
                 scaled_image,
                 player_topleft + scaled_offset - pygame.Vector2(scaled_image.width / 2, scaled_image.height / 2)
             )
@@ -399,16 +434,16 @@ class Player():
         Set the eat timestamp at current game timer time and choose a new eat text. \n
         Must be used only once when the player eats a prey.
         """
-        self._last_eat_timestamp = self._game_timer.get_time()
-        self._eat_text = choice(Player.EAT_TEXTS)
+        self._last_eat_timestamp = self._frame.now
+        self._eat_text = self._rng.choice(Player.EAT_TEXTS)
         
     def reset_hurt_attributes(self) -> None:
         """
         Set the hurt timestamp at current game timer time and choose a new hurt text. \n
         Must be used only once when the player gets hurt.
         """
-        self._last_hurt_timestamp = self._game_timer.get_time()
-        self._eat_text = choice(Player.HURT_TEXTS)
+        self._last_hurt_timestamp = self._frame.now
+        self._eat_text = self._rng.choice(Player.HURT_TEXTS)
         
     def dash(self) -> None:
         """
@@ -417,60 +452,39 @@ class Player():
         if self.dash_available:
             self._speed_before_dash = self._speed
             self._speed += player_utils.get_dash_speed(self)
-            self._last_dash_timestamp = self._game_timer.get_time()
+            self._last_dash_timestamp = self._frame.now
             self._dash_on = True
-            choice(self._AB.dash_sounds).play()
-            log_str = (
-                f"Player dashed at time {self._game_timer.get_time():.2f} " 
-                f"with init speed {self._speed_before_dash:.2f}, current speed {self._speed:.2f}"
-            )
-            self._LOGGER.info(log_str)
+            if not self._muted:
+                VoicePool.play("dash", self._rng.choice(self._AB.dash_sounds))
+            if self._LOGGER.isEnabledFor(INFO):
+                self._LOGGER.info(
+                    "Player dashed at time %.2f with init speed %.2f, current speed %.2f", 
+                    self._frame.now, self._speed_before_dash, self._speed
+                )
             
-    def draw(self, dt: float) -> None:
+    def update(self, frame: FrameTime) -> None:
         """
-        Draws the player on the screen and handles dash mechanics.
+        Updates the player's timed state for the current frame: dash mechanics and the eat, hit and collision areas. \n
+        Draws nothing, use render() for that.
         
         Args:
-            dt (float): Delta time in seconds since the last frame. Ensures frame-rate independent animation.
+            frame (FrameTime): The game timer snapshot for the current frame. Every cooldown check uses its time.
         """
-        # Eat animation draw
-        if self._game_timer.get_time() - self._last_eat_timestamp < Player.EAT_DUR and self._eat_sequence:
-            player_image = self._eat_sequence[int(self._game_timer.get_time() / 0.12 % len(self._eat_sequence))]
-            player_image = pygame.transform.smoothscale(player_image, self._scale)
-            self._screen.blit(player_image, self._position - pygame.Vector2(player_image.width / 2, player_image.height / 2))
-            
-        # Hurt draw
-        elif self._game_timer.get_time() - self._last_hurt_timestamp < Player.HURT_DUR:
-            player_image = pygame.transform.smoothscale(self._image_hit, self._scale)
-            self._screen.blit(player_image, self._position - pygame.Vector2(player_image.width / 2, player_image.height / 2))
-            
-        # Normal draw
-        else:
-            # Player resize and draw
-            player_image = pygame.transform.smoothscale(self._image_alive, self._scale)
-            self._screen.blit(player_image, self._position - pygame.Vector2(player_image.width / 2, player_image.height / 2))
-            
-        # Update eat and hit positions based on the image from draw
+        self._frame = frame
+        
+        # Keep the position from before this update for interpolated rendering
+        self._prev_position = self._position.copy()
+        
+        # Update eat position based on the player's drawn image height
         if not self._easter:
-            self._eat_pos = pygame.Vector2(self._position.x, self._position.y - player_image.height * -0.3)
+            self._eat_pos = pygame.Vector2(self._position.x, self._position.y - self._scale[1] * -0.3)
             self._eat_tol = self._size * 0.8
         else:
             self._eat_pos = self._position
             self._eat_tol = self._size * 1.25
             
-        # Draw player's accessory before text
-        self._draw_accessory()
-            
-        # Eat text draw
-        if self._game_timer.get_time() - self._last_eat_timestamp < Player.EAT_DUR:
-            self._draw_text(self._eat_text, player_image)
-        
-        # Hurt text draw
-        elif self._game_timer.get_time() - self._last_hurt_timestamp < Player.HURT_DUR:
-            self._draw_text(self._hurt_text, player_image)
-            
         # If dash duration is over update player speed
-        if self._dash_on and (self._game_timer.get_time() - self._last_dash_timestamp > Player.DASH_DUR):
+        if self._dash_on and (frame.now - self._last_dash_timestamp > Player.DASH_DUR):
             self._speed = self._speed_before_dash
             self._dash_on = False
 
@@ -479,11 +493,52 @@ class Player():
         self._hurt_tol = self._size * 1.25
         self._collision_tol = self._size * 1.5
         
-    def draw_dead(self) -> None:
+    def render(self, surface: pygame.Surface, alpha: float = 1.00) -> None:
+        """
+        Draws the player, its accessory and eat/hurt texts on the given surface, using the last updated frame. \n
+        Changes no player state.
+        
+        Args:
+            surface (pygame.Surface): The surface to draw on.
+            alpha (float): Interpolation factor between the previous (0.0) and the current (1.0) update position.
+        """
+        now = self._frame.now
+        position = self._get_render_pos(alpha)
+        
+        # Eat animation draw
+        if now - self._last_eat_timestamp < Player.EAT_DUR and self._eat_sequence:
+            player_image = self._eat_sequence[int(now / 0.12 % len(self._eat_sequence))]
+            player_image = self._SC.scale(player_image, self._scale)
+            
+        # Hurt draw
+        elif now - self._last_hurt_timestamp < Player.HURT_DUR:
+            player_image = self._SC.scale(self._image_hit, self._scale)
+            
+        # Normal draw
+        else:
+            player_image = self._SC.scale(self._image_alive, self._scale)
+            
+        surface.blit(player_image, position - pygame.Vector2(player_image.width / 2, player_image.height / 2))
+            
+        # Draw player's accessory before text
+        self._draw_accessory(surface, position)
+            
+        # Eat text draw
+        if now - self._last_eat_timestamp < Player.EAT_DUR:
+            self._draw_text(surface, self._eat_text, player_image, position)
+        
+        # Hurt text draw
+        elif now - self._last_hurt_timestamp < Player.HURT_DUR:
+            self._draw_text(surface, self._hurt_text, player_image, position)
+        
+    def render_dead(self, surface: pygame.Surface) -> None:
         """
-        Draws the dead player on the screen.
-        Scales the player's dead image based on the current size and blits it to the screen.
+        Draws the dead player on the given surface.
+        Scales the player's dead image based on the current size and blits it.
+        
+        Args:
+            surface (pygame.Surface): The surface to draw on.
         """
-        self._image_dead = pygame.transform.smoothscale(self._image_dead, self._scale)
-        self._screen.blit(self._image_dead, self._position - pygame.Vector2(self._image_dead.width / 2, self._image_dead.height / 2))
-        self._draw_accessory()
\ No newline at end of file
+        image_dead = self._SC.scale(self._image_dead, self._scale)
+        surface.blit(image_dead, self._position - pygame.Vector2(image_dead.width / 2, image_dead.height / 2))
+        self._draw_accessory(surface, self._position)
\ No newline at end of file
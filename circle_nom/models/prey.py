@@ -1,7 +1,11 @@
-from circle_nom.helpers.other_utils import rot_center, rand_screen_pos
-from circle_nom.systems.logging import get_logger
-from circle_nom.systems.timer import Timer
-from random import randint, uniform
+from circle_nom.systems.entity_store import EntityStore, StoreColumn
+from circle_nom.systems.sprite_cache import RotationAtlas
+from circle_nom.helpers.other_utils import rand_screen_pos
+from circle_nom.systems.logging import get_logger, INFO
+from circle_nom.systems.timer import Timer, FrameTime
+from typing import Callable, Sequence
+import numpy as np
+import random
 import pygame
 
 class Prey():
@@ -12,6 +16,13 @@ class Prey():
     AURA_ROT_SPEED = 45         # Prey aura rotation speed
     AURA_MAX_SCALE = 180        # Maximum prey aura scale
     
+    # Prey rotation atlases config - pre-rendered sizes and angle steps in degrees
+    # Small steps first, so the spawn and despawn animations don't pop in and out at the smallest size
+    ATLAS_SIZES = 5, 10, 15, 30, 45, 60, 70, 80
+    ATLAS_ANGLE_STEP = 15
+    AURA_ATLAS_SIZES = 15, 30, 45, 90, 135, 180
+    AURA_ATLAS_ANGLE_STEP = 5
+    
     # Prey balancing
     SPAWNED_DUR = 2             # Time prey stays spawned before despawning
     NOSPAWN_DUR = 0.5           # Time prey is not spawning after despawn
@@ -23,30 +34,53 @@ class Prey():
     _SPAWNED = "SPAWNED"        # Prey is fully spawned and able to be eaten
     _DESPAWNING = "DESPAWNING"  # Prey is currently in a despawning animation
     
+    # Every prey state, in the order of their codes in entity stores and event logs
+    STATES = (_NOSPAWN, _SPAWNING, _SPAWNED, _DESPAWNING)
+    
     # Logger reference
     _LOGGER = get_logger(name=__name__)
+    
+    # Rotation atlases shared between all preys, keyed by the name of their images and the image's index,
+    # so games building new surfaces for the same images (like Easter mode's) reuse the first game's atlases
+    _ATLASES: dict[tuple[str, int], RotationAtlas] = {}
 
-    def __init__(self, screen: pygame.Surface, game_timer: Timer,
-                 list_images:list[pygame.Surface], aura_image:pygame.Surface) -> None:
+    def __init__(self, screen: pygame.Surface, game_timer: Timer, rng: random.Random,
+                 list_images:list[pygame.Surface], aura_image:pygame.Surface, frame: FrameTime | None = None,
+                 images_name: str = "prey_images") -> None:
         """
         Initializes the Prey object with images, aura image, and screen.
 
         Args:
-            screen (pygame.Surface): The game screen. Used in the different draw methods.
-            game_timer (Timer): The game timer. Used for different cooldowns.
+            screen (pygame.Surface): The game screen. Used for the spawn positions.
+            game_timer (Timer): The game timer. Its last snapshot is used until the first draw.
+            rng (random.Random): The game's gameplay RNG. Used for the image, angle, position and size of every spawn.
             list_images (list[pygame.Surface]): List of prey images.
             aura_image (pygame.Surface): The aura image.
+            frame (FrameTime | None): The frame the prey is created on. The game timer's last snapshot if None.
+            images_name (str): Name of the prey images, the key of their rotation atlases. Images with different contents need different names.
         """
         # Objects from the engine
         self._screen = screen
         self._game_timer = game_timer
+        self._rng = rng
+        
+        # Frame time snapshot - updated on every draw, used for state timings
+        self._frame = frame if frame is not None else game_timer.last_snapshot
         
         # Assets
         self._list_images = list_images
         self._aura_image = aura_image
         
+        # Pre-rendered rotations of every prey image and the aura
+        self._atlases = tuple(
+            self._get_atlas((images_name, idx), image, Prey.ATLAS_SIZES, Prey.ATLAS_ANGLE_STEP) for idx, image in enumerate(list_images)
+        )
+        self._aura_atlas = self._get_atlas(("prey_aura", 0), aura_image, Prey.AURA_ATLAS_SIZES, Prey.AURA_ATLAS_ANGLE_STEP)
+        
         # Internal attributes
         self._aura_angle = 0
+        self._on_move: Callable[[pygame.Vector2], None] | None = None
+        self._on_state_change: Callable[[str], None] | None = None
         self.reset_prey()
 
     @property
@@ -112,7 +146,47 @@ class Prey():
         
         if new_state != self._state:
             self._state = new_state
-            self._last_state_change = self._game_timer.get_time()
+            self._last_state_change = self._frame.now
+    
+    @property
+    def on_move(self) -> Callable[[pygame.Vector2], None] | None:
+        """
+        Get the prey's move callback. Called with the new position every time the prey moves (on every reset).
+        
+        Returns:
+            Callable | None: The move callback, None if there is none.
+        """
+        return self._on_move
+    
+    @on_move.setter
+    def on_move(self, callback: Callable[[pygame.Vector2], None] | None) -> None:
+        """
+        Set the prey's move callback. Used to keep the collision broadphase up to date without polling every prey.
+        
+        Args:
+            callback (Callable | None): Called with the new position every time the prey moves. None to remove it.
+        """
+        self._on_move = callback
+            
+    @property
+    def on_state_change(self) -> Callable[[str], None] | None:
+        """
+        Get the prey's state change callback. Called with the new state every time the prey changes state or resets.
+        
+        Returns:
+            Callable | None: The state change callback, None if there is none.
+        """
+        return self._on_state_change
+    
+    @on_state_change.setter
+    def on_state_change(self, callback: Callable[[str], None] | None) -> None:
+        """
+        Set the prey's state change callback. Used to record the prey's state changes in the game's event log.
+        
+        Args:
+            callback (Callable | None): Called with the new state every time the prey changes state. None to remove it.
+        """
+        self._on_state_change = callback
             
     @classmethod
     def set_spawned_duration(cls, new_duration: int | float) -> None:
@@ -132,6 +206,32 @@ class Prey():
         """
         cls.NOSPAWN_DUR = new_duration
         
+    @classmethod
+    def _get_atlas(cls, key: tuple[str, int], image: pygame.Surface, sizes: tuple[int, ...], angle_step: int) -> RotationAtlas:
+        """
+        Get the rotation atlas of the given image, building it on first use.
+        Args:
+            key (tuple[str, int]): The name of the image's asset and its index in it.
+            image (pygame.Surface): The source image.
+            sizes (tuple[int, ...]): The pre-rendered sizes.
+            angle_step (int): The pre-rendered angle step in degrees.
+        """
+        atlas = cls._ATLASES.get(key)
+        if atlas is None:
+            atlas = RotationAtlas(image, sizes, angle_step)
+            cls._ATLASES[key] = atlas
+            cls._LOGGER.info(f"Prey rotation atlas with {len(sizes)} sizes and {360 // angle_step} angles built.")
+        return atlas
+        
+    def _blit_centered(self, surface: pygame.Surface, image: pygame.Surface) -> None:
+        """
+        Blit the given image centered on the prey's position.
+        Args:
+            surface (pygame.Surface): The surface to draw on.
+            image (pygame.Surface): The image to blit.
+        """
+        surface.blit(image, image.get_rect(center=self._position))
+        
     def _animate(self, progress: float, reverse: bool, dt: float) -> None:
         """
         Handles the animation of the prey (scaling and rotation) for spawn and despawn.
@@ -153,51 +253,46 @@ class Prey():
         # Calculate prey angle
         self._prey_angle = (self._prey_angle % 360) - Prey.ANIM_ROT_SPEED * rotation_vect * dt
         
-        # Animate prey aura if present
-        if self._aura_flag:
-            
-            # Calculate aura scale based on the prey scale vect
-            aura_scale = Prey.AURA_MAX_SCALE * scale_vect
-            aura = pygame.transform.smoothscale(self._aura_image, (aura_scale, aura_scale))
-            
-            # Calculate aura rotation angle
-            self._aura_angle = (self._aura_angle % 360) - Prey.AURA_ROT_SPEED * dt
-            
-            # Rotate aura based on the calculated angle and draw
-            rotated_aura = rot_center(aura, self._aura_angle, self._position)
-            self._screen.blit(rotated_aura[0], rotated_aura[1])
+        # Calculate aura scale based on the prey scale vect and rotate it
+        self._aura_scale = Prey.AURA_MAX_SCALE * scale_vect
+        self._rotate_aura(dt)
             
-        # Lastly draw the rotated prey
-        prey = pygame.transform.smoothscale(self._image, (self._scale, self._scale))
-        rotated_prey = rot_center(prey, self._prey_angle, self._position)
-        self._screen.blit(rotated_prey[0], rotated_prey[1])
-
-    def _draw_normal(self, dt: float) -> None:
+    def _rotate_aura(self, dt: float) -> None:
         """
-        Draws the prey and its aura (if present) in the normal (alive) state.
+        Rotates the prey's aura (if present).
         Args:
             dt (float): Delta time for frame-rate independent rotation.
         """
-        # Rotate and draw aura if present
         if self._aura_flag:
             self._aura_angle = (self._aura_angle % 360) - Prey.AURA_ROT_SPEED * dt
-            rotated_aura = rot_center(self._aura_image, self._aura_angle, self._position)
-            self._screen.blit(rotated_aura[0], rotated_aura[1])
             
-        # Draw prey
-        prey = pygame.transform.smoothscale(self._image, (Prey.MAX_SIZE + self._size_deviance, Prey.MAX_SIZE + self._size_deviance))
-        rotated_prey = rot_center(prey, self._prey_angle, self._position)
-        self._screen.blit(rotated_prey[0], rotated_prey[1])
+    def _log_state(self) -> None:
+        """
+        Logs the prey's current state, time and position.
+        """
+        if self._LOGGER.isEnabledFor(INFO):
+            position = self._position
+            self._LOGGER.info("Prey at time %.2fs, X %.2f Y %.2f changed state to %s.", self._frame.now, position.x, position.y, self._state)
+
+    def _state_changed(self) -> None:
+        """
+        Logs the prey's new state and calls back the state change callback, if there is one.
+        """
+        self._log_state()
+        if self._on_state_change is not None:
+            self._on_state_change(self._state)
 
-    def draw(self, dt: float) -> None:
+    def update(self, frame: FrameTime) -> None:
         """
-        Draws the prey on the screen, handling state transitions and animation using delta time (dt).
+        Updates the prey's state transitions and animation using the frame's delta time (dt). \n
+        Draws nothing, use render() for that.
         
         Args:
-            dt (float): Delta time in seconds since the last frame. Ensures frame-rate independent animation.
+            frame (FrameTime): The game timer snapshot for the current frame. Its dt ensures frame-rate independent animation.
         """
-        # Get current time and elapsed time in the current Prey state
-        now = self._game_timer.get_time()
+        # Get current time, delta time and elapsed time in the current Prey state
+        self._frame = frame
+        now, dt = frame.now, frame.dt
         elapsed = now - self._last_state_change
         
         # No spawn state
@@ -209,14 +304,7 @@ class Prey():
             # If it has, transition prey to spawning
             else: 
                 self.state = Prey._SPAWNING
-                
-                # Log the change
-                log_str = (
-                    f"Prey at time {self._game_timer.get_time():.2f}s, "
-                    f"X {self._position.x:.2f} Y {self._position.y:.2f} "
-                    f"changed state to {self._state}."
-                )
-                self._LOGGER.info(log_str)
+                self._state_changed()
 
         # Spawning state
         elif self._state == Prey._SPAWNING:
@@ -231,45 +319,22 @@ class Prey():
             else:
                 self.state = Prey._SPAWNED
                 
-                # Set the prey to be eatable and fix it to it's max size
+                # Set the prey to be eatable and fix it and its aura to their max size
                 self._eatable = True
                 self._scale = Prey.MAX_SIZE + self._size_deviance
-                
-                # Call draw normal method here to avoid flicker - 
-                # otherwise a draw method will be skipped in this call
-                self._draw_normal(dt=dt)
-                
-                # Log the change
-                log_str = (
-                    f"Prey at time {self._game_timer.get_time():.2f}s, "
-                    f"X {self._position.x:.2f} Y {self._position.y:.2f} "
-                    f"changed state to {self._state}."
-                )
-                self._LOGGER.info(log_str)
+                self._aura_scale = Prey.AURA_MAX_SCALE
+                self._rotate_aura(dt)
+                self._state_changed()
         
         # Spawned state
         elif self.state == Prey._SPAWNED:
+            self._rotate_aura(dt)
             
-            # If elapsed time is smaller than the alive duration draw prey
-            if elapsed <= Prey.SPAWNED_DUR:
-                self._draw_normal(dt=dt)
-            
-            # If its not, set new prey state to despawning
-            else:
+            # If elapsed time is bigger than the alive duration, set new prey state to despawning
+            if elapsed > Prey.SPAWNED_DUR:
                 self.state = Prey._DESPAWNING
                 self._eatable = False
-                
-                # Call draw normal method here to avoid flicker - 
-                # otherwise a draw method will be skipped in this call
-                self._draw_normal(dt=dt)
-                
-                # Log the change
-                log_str = (
-                    f"Prey at time {self._game_timer.get_time():.2f}s, "
-                    f"X {self._position.x:.2f} Y {self._position.y:.2f} "
-                    f"changed state to {self._state}."
-                )
-                self._LOGGER.info(log_str)
+                self._state_changed()
                 
         # Despawning state
         elif self.state == Prey._DESPAWNING:
@@ -283,27 +348,177 @@ class Prey():
             # If it has, reset the prey for next cycle
             else: self.reset_prey()
             
+    def render(self, surface: pygame.Surface) -> None:
+        """
+        Draws the prey and its aura (if present) on the given surface in their current scale and rotation. \n
+        Changes no prey state.
+        
+        Args:
+            surface (pygame.Surface): The surface to draw on.
+        """
+        # Nothing to draw while not spawned or at the very start of the spawn animation
+        if self._state == Prey._NOSPAWN or self._scale < 1:
+            return
+        
+        # Look up the scaled and rotated aura and draw
+        if self._aura_flag:
+            self._blit_centered(surface, self._aura_atlas.get(self._aura_scale, self._aura_angle))
+            
+        # Lastly draw the rotated prey
+        self._blit_centered(surface, self._atlas.get(self._scale, self._prey_angle))
+            
     def reset_prey(self) -> None:
         # Choose a new prey image and aura it if it's the first file (a sandwich)
-        self._image_index = randint(0, len(self._list_images) - 1)
+        self._image_index = self._rng.randint(0, len(self._list_images) - 1)
         self._image = self._list_images[self._image_index]
+        self._atlas = self._atlases[self._image_index]
         self._aura_flag = (self._image_index == 0)
         
         # Get a new random angle, screen position and size deviance
-        self._prey_angle = uniform(0, 360)
-        self._position = rand_screen_pos(self._screen)
-        self._size_deviance = uniform(-10, 10)
+        self._prey_angle = self._rng.uniform(0, 360)
+        self._position = rand_screen_pos(self._screen, self._rng)
+        self._size_deviance = self._rng.uniform(-10, 10)
+        if self._on_move is not None:
+            self._on_move(self.position)
         
         # Initial NOSPAWN Prey attributes
         self._state = Prey._NOSPAWN
-        self._last_state_change = self._game_timer.get_time()
+        self._last_state_change = self._frame.now
         self._eatable = False
         self._scale = 0
+        self._aura_scale = 0
         
         # Log the Prey init
-        log_str = (
-            f"Prey at time {self._game_timer.get_time():.2f}s, "
-            f"X {self._position.x:.2f} Y {self._position.y:.2f}, "
-            f"with state {self.state} initialized."
-        )
-        self._LOGGER.info(log_str) 
+        if self._LOGGER.isEnabledFor(INFO):
+            position = self._position
+            self._LOGGER.info("Prey at time %.2fs, X %.2f Y %.2f, with state %s initialized.", self._frame.now, position.x, position.y, self._state)
+        if self._on_state_change is not None:
+            self._on_state_change(self._state)
+
+class PreyView(Prey):
+    
+    # Store columns of every prey attribute the bulk update touches - name: (dtype, width)
+    STORE_COLUMNS = {
+        "position": (float, 2),
+        "state": (np.int8, 1),
+        "last_state_change": (float, 1),
+        "eatable": (bool, 1),
+        "aura": (bool, 1),
+        "size_deviance": (float, 1),
+        "scale": (float, 1),
+        "prey_angle": (float, 1),
+        "aura_scale": (float, 1),
+        "aura_angle": (float, 1),
+        "has_on_state_change": (bool, 1)
+    }
+    
+    # Prey attributes backed by the store
+    _position = StoreColumn("position")
+    _state = StoreColumn("state", enum=Prey.STATES)
+    _last_state_change = StoreColumn("last_state_change")
+    _eatable = StoreColumn("eatable")
+    _aura_flag = StoreColumn("aura")
+    _size_deviance = StoreColumn("size_deviance")
+    _scale = StoreColumn("scale")
+    _prey_angle = StoreColumn("prey_angle")
+    _aura_scale = StoreColumn("aura_scale")
+    _aura_angle = StoreColumn("aura_angle")
+    
+    def __init__(self, store: EntityStore, screen: pygame.Surface, game_timer: Timer, rng: random.Random,
+                 list_images:list[pygame.Surface], aura_image:pygame.Surface, frame: FrameTime | None = None,
+                 images_name: str = "prey_images") -> None:
+        """
+        A Prey whose state lives in a row of an EntityStore made with STORE_COLUMNS, so every prey of the store \n
+        can be stepped at once with update_all(). Behaves like a Prey otherwise.
+
+        Args:
+            store (EntityStore): The store the prey adds its row to.
+            screen (pygame.Surface): The game screen. Used for the spawn positions.
+            game_timer (Timer): The game timer. Its last snapshot is used until the first draw.
+            rng (random.Random): The game's gameplay RNG. Used for the image, angle, position and size of every spawn.
+            list_images (list[pygame.Surface]): List of prey images.
+            aura_image (pygame.Surface): The aura image.
+            frame (FrameTime | None): The frame the prey is created on. The game timer's last snapshot if None.
+            images_name (str): Name of the prey images, the key of their rotation atlases. Images with different contents need different names.
+        """
+        self._store = store
+        self._store_idx = store.add()
+        super().__init__(screen, game_timer, rng, list_images, aura_image, frame=frame, images_name=images_name)
+    
+    @Prey.on_state_change.setter
+    def on_state_change(self, callback: Callable[[str], None] | None) -> None:
+        """
+        Set the prey's state change callback. Used to record the prey's state changes in the game's event log. \n
+        Flagged in the store, so update_all() only calls back the preys that have a callback.
+        
+        Args:
+            callback (Callable | None): Called with the new state every time the prey changes state. None to remove it.
+        """
+        self._on_state_change = callback
+        self._store.columns["has_on_state_change"][self._store_idx] = callback is not None
+    
+    @classmethod
+    def update_all(cls, store: EntityStore, preys: Sequence["PreyView"], frame: FrameTime) -> None:
+        """
+        Bulk update() of every prey in the store. State timings and animations are stepped with array operations, \n
+        only the preys changing state are handled one by one (logs, callbacks and resets, in row order). \n
+        Same results as calling update() on every prey in order.
+        
+        Args:
+            store (EntityStore): The preys' store.
+            preys (Sequence[PreyView]): Every prey of the store, in row order.
+            frame (FrameTime): The game timer snapshot for the current frame.
+        """
+        for prey in preys:
+            prey._frame = frame
+        now, dt = frame.now, frame.dt
+        state, last_state_change, aura_angle = store["state"], store["last_state_change"], store["aura_angle"]
+        elapsed = now - last_state_change
+        SPAWNING, SPAWNED, DESPAWNING = (cls.STATES.index(name) for name in (Prey._SPAWNING, Prey._SPAWNED, Prey._DESPAWNING))
+        
+        # Masks of the update() branch every prey takes, all from the states before this update
+        to_spawning = (state == cls.STATES.index(Prey._NOSPAWN)) & (elapsed >= Prey.NOSPAWN_DUR)
+        spawning_anim = (state == SPAWNING) & (elapsed < Prey.ANIM_DUR)
+        to_spawned = (state == SPAWNING) & ~spawning_anim
+        spawned = state == SPAWNED
+        to_despawning = spawned & (elapsed > Prey.SPAWNED_DUR)
+        despawning_anim = (state == DESPAWNING) & (elapsed < Prey.ANIM_DUR)
+        to_reset = (state == DESPAWNING) & ~despawning_anim
+        
+        # Spawn and despawn animations - scale up/down and rotate, see _animate()
+        anim = spawning_anim | despawning_anim
+        if anim.any():
+            progress = elapsed[anim] / Prey.ANIM_DUR
+            reverse = despawning_anim[anim]
+            scale_vect = np.where(reverse, 1 - progress, progress)
+            rotation_vect = np.where(reverse, -1, 1)
+            store["scale"][anim] = (Prey.MAX_SIZE + store["size_deviance"][anim]) * scale_vect
+            store["prey_angle"][anim] = (store["prey_angle"][anim] % 360) - Prey.ANIM_ROT_SPEED * rotation_vect * dt
+            store["aura_scale"][anim] = Prey.AURA_MAX_SCALE * scale_vect
+        
+        # Fully spawned preys - eatable and fixed to their max size
+        store["eatable"][to_spawned] = True
+        store["scale"][to_spawned] = Prey.MAX_SIZE + store["size_deviance"][to_spawned]
+        store["aura_scale"][to_spawned] = Prey.AURA_MAX_SCALE
+        store["eatable"][to_despawning] = False
+        
+        # Aura rotation of every animating or spawned prey with an aura, see _rotate_aura()
+        rotate = (anim | to_spawned | spawned) & store["aura"]
+        aura_angle[rotate] = (aura_angle[rotate] % 360) - Prey.AURA_ROT_SPEED * dt
+        
+        # State transitions
+        state[to_spawning] = SPAWNING
+        state[to_spawned] = SPAWNED
+        state[to_despawning] = DESPAWNING
+        changed = to_spawning | to_spawned | to_despawning
+        last_state_change[changed] = now
+        if cls._LOGGER.isEnabledFor(INFO):
+            for idx in np.flatnonzero(changed):
+                preys[idx]._log_state()
+        
+        # State change callbacks and resets of the despawned preys for their next cycle, in row order like update() would
+        for idx in np.flatnonzero((changed & store["has_on_state_change"]) | to_reset):
+            if to_reset[idx]:
+                preys[idx].reset_prey()
+            else:
+                preys[idx]._on_state_change(preys[idx].state)
@@ -0,0 +1,249 @@
+from circle_nom.systems.logging import get_logger
+import threading
+import struct
+import pygame
+import mmap
+import zlib
+import os
+
+class AssetCache:
+    
+    # Entry kinds
+    _IMAGE = 0
+    _SOUND = 1
+    
+    # Longest sound kept in the cache in seconds - decoded PCM is many times larger than the compressed file
+    MAX_SOUND_SECONDS = 5.0
+    
+    # Binary format - little-endian header, an index entry per asset (fixed part followed by its key), then the data blobs
+    _MAGIC = b"CNAC"
+    _VERSION = 1
+    _HEADER = struct.Struct("<4sBIhBI")         # magic, version, mixer frequency, format and channels, entry count
+    _ENTRY = struct.Struct("<HBqQIIIQQ")        # key length, kind, source mtime (ns), size and CRC-32, width, height,
+                                                # data offset and length - width and height are 0 for sounds
+    
+    # Logger reference
+    _LOGGER = get_logger(name=__name__)
+    
+    def __init__(self, path: str, base_path: str) -> None:
+        """
+        Cache file of decoded assets - raw RGBA pixels of images and raw PCM samples of short sounds, keyed by their file. \n
+        The file is memory-mapped, cached images are built with pygame.image.frombuffer() straight from the mapping. \n
+        An entry is used while its source file keeps its size and its modification time or CRC-32, \n
+        sounds only while the mixer keeps the settings they were cached with. \n
+        Newly decoded assets are added with put_image() and put_sound() and written to the file by save().
+        
+        Args:
+            path (str): The cache file's path. A missing or unreadable file is rebuilt on save().
+            base_path (str): The folder asset paths are relative to in the cache keys - the cache stays valid when it moves, \n
+                like the temporary folder of a PyInstaller build.
+        """
+        self._path = path
+        self._base_path = base_path
+        self._mixer = pygame.mixer.get_init() or (0, 0, 0)
+        self._lock = threading.Lock()
+        
+        # Index of the cache file - key: (kind, mtime, size, crc, width, height, offset, length)
+        self._entries: dict[str, tuple[int, ...]] = {}
+        
+        # Assets added since the file was read - key: (kind, mtime, size, crc, width, height, data)
+        self._new: dict[str, tuple] = {}
+        self._mmap: mmap.mmap | None = None
+        self._open()
+    
+    @property
+    def path(self) -> str:
+        """The cache file's path."""
+        return self._path
+    
+    def __len__(self) -> int:
+        return len(self._entries.keys() | self._new.keys())
+    
+    def _open(self) -> None:
+        """Map the cache file and read its index. A missing, outdated or corrupted file is left to be rebuilt."""
+        self._entries.clear()
+        if not os.path.isfile(self._path) or os.path.getsize(self._path) < self._HEADER.size:
+            self._LOGGER.info(f"No asset cache at '{self._path}', it will be built.")
+            return
+        
+        with open(self._path, "rb") as file:
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        
+        try:
+            magic, version, *mixer, count = self._HEADER.unpack_from(self._mmap)
+            if magic != self._MAGIC or version != self._VERSION:
+                self._LOGGER.warning(f"Asset cache at '{self._path}' is not a version {self._VERSION} cache, it will be rebuilt.")
+                return
+            
+            offset = self._HEADER.size
+            for _ in range(count):
+                key_length, *entry = self._ENTRY.unpack_from(self._mmap, offset)
+                offset += self._ENTRY.size
+                key = self._mmap[offset:offset + key_length].decode("utf-8")
+                offset += key_length
+                if entry[-2] + entry[-1] > len(self._mmap):
+                    raise ValueError(f"Entry '{key}' is past the end of the file.")
+                
+                # Sounds decoded for other mixer settings are dropped
+                if entry[0] == self._SOUND and tuple(mixer) != self._mixer:
+                    continue
+                self._entries[key] = tuple(entry)
+        
+        except (struct.error, UnicodeDecodeError, ValueError) as error:
+            self._LOGGER.warning(f"Asset cache at '{self._path}' is corrupted, it will be rebuilt: {error}")
+            self._entries.clear()
+            return
+        
+        self._LOGGER.info(f"Asset cache with {len(self._entries)} entries loaded from '{self._path}'.")
+    
+    def _key(self, path: str) -> str:
+        return os.path.relpath(path, self._base_path).replace(os.sep, "/")
+    
+    @staticmethod
+    def _crc(path: str) -> int:
+        with open(path, "rb") as file:
+            return zlib.crc32(file.read())
+    
+    def _get(self, path: str, kind: int) -> tuple[tuple[int, ...], memoryview] | None:
+        """
+        The file's entry and a view of its data if it's cached and still matches its source file, None otherwise. \n
+        The entry and its view come from the same mapping - a save() in between drops the entry instead of mixing files.
+        """
+        with self._lock:
+            entry = self._entries.get(self._key(path))
+            mapping = self._mmap
+        if entry is None or entry[0] != kind or mapping is None:
+            return None
+        
+        # Same size and modification time, or the same contents
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        if stat.st_size != entry[2]:
+            return None
+        if stat.st_mtime_ns != entry[1] and self._crc(path) != entry[3]:
+            return None
+        
+        # Viewed under the lock, while the mapping is still the open one - save() can't close it under the view
+        with self._lock:
+            if self._mmap is not mapping:
+                return None
+            offset, length = entry[6:]
+            return entry, memoryview(mapping)[offset:offset + length]
+    
+    def get_image(self, path: str) -> pygame.Surface | None:
+        """
+        Get the cached image of the given file. The surface uses the mapped cache file's memory - convert or copy it \n
+        to keep it past the next save(). Thread safe.
+        
+        Args:
+            path (str): The image's resolved path.
+        
+        Returns:
+            pygame.Surface | None: The 32-bit RGBA image, None if it's not cached or its file changed.
+        """
+        cached = self._get(path, self._IMAGE)
+        if cached is None:
+            return None
+        entry, data = cached
+        return pygame.image.frombuffer(data, entry[4:6], "RGBA")
+    
+    def get_sound(self, path: str) -> pygame.mixer.Sound | None:
+        """
+        Get the cached sound of the given file. Thread safe.
+        
+        Args:
+            path (str): The sound's resolved path.
+        
+        Returns:
+            pygame.mixer.Sound | None: The sound, None if it's not cached, its file changed or the mixer settings did.
+        """
+        cached = self._get(path, self._SOUND)
+        if cached is None:
+            return None
+        return pygame.mixer.Sound(buffer=cached[1])
+    
+    def _put(self, path: str, kind: int, size: tuple[int, int], data: bytes) -> None:
+        stat = os.stat(path)
+        entry = (kind, stat.st_mtime_ns, stat.st_size, self._crc(path), *size, data)
+        with self._lock:
+            self._new[self._key(path)] = entry
+    
+    def put_image(self, path: str, image: pygame.Surface) -> None:
+        """
+        Add a decoded image to the cache, written on the next save(). Thread safe.
+        
+        Args:
+            path (str): The image's resolved path.
+            image (pygame.Surface): The image as loaded from the file, before any conversion.
+        """
+        self._put(path, self._IMAGE, image.get_size(), pygame.image.tobytes(image, "RGBA"))
+    
+    def put_sound(self, path: str, sound: pygame.mixer.Sound) -> None:
+        """
+        Add a decoded sound to the cache, written on the next save(). Sounds longer than MAX_SOUND_SECONDS are skipped. Thread safe.
+        
+        Args:
+            path (str): The sound's resolved path.
+            sound (pygame.mixer.Sound): The sound as loaded from the file.
+        """
+        if sound.get_length() <= self.MAX_SOUND_SECONDS:
+            self._put(path, self._SOUND, (0, 0), sound.get_raw())
+    
+    def save(self) -> None:
+        """
+        Write the cache file again with the assets added since it was read. Does nothing if none were. \n
+        Entries of deleted source files are dropped. The file is replaced at once, a failed save keeps the old one.
+        """
+        with self._lock:
+            if not self._new:
+                return
+            
+            # Kept entries with their data in the old file, then the new ones
+            blobs: list[tuple[str, tuple[int, ...], bytes | memoryview]] = []
+            for key, entry in self._entries.items():
+                if key not in self._new and os.path.exists(os.path.join(self._base_path, key)):
+                    blobs.append((key, entry[:6], memoryview(self._mmap)[entry[6]:entry[6] + entry[7]]))
+            for key, entry in self._new.items():
+                blobs.append((key, entry[:6], entry[6]))
+            
+            temp_path = f"{self._path}.tmp"
+            try:
+                if os.path.dirname(self._path):
+                    os.makedirs(os.path.dirname(self._path), exist_ok=True)
+                with open(temp_path, "wb") as file:
+                    file.write(self._HEADER.pack(self._MAGIC, self._VERSION, *self._mixer, len(blobs)))
+                    
+                    # Index - data offsets start after the last entry
+                    offset = self._HEADER.size + sum(self._ENTRY.size + len(key.encode("utf-8")) for key, _, _ in blobs)
+                    for key, entry, data in blobs:
+                        key_bytes = key.encode("utf-8")
+                        file.write(self._ENTRY.pack(len(key_bytes), *entry, offset, len(data)))
+                        file.write(key_bytes)
+                        offset += len(data)
+                    for _, _, data in blobs:
+                        file.write(data)
+                blobs.clear()
+                
+                # Unmap the old file before replacing it - surfaces still using it keep it mapped, which only Windows refuses
+                if self._mmap is not None:
+                    try:
+                        self._mmap.close()
+                    except BufferError:
+                        pass
+                    self._mmap = None
+                os.replace(temp_path, self._path)
+            
+            except OSError as error:
+                self._LOGGER.warning(f"Asset cache could not be saved at '{self._path}': {error}")
+                if os.path.exists(temp_path):
+                    os.remove(temp_path)
+                return
+            
+            count = len(self._new)
+            self._new.clear()
+            self._LOGGER.info(f"Asset cache with {count} new entries saved at '{self._path}'.")
+        
+            # Reopened under the lock, so getters never pair the new mapping with an entry of the old file
+            self._open()
@@ -1,4 +1,11 @@
+from circle_nom.systems.asset_cache import AssetCache
+from circle_nom.helpers.config_reader import ConfigReader
 from circle_nom.systems.logging import get_logger
+from concurrent.futures import ThreadPoolExecutor
+from typing import IO, Any, Callable
+from functools import partial
+import threading
+import atexit
 import pygame
 import sys
 import os
@@ -9,6 +16,16 @@ class AssetLoader:
     # Logger reference
     _LOGGER = get_logger(name=__name__)
     
+    # Decode threads shared by every loader - file reads and most of the image/sound decoding release the GIL,
+    # so whole folders are decoded in parallel. One more than the cores, so a read waiting on the disk leaves no core idle
+    DECODE_WORKERS = min(8, (os.cpu_count() or 1) + 1)
+    _pool: ThreadPoolExecutor | None = None
+    _pool_lock = threading.Lock()
+    
+    # Cache of decoded images and sounds shared by every loader, opened on the first load - see AssetCache
+    _cache: AssetCache | None = None
+    _cache_opened = False
+    
     def __init__(self) -> None:
         """Initializes the AssetLoader, used for loading every asset in the game."""
         self.total_assets_loaded = 0
@@ -90,34 +107,107 @@ class AssetLoader:
         
         return tuple([resolved_path for _ in range(num)])
 
-    def load_image(self, path: str) -> pygame.Surface:
+    def _convert(self, image: pygame.Surface) -> pygame.Surface:
         """
-        Safely try to load an image with pygame.
+        Convert the image to the display's pixel format for faster blits. \n
+        Without a display mode set (headless runs) the image is returned as it was loaded.
+        """
+        if pygame.display.get_surface() is None:
+            return image
+        return image.convert_alpha()
+
+    def _get_cache(self) -> AssetCache | None:
+        """Open the asset cache on first use, saved again when the game exits. None if it's turned off in the config."""
+        cls = type(self)
+        with cls._pool_lock:
+            if not cls._cache_opened:
+                cls._cache_opened = True
+                path = ConfigReader.get_asset_cache()
+                if path is not None:
+                    cls._cache = AssetCache(str(path), self.resource_path(""))
+                    atexit.register(cls._cache.save)
+        return cls._cache
+    
+    def save_cache(self) -> None:
+        """Write the images and sounds decoded since the asset cache was opened to its file, for faster loading next time."""
+        if self._cache is not None:
+            self._cache.save()
+
+    @staticmethod
+    def _decode_image(cache: AssetCache | None, path: str) -> pygame.Surface:
+        """Decode an image from its resolved path, from the asset cache if it's there and added to it otherwise."""
+        if cache is None:
+            return pygame.image.load(path)
+        image = cache.get_image(path)
+        if image is None:
+            image = pygame.image.load(path)
+            cache.put_image(path, image)
+            
+        # Cached images use the cache file's memory, which headless runs keep as they are
+        elif pygame.display.get_surface() is None:
+            image = image.copy()
+        return image
+    
+    @staticmethod
+    def _decode_sound(cache: AssetCache | None, path: str) -> pygame.mixer.Sound:
+        """Decode a sound from its resolved path, from the asset cache if it's there and added to it otherwise."""
+        if cache is None:
+            return pygame.mixer.Sound(path)
+        sound = cache.get_sound(path)
+        if sound is None:
+            sound = pygame.mixer.Sound(path)
+            cache.put_sound(path, sound)
+        return sound
+
+    @classmethod
+    def _decode_all(cls, decode: Callable[[str], Any], paths: tuple[str, ...]) -> list[Callable[[], Any]]:
+        """
+        Start decoding every given file at once on the decode threads.
+        
+        Args:
+            decode (Callable): Decodes a file from its resolved path, like pygame.image.load.
+            paths (tuple[str, ...]): The resolved file paths.
+        
+        Returns:
+            list[Callable]: Waits for the decode of the file at the same index and returns it, or raises its error.
+        """
+        if cls.DECODE_WORKERS < 2 or len(paths) < 2:
+            return [lambda path=path: decode(path) for path in paths]
+        with cls._pool_lock:
+            if cls._pool is None:
+                cls._pool = ThreadPoolExecutor(max_workers=cls.DECODE_WORKERS, thread_name_prefix="AssetDecode")
+        return [cls._pool.submit(decode, path).result for path in paths]
+    
+    def _finish_image(self, path: str, decoded: Callable[[], pygame.Surface]) -> pygame.Surface:
+        """
+        Convert a decoded image on the calling (main) thread, or load a placeholder if its file was not found.
         
         Args:
             path (str): The path to the image.
+            decoded (Callable): Returns the decoded image.
         """
         try:
             abs_path = self.resource_path(path)
-            image = pygame.image.load(abs_path).convert_alpha()
+            image = self._convert(decoded())
             self._LOGGER.info(f"Image file at '{abs_path}' loaded successfully.")
             self.total_assets_loaded += 1
             return image
         
         except FileNotFoundError:
             self._LOGGER.warning(f"Image at '{path}' not found! Loading a placeholder.")
-            return pygame.image.load(self.resource_path(self.add_placeholders(1, 'IMAGE')[0])).convert_alpha()
+            return self._convert(pygame.image.load(self.resource_path(self.add_placeholders(1, 'IMAGE')[0])))
         
-    def load_sound(self, path: str) -> pygame.mixer.Sound:
+    def _finish_sound(self, path: str, decoded: Callable[[], pygame.mixer.Sound]) -> pygame.mixer.Sound:
         """
-        Safely try to load a sound with pygame.
+        Get a decoded sound, or load a placeholder if its file was not found.
         
         Args:
             path (str): The path to the sound.
+            decoded (Callable): Returns the decoded sound.
         """
         try:
             abs_path = self.resource_path(path)
-            sound = pygame.mixer.Sound(abs_path)
+            sound = decoded()
             self._LOGGER.info(f"Sound file at '{abs_path}' loaded successfully.")
             self.total_assets_loaded += 1
             return sound
@@ -125,17 +215,42 @@ class AssetLoader:
         except FileNotFoundError:
             self._LOGGER.warning(f"Sound at '{path}' not found! Loading a placeholder.")
             return pygame.mixer.Sound(self.resource_path(self.add_placeholders(1, 'SOUND')[0]))
+
+    def load_image(self, path: str) -> pygame.Surface:
+        """
+        Safely try to load an image with pygame.
+        
+        Args:
+            path (str): The path to the image.
+        """
+        cache = self._get_cache()
+        return self._finish_image(path, lambda: self._decode_image(cache, self.resource_path(path)))
         
-    def load_music(self, path: str) -> None:
+    def load_sound(self, path: str) -> pygame.mixer.Sound:
+        """
+        Safely try to load a sound with pygame.
+        
+        Args:
+            path (str): The path to the sound.
+        """
+        cache = self._get_cache()
+        return self._finish_sound(path, lambda: self._decode_sound(cache, self.resource_path(path)))
+        
+    def load_music(self, path: str, file: IO[bytes] | None = None) -> None:
         """
         Safely try to load a music with pygame.
         
         Args:
             path (str): The path to the music.
+            file (IO[bytes] | None): Optional file object with the music file's contents, streamed instead of opening the path. \n
+                Must stay open while the music plays.
         """
         try:
             abs_path = self.resource_path(path)
-            music = pygame.mixer.music.load(abs_path)
+            if file is None:
+                music = pygame.mixer.music.load(abs_path)
+            else:
+                music = pygame.mixer.music.load(file, os.path.splitext(abs_path)[1].lstrip("."))
             self._LOGGER.info(f"Music file at '{abs_path}' loaded successfully.")
             self.total_assets_loaded += 1
             return music
@@ -146,57 +261,55 @@ class AssetLoader:
             
     def load_images(self, paths: tuple[str, ...], count: int | None = None) -> tuple[pygame.Surface]:
         """
-        Load pygame images from a list of paths. Optionally ensures a specific count of images.
+        Load pygame images from a list of paths. Optionally ensures a specific count of images. \n
+        Every file is decoded at once on the decode threads, only the conversion to the display format runs on this thread.
         
         Args:
             paths (list[str]): The image file paths list.
             count (int): Optional expected image count. If actual count is lower, appends placeholder/s.
         """
-        images = []
+        paths = tuple(self.resource_path(path) for path in paths)
         actual_count = len(paths)
         
-        # Load actual images
-        images.extend(self.load_image(self.resource_path(path)) for path in paths)
-        
         # Add placeholders if needed
         if count:
             
             if count > actual_count:
                 self._LOGGER.warning(f"Image files count lower than expected! Adding {count - actual_count} placeholder/s.")
-                # images.extend(load_image(path) for path in add_placeholders(count - actual_count, 'IMAGE')) # non recursive variant
-                images.extend(self.load_images(self.add_placeholders(count - actual_count, 'IMAGE')))
+                paths += self.add_placeholders(count - actual_count, 'IMAGE')
                 
             elif count < actual_count:
                 self._LOGGER.warning(f"Image files count higher than expected: {actual_count} / {count}!")
         
-        return tuple(images)
+        # Decode in parallel, convert in order
+        decoded = self._decode_all(partial(self._decode_image, self._get_cache()), paths)
+        return tuple(self._finish_image(path, result) for path, result in zip(paths, decoded))
 
     def load_sounds(self, paths: tuple[str, ...], count: int | None = None) -> tuple[pygame.mixer.Sound]:
         """
-        Load pygame sounds from a list of paths. Optionally ensures a specific count of sounds.
+        Load pygame sounds from a list of paths. Optionally ensures a specific count of sounds. \n
+        Every file is decoded at once on the decode threads.
         
         Args:
             paths (list[str]): The sound file paths list.
             count (int): Optional expected sounds count. If actual count is lower, appends placeholder/s.
         """
-        sounds = []
+        paths = tuple(self.resource_path(path) for path in paths)
         actual_count = len(paths)
         
-        # Load actual sounds
-        sounds.extend(self.load_sound(self.resource_path(path)) for path in paths)
-        
         # Add placeholders if needed
         if count:
             
             if count > actual_count:
                 self._LOGGER.warning(f"Sound files count lower than expected! Adding {count - actual_count} placeholder/s.")
-                # sounds.extend(load_sound(path) for path in add_placeholders(count - actual_count, 'SOUND')) # non recursive variant
-                sounds.extend(self.load_sounds(self.add_placeholders(count - actual_count, 'SOUND')))
+                paths += self.add_placeholders(count - actual_count, 'SOUND')
                 
             elif count < actual_count:
                 self._LOGGER.warning(f"Sound files count higher than expected: {actual_count} / {count}!")
         
-        return tuple(sounds)
+        # Decode in parallel, collect in order
+        decoded = self._decode_all(partial(self._decode_sound, self._get_cache()), paths)
+        return tuple(self._finish_sound(path, result) for path, result in zip(paths, decoded))
 
     def load_playlist(self, paths: tuple[str, ...], count: int | None = None) -> tuple[tuple[str, str]]:
         """
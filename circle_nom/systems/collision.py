@@ -0,0 +1,249 @@
+from circle_nom.systems.entity_store import EntityStore
+from circle_nom.systems.spatial_hash import SpatialHash
+from circle_nom.systems.logging import get_logger
+from typing import Iterator, Sequence
+from functools import partial
+from itertools import chain
+import numpy as np
+
+class CollisionSystem:
+    
+    # Logger reference
+    _LOGGER = get_logger(name=__name__)
+    
+    # Broadphases - how the candidate pairs are found, see __init__
+    LOOP = "loop"
+    ARRAY = "array"
+    GRID = "grid"
+    
+    # Minimum Player x entity pairs for the grid broadphase - below it the cell bookkeeping costs more than plain loops
+    GRID_MIN_PAIRS = 512
+    
+    # Grid cell size in pixels - about the largest Player tolerance, so a query covers a few cells
+    GRID_CELL_SIZE = 128
+    
+    def __init__(self, players: Sequence, preys: Sequence, daggers: Sequence, broadphase: str | None = None,
+                 prey_store: EntityStore | None = None, dagger_store: EntityStore | None = None) -> None:
+        """
+        Eat and hit checks between every Player and every Prey or Dagger. \n
+        A pair collides when the entity is within the Player's tolerance on both axes, like the math.isclose checks it replaces. \n
+        Their relative tolerance is left out - it is under a millionth of a pixel for on screen positions, far below any tolerance. \n
+        Every broadphase yields the same pairs in the same order, they only differ in speed:
+        - LOOP: plain loops over every pair. Fastest for the few entities of the regular play modes.
+        - GRID: Preys and Daggers are kept in spatial hashes, updated by their on_move callbacks as they move. \n
+        Only the entities in the grid cells around a Player are checked, so the cost grows with the entities near the Players. \n
+        Picked for games with GRID_MIN_PAIRS or more Player x entity pairs.
+        - ARRAY: positions, tolerances and flags are copied into NumPy arrays once per frame with sync(), \n
+        then all pairs are checked in one array operation. Copying every entity each frame costs more than the grid saves, \n
+        so it's only used when asked for - or when the Preys and Daggers live in entity stores, \n
+        whose columns are read in place with no copying at all.
+        
+        Args:
+            players (Sequence[Player]): The game's Players.
+            preys (Sequence[Prey]): The game's Preys.
+            daggers (Sequence[Dagger]): The game's Daggers.
+            broadphase (str | None): One of the broadphase consts. If None it's picked from the entity counts.
+            prey_store (EntityStore | None): The Preys' entity store, if they are PreyViews of one.
+            dagger_store (EntityStore | None): The Daggers' entity store, if they are DaggerViews of one.
+        """
+        self._players = players
+        self._preys = preys
+        self._daggers = daggers
+        self._prey_store = prey_store
+        self._dagger_store = dagger_store
+        
+        # Pick the broadphase from the entity stores and counts if not given
+        if broadphase is None and prey_store is not None and dagger_store is not None:
+            broadphase = self.ARRAY
+        elif broadphase is None:
+            broadphase = self.GRID if len(players) * (len(preys) + len(daggers)) >= self.GRID_MIN_PAIRS else self.LOOP
+        if broadphase not in (self.LOOP, self.ARRAY, self.GRID):
+            self._LOGGER.error(f"Invalid collision broadphase '{broadphase}'.")
+            raise ValueError(f"Invalid collision broadphase '{broadphase}'.")
+        self._broadphase = broadphase
+        
+        # Player arrays - eat and hit positions, their tolerances and whether the Player can eat
+        self._eat_pos = np.empty((len(players), 2))
+        self._eat_tol = np.empty((len(players), 1))
+        self._hit_pos = np.empty((len(players), 2))
+        self._hit_tol = np.empty((len(players), 1))
+        self._can_eat = np.empty((len(players), 1), dtype=bool)
+        
+        # Prey and Dagger arrays
+        self._prey_pos = np.empty((len(preys), 2))
+        self._eatable = np.empty(len(preys), dtype=bool)
+        self._dagger_pos = np.empty((len(daggers), 2))
+        
+        # Grid broadphase - the models move their keys in the hashes themselves, no per frame sync needed
+        if self._broadphase == self.GRID:
+            self._prey_grid = SpatialHash(self.GRID_CELL_SIZE)
+            self._dagger_grid = SpatialHash(self.GRID_CELL_SIZE)
+            for grid, entities in ((self._prey_grid, preys), (self._dagger_grid, daggers)):
+                for idx, entity in enumerate(entities):
+                    entity.on_move = partial(grid.move, idx)
+                    grid.move(idx, entity.position)
+        
+        self._LOGGER.info(
+            f"Collision system for {len(players)} players, {len(preys)} preys and {len(daggers)} daggers "
+            f"initialized successfully, broadphase {self._broadphase}."
+        )
+    
+    @property
+    def broadphase(self) -> str:
+        """The broadphase in use, one of the broadphase consts."""
+        return self._broadphase
+    
+    def _sync_player(self, idx: int) -> None:
+        player = self._players[idx]
+        self._eat_pos[idx] = player.eat_pos.x, player.eat_pos.y
+        self._eat_tol[idx] = player.eat_tol
+        self._hit_pos[idx] = player.hit_pos.x, player.hit_pos.y
+        self._hit_tol[idx] = player.hit_tol
+        self._can_eat[idx] = player.can_eat
+    
+    def _sync_prey(self, idx: int) -> None:
+        if self._prey_store is not None:
+            return
+        prey = self._preys[idx]
+        self._prey_pos[idx] = prey.position.x, prey.position.y
+        self._eatable[idx] = prey.eatable
+    
+    def _sync_dagger(self, idx: int) -> None:
+        if self._dagger_store is not None:
+            return
+        dagger = self._daggers[idx]
+        self._dagger_pos[idx] = dagger.position.x, dagger.position.y
+    
+    def sync(self) -> None:
+        """Copy the current state of every model into the arrays. Must be called after the models update, before the checks."""
+        if self._broadphase != self.ARRAY:
+            return
+        
+        for idx in range(len(self._players)):
+            self._sync_player(idx)
+        
+        # Store columns are used as they are - they are the models' state, not a copy of it
+        if self._prey_store is not None:
+            self._prey_pos = self._prey_store["position"]
+            self._eatable = self._prey_store["eatable"]
+        
+        # Otherwise one flat conversion per attribute - Vector2s unpack to x, y much faster than a row assignment per entity
+        else:
+            self._prey_pos.reshape(-1)[:] = np.fromiter(
+                chain.from_iterable([prey.position for prey in self._preys]), float, self._prey_pos.size
+            )
+            self._eatable[:] = np.fromiter([prey.eatable for prey in self._preys], bool, self._eatable.size)
+        
+        if self._dagger_store is not None:
+            self._dagger_pos = self._dagger_store["position"]
+        else:
+            self._dagger_pos.reshape(-1)[:] = np.fromiter(
+                chain.from_iterable([dagger.position for dagger in self._daggers]), float, self._dagger_pos.size
+            )
+    
+    @staticmethod
+    def _in_range(pos: np.ndarray, entity_pos: np.ndarray, tol: np.ndarray) -> np.ndarray:
+        """
+        (players, entities) mask of the entities within the Player's tolerance on both axes. Entities at infinity never are. \n
+        Axes are compared separately - a max over the 2 wide axis is many times slower than two comparisons.
+        """
+        return (np.abs(pos[:, 0, None] - entity_pos[:, 0]) <= tol) & (np.abs(pos[:, 1, None] - entity_pos[:, 1]) <= tol)
+    
+    def _eat_mask(self, players: slice, preys: slice) -> np.ndarray:
+        """Mask of the Player and Prey pairs that can eat, for the given Player rows and Prey columns."""
+        in_range = self._in_range(self._eat_pos[players], self._prey_pos[preys], self._eat_tol[players])
+        return in_range & self._eatable[preys] & self._can_eat[players]
+    
+    def _hit_mask(self, players: slice, daggers: slice) -> np.ndarray:
+        """Mask of the Player and Dagger pairs that hit, for the given Player rows and Dagger columns."""
+        return self._in_range(self._hit_pos[players], self._dagger_pos[daggers], self._hit_tol[players])
+    
+    @staticmethod
+    def _pairs(get_mask, on_pair) -> Iterator[tuple[int, int]]:
+        """
+        Yield the colliding pairs of a mask in Player then entity order, the order of the old nested loops. \n
+        The caller resolves each pair before the next one is searched for. Resolving changes the pair's models, \n
+        so they are synced again and only the pair's Player row and entity column are checked again.
+        """
+        mask = get_mask(slice(None), slice(None))
+        flat = mask.reshape(-1)
+        start = 0
+        while start < flat.size:
+            first = start + int(flat[start:].argmax())
+            if not flat[first]:
+                return
+            
+            player_idx, entity_idx = divmod(first, mask.shape[1])
+            yield player_idx, entity_idx
+            on_pair(player_idx, entity_idx)
+            mask[player_idx] = get_mask(slice(player_idx, player_idx + 1), slice(None))[0]
+            mask[:, entity_idx] = get_mask(slice(None), slice(entity_idx, entity_idx + 1))[:, 0]
+            start = first + 1
+    
+    def _loop_eat_pairs(self) -> Iterator[tuple[int, int]]:
+        """Plain loop version of eat_pairs() for small games."""
+        for player_idx, player in enumerate(self._players):
+            for prey_idx, prey in enumerate(self._preys):
+                if prey.eatable and player.can_eat and \
+                    abs(player.eat_pos.x - prey.position.x) <= player.eat_tol and \
+                        abs(player.eat_pos.y - prey.position.y) <= player.eat_tol:
+                    yield player_idx, prey_idx
+    
+    def _loop_hit_pairs(self) -> Iterator[tuple[int, int]]:
+        """Plain loop version of hit_pairs() for small games."""
+        for player_idx, player in enumerate(self._players):
+            for dagger_idx, dagger in enumerate(self._daggers):
+                if abs(player.hit_pos.x - dagger.position.x) <= player.hit_tol and \
+                    abs(player.hit_pos.y - dagger.position.y) <= player.hit_tol:
+                    yield player_idx, dagger_idx
+    
+    def _grid_eat_pairs(self) -> Iterator[tuple[int, int]]:
+        """Grid version of eat_pairs() for games with many entities."""
+        for player_idx, player in enumerate(self._players):
+            if not player.can_eat:
+                continue
+            for prey_idx in sorted(self._prey_grid.query(player.eat_pos, player.eat_tol)):
+                prey = self._preys[prey_idx]
+                if prey.eatable and player.can_eat and \
+                    abs(player.eat_pos.x - prey.position.x) <= player.eat_tol and \
+                        abs(player.eat_pos.y - prey.position.y) <= player.eat_tol:
+                    yield player_idx, prey_idx
+    
+    def _grid_hit_pairs(self) -> Iterator[tuple[int, int]]:
+        """Grid version of hit_pairs() for games with many entities."""
+        for player_idx, player in enumerate(self._players):
+            for dagger_idx in sorted(self._dagger_grid.query(player.hit_pos, player.hit_tol)):
+                dagger = self._daggers[dagger_idx]
+                if abs(player.hit_pos.x - dagger.position.x) <= player.hit_tol and \
+                    abs(player.hit_pos.y - dagger.position.y) <= player.hit_tol:
+                    yield player_idx, dagger_idx
+    
+    def eat_pairs(self) -> Iterator[tuple[int, int]]:
+        """
+        Yield the (player index, prey index) pairs where the Player eats the Prey, in Player then Prey order. \n
+        The Player's eat position is within its eat tolerance of the Prey on both axes, the Prey is eatable and the Player can eat.
+        """
+        if self._broadphase == self.LOOP:
+            return self._loop_eat_pairs()
+        if self._broadphase == self.GRID:
+            return self._grid_eat_pairs()
+        
+        def on_pair(player_idx: int, prey_idx: int) -> None:
+            self._sync_player(player_idx)
+            self._sync_prey(prey_idx)
+        return self._pairs(self._eat_mask, on_pair)
+    
+    def hit_pairs(self) -> Iterator[tuple[int, int]]:
+        """
+        Yield the (player index, dagger index) pairs where the Dagger hits the Player, in Player then Dagger order. \n
+        The Player's hit position is within its hit tolerance of the Dagger on both axes.
+        """
+        if self._broadphase == self.LOOP:
+            return self._loop_hit_pairs()
+        if self._broadphase == self.GRID:
+            return self._grid_hit_pairs()
+        
+        def on_pair(player_idx: int, dagger_idx: int) -> None:
+            self._sync_player(player_idx)
+            self._sync_dagger(dagger_idx)
+        return self._pairs(self._hit_mask, on_pair)
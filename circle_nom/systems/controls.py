@@ -0,0 +1,143 @@
+from circle_nom.systems.logging import get_logger
+from typing import Iterable
+import pygame
+
+class KeyState:
+    
+    def __init__(self, pressed: Iterable[int] = ()) -> None:
+        """
+        Scripted keyboard state. A drop-in for the pygame.key.get_pressed() result, \n
+        used to drive the players without a keyboard (headless runs, bots, replays).
+        
+        Args:
+            pressed (Iterable[int]): Pygame key constants that start pressed.
+        """
+        self._pressed: set[int] = set(pressed)
+    
+    def __getitem__(self, key: int) -> bool:
+        return key in self._pressed
+    
+    @property
+    def pressed(self) -> frozenset[int]:
+        """The currently pressed pygame key constants."""
+        return frozenset(self._pressed)
+    
+    def press(self, *keys: int) -> None:
+        """Press the given keys. Already pressed keys stay pressed."""
+        self._pressed.update(keys)
+    
+    def release(self, *keys: int) -> None:
+        """Release the given keys. Keys that are not pressed are ignored."""
+        self._pressed.difference_update(keys)
+    
+    def clear(self) -> None:
+        """Release every key."""
+        self._pressed.clear()
+
+# Anything indexable by pygame key constants, as read by player_utils.control_movement
+KeyInput = pygame.key.ScancodeWrapper | KeyState
+
+def keyboard(game, frame) -> KeyInput:
+    """
+    Default input source of the engine, reads the real keyboard.
+    
+    Args:
+        game (CircleNom): The game asking for input. Unused.
+        frame (FrameTime): The frame the input is for. Unused.
+    """
+    return pygame.key.get_pressed()
+
+class ChaseBot:
+    
+    # Logger reference
+    _LOGGER = get_logger(name=__name__)
+    
+    # Distance in pixels under which the bot stops correcting an axis
+    DEADZONE = 5
+    
+    # Extra distance in pixels the bot keeps from a dagger's flight line
+    DODGE_MARGIN = 40
+    
+    def __init__(self, reaction_time: float = 0.15, dodge: bool = True) -> None:
+        """
+        Scripted singleplayer bot, usable as the engine's input source. Heads for the closest eatable Prey \n
+        and steps out of the flight line of incoming Daggers. Like a human it only reacts every reaction_time seconds \n
+        and holds its keys in between.
+        
+        Args:
+            reaction_time (float): Seconds between decisions.
+            dodge (bool): Dodge incoming Daggers. Dodging has priority over eating.
+        """
+        if reaction_time < 0:
+            self._LOGGER.error("Invalid bot reaction time.")
+            raise ValueError("Invalid bot reaction time.")
+        
+        self._reaction_time = reaction_time
+        self._dodge = dodge
+        self._keys = KeyState()
+        self._last_decision = float('-inf')
+    
+    def __call__(self, game, frame) -> KeyState:
+        # Hold the keys until the next decision
+        if frame.now - self._last_decision < self._reaction_time:
+            return self._keys
+        self._last_decision = frame.now
+        
+        player = game.tuple_players[0]
+        direction = self._dodge_direction(game, player, frame.now) if self._dodge else None
+        if direction is None:
+            direction = self._chase_direction(game, player)
+        
+        # Translate the direction to WASD presses
+        self._keys.clear()
+        if direction is not None:
+            dx, dy = direction
+            if dx: self._keys.press(pygame.K_d if dx > 0 else pygame.K_a)
+            if dy: self._keys.press(pygame.K_s if dy > 0 else pygame.K_w)
+        return self._keys
+    
+    def _chase_direction(self, game, player) -> tuple[int, int] | None:
+        """
+        Get the direction from the player's eat position to the closest eatable Prey. None if there is no such Prey.
+        """
+        preys = [prey for prey in game.tuple_preys if prey.eatable]
+        if not preys:
+            return None
+        
+        target = min(preys, key=lambda prey: player.eat_pos.distance_squared_to(prey.position)).position
+        offset = target - player.eat_pos
+        return (
+            0 if abs(offset.x) < self.DEADZONE else (1 if offset.x > 0 else -1),
+            0 if abs(offset.y) < self.DEADZONE else (1 if offset.y > 0 else -1)
+        )
+    
+    def _dodge_direction(self, game, player, now: float) -> tuple[int, int] | None:
+        """
+        Get the direction out of the flight line of the first flying Dagger headed at the player. None if there is no such Dagger.
+        """
+        pos = player.hit_pos
+        width, height = game.screen.width, game.screen.height
+        for dagger in game.tuple_daggers:
+            if not dagger.spawn_timestamp <= now < dagger.despawn_timestamp:
+                continue
+            
+            # Angles 0 and 180 fly up and down, 90 and 270 fly left and right
+            vertical = dagger.angle in (0, 180)
+            if vertical:
+                lane_offset = pos.x - dagger.position.x
+                incoming = dagger.position.y > pos.y if dagger.angle == 0 else dagger.position.y < pos.y
+            else:
+                lane_offset = pos.y - dagger.position.y
+                incoming = dagger.position.x > pos.x if dagger.angle == 90 else dagger.position.x < pos.x
+            
+            if not incoming or abs(lane_offset) >= player.hit_tol + self.DODGE_MARGIN:
+                continue
+            
+            # Step away from the flight line, unless that runs into the screen edge
+            step = 1 if lane_offset >= 0 else -1
+            edge = pos.x if vertical else pos.y
+            limit = width if vertical else height
+            if not self.DODGE_MARGIN < edge + step * player.hit_tol < limit - self.DODGE_MARGIN:
+                step = -step
+            return (step, 0) if vertical else (0, step)
+        return None
@@ -0,0 +1,102 @@
+from circle_nom.systems.logging import get_logger
+from typing import Any
+import numpy as np
+import pygame
+
+class EntityStore:
+    
+    # Logger reference
+    _LOGGER = get_logger(name=__name__)
+    
+    def __init__(self, columns: dict[str, tuple[type, int]], capacity: int = 16) -> None:
+        """
+        Struct-of-arrays storage for many entities of one kind - one NumPy column per attribute, one row per entity. \n
+        Lets a whole column be stepped in one array operation instead of an attribute access per entity. \n
+        Rows are added with add() and never removed, the columns double in size when they run out of rows.
+        
+        Args:
+            columns (dict[str, tuple[type, int]]): Column names and their dtype and width. Width 1 columns are flat,
+            wider ones (like 2 for positions) have a row per entity.
+            capacity (int): Rows allocated up front.
+        """
+        if not columns or capacity < 1:
+            self._LOGGER.error("Invalid entity store columns or capacity.")
+            raise ValueError("Invalid entity store columns or capacity.")
+        
+        self._specs = columns
+        self._len = 0
+        self._columns: dict[str, np.ndarray] = {name: self._empty(dtype, width, capacity) for name, (dtype, width) in columns.items()}
+    
+    @staticmethod
+    def _empty(dtype: type, width: int, capacity: int) -> np.ndarray:
+        return np.zeros(capacity if width == 1 else (capacity, width), dtype=dtype)
+    
+    @property
+    def capacity(self) -> int:
+        """Rows allocated in every column."""
+        return len(next(iter(self._columns.values())))
+    
+    @property
+    def columns(self) -> dict[str, np.ndarray]:
+        """
+        Every column by name, capacity long - rows past len() are unused. \n
+        Growing replaces the arrays, so don't keep them across add() calls.
+        """
+        return self._columns
+    
+    def __len__(self) -> int:
+        return self._len
+    
+    def __getitem__(self, name: str) -> np.ndarray:
+        """The used rows of a column, a view that writes through to the store."""
+        return self._columns[name][:self._len]
+    
+    def add(self) -> int:
+        """
+        Add a zeroed row to every column, growing them if they are full.
+        
+        Returns:
+            int: The index of the new row.
+        """
+        if self._len == self.capacity:
+            capacity = self.capacity * 2
+            for name, (dtype, width) in self._specs.items():
+                column = self._empty(dtype, width, capacity)
+                column[:self._len] = self._columns[name]
+                self._columns[name] = column
+            self._LOGGER.info(f"Entity store grown to {capacity} rows.")
+        
+        self._len += 1
+        return self._len - 1
+
+class StoreColumn:
+    
+    def __init__(self, column: str, enum: tuple[Any, ...] | None = None) -> None:
+        """
+        Descriptor backing a model attribute with the model's row of an EntityStore column. \n
+        The model keeps its store in _store and its row in _store_idx. Width 2 columns are read as pygame.Vector2 copies, \n
+        so they must be assigned again after a change - changing the returned vector in place doesn't reach the store.
+        
+        Args:
+            column (str): The store column name.
+            enum (tuple | None): Optional values stored as their index in the tuple, like the named states of a model.
+        """
+        self._column = column
+        self._enum = enum
+    
+    def __get__(self, obj: Any, objtype: type | None = None) -> Any:
+        if obj is None:
+            return self
+        column = obj._store.columns[self._column]
+        if column.ndim == 2:
+            return pygame.Vector2(column.item(obj._store_idx, 0), column.item(obj._store_idx, 1))
+        value = column.item(obj._store_idx)
+        return value if self._enum is None else self._enum[value]
+    
+    def __set__(self, obj: Any, value: Any) -> None:
+        column = obj._store.columns[self._column]
+        if column.ndim == 2:
+            # Element by element - a row assignment from a Vector2 goes through the much slower sequence conversion
+            column[obj._store_idx, 0], column[obj._store_idx, 1] = value
+            return
+        column[obj._store_idx] = value if self._enum is None else self._enum.index(value)
@@ -0,0 +1,144 @@
+from circle_nom.systems.logging import get_logger
+from circle_nom.systems.timer import FrameTime
+from typing import NamedTuple
+import numpy as np
+import atexit
+import struct
+import pygame
+import time
+import os
+
+class EventLogData(NamedTuple):
+    """A loaded event log - its header values and every recorded event."""
+    seed: int               # Seed of the logged game
+    started: float          # Wall time the log was created at, seconds since the epoch
+    events: np.ndarray      # Structured array of EventLog.DTYPE, one row per event in recording order
+
+class EventLog:
+    
+    # Event kinds - the value and entity index of every kind
+    EAT = 1             # Player ate a Prey, value is the points gained, entity is the Prey index
+    HIT = 2             # Dagger hit a Player, value is the size lost, entity is the Dagger index
+    DASH = 3            # Player dashed, value is the speed after the dash, no entity
+    PREY_STATE = 4      # Prey changed state, value is the state's index in Prey.STATES, no Player
+    DAGGER_SPAWN = 5    # Dagger reset to a new spawn, value is its speed multiplier, no Player
+    
+    # Binary format - little-endian header followed by fixed size records until the end of the file
+    _MAGIC = b"CNEV"
+    _VERSION = 1
+    _HEADER = struct.Struct("<4sBHQd")          # magic, version, record size, seed, start wall time
+    _RECORD = struct.Struct("<diifffBb2x")      # time, step (-1 before the first one), entity, x, y, value, event, player, padding
+    
+    # NumPy dtype of a record, the padding left out
+    DTYPE = np.dtype({
+        "names": ["time", "step", "entity", "x", "y", "value", "event", "player"],
+        "formats": ["<f8", "<i4", "<i4", "<f4", "<f4", "<f4", "u1", "i1"],
+        "offsets": [0, 8, 12, 16, 20, 24, 28, 29],
+        "itemsize": _RECORD.size
+    })
+    
+    # Buffered bytes written to the file at once
+    BUFFER_SIZE = 64 * 1024
+    
+    # Logger reference
+    _LOGGER = get_logger(name=__name__)
+    
+    def __init__(self, path: str, seed: int) -> None:
+        """
+        Binary log of a game's gameplay events, written to a file as fixed size records for bulk analysis. \n
+        Records are buffered and written BUFFER_SIZE bytes at a time, the rest is written by flush() and close(). \n
+        A log that isn't closed is closed when the interpreter exits, so an abrupt quit keeps the buffered records. \n
+        Load the file back into NumPy arrays with load(). Missing folders on the path are created.
+        
+        Args:
+            path (str): The event log file's path.
+            seed (int): Seed of the logged game, stored in the header.
+        """
+        if not 0 <= seed < 2 ** 64:
+            self._LOGGER.error(f"Event log seed {seed} is out of the 64-bit unsigned range.")
+            raise ValueError(f"Event log seed {seed} is out of the 64-bit unsigned range.")
+        
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._path = path
+        self._file = open(path, "wb")
+        self._file.write(self._HEADER.pack(self._MAGIC, self._VERSION, self._RECORD.size, seed, time.time()))
+        self._buffer = bytearray()
+        self._count = 0
+        atexit.register(self.close)
+        self._LOGGER.info(f"Event log started at '{path}'.")
+    
+    @property
+    def count(self) -> int:
+        """Number of recorded events, written or still buffered."""
+        return self._count
+    
+    @property
+    def closed(self) -> bool:
+        """True once the log is closed."""
+        return self._file.closed
+    
+    def record(self, frame: FrameTime, event: int, player: int, entity: int, position: pygame.Vector2, value: float) -> None:
+        """
+        Record one event. Written to the file once the buffer is full.
+        
+        Args:
+            frame (FrameTime): The frame the event happened on.
+            event (int): One of the event kind consts.
+            player (int): Index of the event's Player, -1 if none.
+            entity (int): Index of the event's Prey or Dagger, -1 if none.
+            position (pygame.Vector2): Where the event happened.
+            value (float): The event's value, see the event kind consts.
+        """
+        self._buffer += self._RECORD.pack(frame.now, frame.frame, entity, position.x, position.y, value, event, player)
+        self._count += 1
+        if len(self._buffer) >= self.BUFFER_SIZE:
+            self.flush()
+    
+    def flush(self) -> None:
+        """Write the buffered records to the file."""
+        if self._buffer:
+            self._file.write(self._buffer)
+            self._buffer.clear()
+        self._file.flush()
+    
+    def close(self) -> None:
+        """Write the buffered records and close the file. Does nothing if already closed."""
+        if self._file.closed:
+            return
+        self.flush()
+        self._file.close()
+        atexit.unregister(self.close)
+        self._LOGGER.info(f"Event log with {self._count} events saved at '{self._path}'.")
+    
+    @classmethod
+    def load(cls, path: str, mmap: bool = False) -> EventLogData:
+        """
+        Load an event log written by EventLog. A partly written last record (a game that didn't close its log) is left out.
+        
+        Args:
+            path (str): The event log file's path.
+            mmap (bool): Map the records from the file instead of reading them - for logs larger than the memory at hand.
+        """
+        with open(path, "rb") as file:
+            header = file.read(cls._HEADER.size)
+        
+        if len(header) < cls._HEADER.size:
+            cls._LOGGER.error(f"File at '{path}' is too short to be an event log.")
+            raise ValueError(f"File at '{path}' is too short to be an event log.")
+        
+        magic, version, record_size, seed, started = cls._HEADER.unpack(header)
+        if magic != cls._MAGIC or version != cls._VERSION or record_size != cls.DTYPE.itemsize:
+            cls._LOGGER.error(f"File at '{path}' is not a version {cls._VERSION} event log.")
+            raise ValueError(f"File at '{path}' is not a version {cls._VERSION} event log.")
+        
+        count = (os.path.getsize(path) - cls._HEADER.size) // record_size
+        if not count:
+            events = np.empty(0, dtype=cls.DTYPE)
+        elif mmap:
+            events = np.memmap(path, dtype=cls.DTYPE, mode="r", offset=cls._HEADER.size, shape=(count,))
+        else:
+            events = np.fromfile(path, dtype=cls.DTYPE, count=count, offset=cls._HEADER.size)
+        
+        cls._LOGGER.info(f"Event log with {count} events loaded from '{path}'.")
+        return EventLogData(seed, started, events)
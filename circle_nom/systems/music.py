@@ -0,0 +1,123 @@
+from circle_nom.systems.asset_loader import AssetLoader
+from circle_nom.systems.logging import get_logger
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Sequence
+import threading
+import pygame
+import io
+
+class MusicService:
+    
+    # Logger reference
+    _LOGGER = get_logger(name=__name__)
+    
+    # Reads the upcoming tracks' files, shared by every music service - one thread, reads are disk bound
+    _pool: ThreadPoolExecutor | None = None
+    _pool_lock = threading.Lock()
+    
+    def __init__(self, playlist: Sequence[tuple[str, str]], asset_loader: AssetLoader) -> None:
+        """
+        Plays the tracks of a playlist with pygame.mixer.music, streamed from memory. \n
+        The files of the tracks around the current one (the next and previous) are read on a background thread \n
+        ahead of time, so switching tracks on the game thread doesn't wait on the disk. \n
+        A track that isn't read yet is streamed from its file like before, the switch never waits for a read.
+        
+        Args:
+            playlist (Sequence[tuple[str, str]]): The tracks as (name, path) pairs, like AssetLoader.load_playlist() returns.
+            asset_loader (AssetLoader): Loads the tracks, with a placeholder for missing files.
+        """
+        if not playlist:
+            self._LOGGER.error("Music service playlist is empty.")
+            raise ValueError("Music service playlist is empty.")
+        
+        self._playlist = tuple(playlist)
+        self._AL = asset_loader
+        
+        # Read track contents by playlist index, and the one being streamed - pygame reads it while the track plays
+        self._prefetched: dict[int, Future[bytes]] = {}
+        self._streamed: io.BytesIO | None = None
+        
+        # Song index as given (unbounded, wrapped around the playlist) and name of the loaded track
+        self._index = 0
+        self._name = ""
+    
+    @property
+    def index(self) -> int:
+        """Index of the loaded track as it was given to load() or play(), wrapped around the playlist when used."""
+        return self._index
+    
+    @property
+    def name(self) -> str:
+        """Name of the loaded track, empty before the first one."""
+        return self._name
+    
+    def __len__(self) -> int:
+        return len(self._playlist)
+    
+    @classmethod
+    def _read(cls, path: str) -> bytes:
+        with open(path, "rb") as file:
+            return file.read()
+    
+    def prefetch(self, index: int) -> None:
+        """
+        Start reading the track at the given index on the background thread, if it's not read or being read already.
+        
+        Args:
+            index (int): The track's index, wrapped around the playlist.
+        """
+        track = index % len(self._playlist)
+        if track in self._prefetched:
+            return
+        with self._pool_lock:
+            if MusicService._pool is None:
+                MusicService._pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="MusicPrefetch")
+        self._prefetched[track] = self._pool.submit(self._read, self._AL.resource_path(self._playlist[track][1]))
+    
+    def load(self, index: int) -> str:
+        """
+        Load the track at the given index without playing it, then prefetch the tracks next to it. \n
+        Uses the track's prefetched contents when they are read, its file otherwise.
+        
+        Args:
+            index (int): The track's index, wrapped around the playlist.
+        
+        Returns:
+            str: The track's name.
+        """
+        track = index % len(self._playlist)
+        name, path = self._playlist[track]
+        
+        # Never wait on a read in progress - a failed read (missing file) loads the path for its placeholder
+        future = self._prefetched.get(track)
+        if future is not None and future.done() and future.exception() is None:
+            self._streamed = io.BytesIO(future.result())
+        else:
+            self._streamed = None
+        
+        pygame.mixer.music.unload()
+        self._AL.load_music(path, self._streamed)
+        self._index, self._name = index, name
+        
+        # Keep the contents of this track and its neighbours, the only ones a switch can go to
+        neighbours = {(track + offset) % len(self._playlist) for offset in (-1, 0, 1)}
+        for stale in self._prefetched.keys() - neighbours:
+            self._prefetched.pop(stale).cancel()
+        for neighbour in neighbours:
+            self.prefetch(neighbour)
+        return name
+    
+    def play(self, index: int) -> str:
+        """
+        Load the track at the given index and play it, see load().
+        
+        Args:
+            index (int): The track's index, wrapped around the playlist.
+        
+        Returns:
+            str: The track's name.
+        """
+        name = self.load(index)
+        pygame.mixer.music.play()
+        self._LOGGER.info(f"Playing music {name} with index {index}.")
+        return name
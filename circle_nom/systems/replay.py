@@ -0,0 +1,254 @@
+from circle_nom.systems.controls import KeyInput, KeyState
+from circle_nom.systems.logging import get_logger
+from circle_nom.systems.timer import FrameTime
+from typing import Iterator, NamedTuple
+import struct
+import pygame
+import os
+
+class ReplayHeader(NamedTuple):
+    """Everything besides the inputs needed to play a recorded game again."""
+    seed: int                       # Seed of the game's RNGs
+    play_mode: int                  # 0, 1 or 2 - Singleplayer, Multiplayer or Stress
+    difficulty: int                 # 0 to 3 - Easy to Impossible
+    easter_mode: bool               # Result of the easter mode roll
+    sim_rate: int                   # Fixed simulation rate in Hz, 0 if every step has its own recorded time
+    screen_size: tuple[int, int]    # Game screen width and height
+    prey_cd: float                  # Prey spawned duration in seconds
+    dagger_cd: float                # Dagger spawnrate in seconds
+    prey_count: int                 # Starting Prey count
+    dagger_count: int               # Starting Dagger count
+    stress: tuple[float, int, int]  # Stress mode count doubling interval in seconds, maximum Prey and Dagger counts
+
+class Replay:
+    
+    # Keys recorded on every step - bit N of a step's key mask is the Nth key
+    KEYS = (
+        pygame.K_w, pygame.K_a, pygame.K_s, pygame.K_d,
+        pygame.K_UP, pygame.K_LEFT, pygame.K_DOWN, pygame.K_RIGHT,
+        pygame.K_LSHIFT, pygame.K_RSHIFT
+    )
+    
+    # Recorded events - happen between steps
+    PAUSE = 1       # Game paused, value unused
+    UNPAUSE = 2     # Game unpaused, value unused
+    MUSIC = 3       # Music changed, value is the song index
+    
+    # Binary format - little-endian header followed by tagged records until the end of the file
+    _MAGIC = b"CNRP"
+    _VERSION = 2
+    _HEADER = struct.Struct("<4sBQBBBHHHddIIdII")   # magic, version, seed, play mode, difficulty, easter, sim rate, width, height,
+                                                    # prey/dagger cd, prey/dagger count, stress interval, stress max prey/daggers
+    _STEPS = struct.Struct("<BIH")              # tag, step count, key mask - a run of fixed timestep steps with the same keys
+    _TIMED_STEP = struct.Struct("<BdH")         # tag, time, key mask - one variable timestep step
+    _EVENT = struct.Struct("<BBi")              # tag, event, value
+    _TAG_STEPS, _TAG_TIMED_STEP, _TAG_EVENT = 0, 1, 2
+    
+    # Logger reference
+    _LOGGER = get_logger(name=__name__)
+    
+    def __init__(self, header: ReplayHeader) -> None:
+        """
+        Recording of a game - the game's header, the pressed keys of every simulation step and the events between them. \n
+        Fixed timestep steps are stored as runs of equal key states. Variable timestep steps store their time, \n
+        which gives back the exact delta time sequence of the recorded game.
+        
+        Args:
+            header (ReplayHeader): The recorded game's settings.
+        """
+        self._header = header
+        self._runs: list[list] = []                     # [step count, time or None, key mask]
+        self._events: list[tuple[int, int, int]] = []   # (index of the next step, event, value)
+        self._step_count = 0
+        self._split_run = False
+    
+    @property
+    def header(self) -> ReplayHeader:
+        """The recorded game's settings."""
+        return self._header
+    
+    @property
+    def step_count(self) -> int:
+        """Number of recorded simulation steps."""
+        return self._step_count
+    
+    @property
+    def events(self) -> tuple[tuple[int, int, int], ...]:
+        """Recorded events as (index of the next step, event, value) tuples."""
+        return tuple(self._events)
+    
+    def record_step(self, frame: FrameTime, keys: KeyInput) -> None:
+        """
+        Record one simulation step.
+        
+        Args:
+            frame (FrameTime): The step's frame. Only its time is stored, and only for variable timestep games.
+            keys (KeyInput): The pressed keys the step was simulated with.
+        """
+        mask = 0
+        for bit, key in enumerate(self.KEYS):
+            if keys[key]:
+                mask |= 1 << bit
+        
+        # Fixed timestep - extend the last run if the keys didn't change and no event happened since
+        if self._header.sim_rate:
+            if self._runs and not self._split_run and self._runs[-1][2] == mask:
+                self._runs[-1][0] += 1
+            else:
+                self._runs.append([1, None, mask])
+        
+        # Variable timestep - every step keeps its own time
+        else:
+            self._runs.append([1, frame.now, mask])
+        
+        self._step_count += 1
+        self._split_run = False
+    
+    def record_event(self, event: int, value: int = 0) -> None:
+        """
+        Record an event before the next step.
+        
+        Args:
+            event (int): One of Replay.PAUSE, Replay.UNPAUSE or Replay.MUSIC.
+            value (int): The event's value, see the event consts.
+        """
+        self._events.append((self._step_count, event, value))
+        self._split_run = True
+    
+    def steps(self) -> Iterator[tuple[FrameTime, KeyState, tuple[tuple[int, int], ...]]]:
+        """
+        Play the recording back step by step. Frames are rebuilt the same way the engine and the game timer built them.
+        
+        Yields:
+            tuple: The step's frame, its pressed keys and the (event, value) pairs recorded before it.
+        """
+        sim_step = 1 / self._header.sim_rate if self._header.sim_rate else 0.00
+        key_states: dict[int, KeyState] = {}
+        events = iter(self._events)
+        next_event = next(events, None)
+        frame = FrameTime(0.00, 0.00, -1)
+        
+        for count, now, mask in self._runs:
+            keys = key_states.get(mask)
+            if keys is None:
+                keys = key_states[mask] = KeyState(key for bit, key in enumerate(self.KEYS) if mask >> bit & 1)
+            
+            for _ in range(count):
+                step_events = []
+                while next_event is not None and next_event[0] <= frame.frame + 1:
+                    step_events.append(next_event[1:])
+                    next_event = next(events, None)
+                
+                # Fixed timestep steps advance by the step, variable ones by the recorded time
+                if sim_step:
+                    frame = FrameTime(frame.now + sim_step, sim_step, frame.frame + 1)
+                else:
+                    frame = FrameTime(now, now - frame.now if frame.frame >= 0 else 0.00, frame.frame + 1)
+                yield frame, keys, tuple(step_events)
+    
+    def save(self, path: str) -> None:
+        """
+        Save the replay to a binary file. Missing folders on the path are created.
+        
+        Args:
+            path (str): The replay file's path.
+        """
+        header = self._header
+        if not 0 <= header.seed < 2 ** 64:
+            self._LOGGER.error(f"Replay seed {header.seed} is out of the 64-bit unsigned range, can't be saved.")
+            raise ValueError(f"Replay seed {header.seed} is out of the 64-bit unsigned range, can't be saved.")
+        
+        chunks = [self._HEADER.pack(
+            self._MAGIC, self._VERSION, header.seed, header.play_mode, header.difficulty, header.easter_mode,
+            header.sim_rate, *header.screen_size, header.prey_cd, header.dagger_cd,
+            header.prey_count, header.dagger_count, *header.stress
+        )]
+        
+        # Interleave the events with the step runs - runs never span over an event
+        events = iter(self._events)
+        next_event = next(events, None)
+        step_idx = 0
+        for count, now, mask in self._runs:
+            while next_event is not None and next_event[0] <= step_idx:
+                chunks.append(self._EVENT.pack(self._TAG_EVENT, *next_event[1:]))
+                next_event = next(events, None)
+            if now is None:
+                chunks.append(self._STEPS.pack(self._TAG_STEPS, count, mask))
+            else:
+                chunks.append(self._TIMED_STEP.pack(self._TAG_TIMED_STEP, now, mask))
+            step_idx += count
+        while next_event is not None:
+            chunks.append(self._EVENT.pack(self._TAG_EVENT, *next_event[1:]))
+            next_event = next(events, None)
+        
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as file:
+            file.write(b"".join(chunks))
+        self._LOGGER.info(f"Replay with {self._step_count} steps and {len(self._events)} events saved at '{path}'.")
+    
+    @classmethod
+    def load(cls, path: str) -> "Replay":
+        """
+        Load a replay saved with save().
+        
+        Args:
+            path (str): The replay file's path.
+        """
+        with open(path, "rb") as file:
+            data = file.read()
+        
+        if len(data) < cls._HEADER.size:
+            cls._LOGGER.error(f"File at '{path}' is too short to be a replay.")
+            raise ValueError(f"File at '{path}' is too short to be a replay.")
+        
+        magic, version, seed, play_mode, difficulty, easter_mode, sim_rate, width, height, prey_cd, dagger_cd, \
+            prey_count, dagger_count, *stress = cls._HEADER.unpack_from(data)
+        if magic != cls._MAGIC or version != cls._VERSION:
+            cls._LOGGER.error(f"File at '{path}' is not a version {cls._VERSION} replay.")
+            raise ValueError(f"File at '{path}' is not a version {cls._VERSION} replay.")
+        
+        replay = cls(ReplayHeader(
+            seed, play_mode, difficulty, bool(easter_mode), sim_rate, (width, height), prey_cd, dagger_cd,
+            prey_count, dagger_count, tuple(stress)
+        ))
+        
+        # Read the tagged records back into runs and events
+        offset = cls._HEADER.size
+        try:
+            while offset < len(data):
+                tag = data[offset]
+                if tag == cls._TAG_STEPS:
+                    _, count, mask = cls._STEPS.unpack_from(data, offset)
+                    replay._runs.append([count, None, mask])
+                    replay._step_count += count
+                    offset += cls._STEPS.size
+                elif tag == cls._TAG_TIMED_STEP:
+                    _, now, mask = cls._TIMED_STEP.unpack_from(data, offset)
+                    replay._runs.append([1, now, mask])
+                    replay._step_count += 1
+                    offset += cls._TIMED_STEP.size
+                elif tag == cls._TAG_EVENT:
+                    _, event, value = cls._EVENT.unpack_from(data, offset)
+                    replay._events.append((replay._step_count, event, value))
+                    offset += cls._EVENT.size
+                else:
+                    raise ValueError(f"Unknown record tag {tag} at byte {offset}.")
+        except (struct.error, ValueError) as error:
+            cls._LOGGER.error(f"Replay at '{path}' is corrupted: {error}")
+            raise ValueError(f"Replay at '{path}' is corrupted: {error}") from error
+        
+        cls._LOGGER.info(f"Replay with {replay.step_count} steps and {len(replay._events)} events loaded from '{path}'.")
+        return replay
+
+class NullReplay(Replay):
+    """
+    Replay that records nothing, for games whose replay is neither saved nor compared. \n
+    Steps and events cost nothing and take no memory - the header is kept, so a Replay can replace it before the first step.
+    """
+    
+    def record_step(self, frame: FrameTime, keys: KeyInput) -> None:
+        pass
+    
+    def record_event(self, event: int, value: int = 0) -> None:
+        pass
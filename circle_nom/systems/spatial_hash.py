@@ -0,0 +1,100 @@
+from circle_nom.systems.logging import get_logger
+from typing import Hashable
+import pygame
+
+class SpatialHash:
+    
+    # Logger reference
+    _LOGGER = get_logger(name=__name__)
+    
+    def __init__(self, cell_size: float) -> None:
+        """
+        Uniform grid broadphase. Keys are bucketed by the grid cell of their position, so a query only looks \n
+        at the keys in the cells it overlaps instead of every key. Updated incrementally with move(), \n
+        which only touches the buckets when a key crosses into another cell.
+        
+        Args:
+            cell_size (float): Width and height of a grid cell in pixels. Queries with a radius near the cell size are the cheapest.
+        """
+        if cell_size <= 0:
+            self._LOGGER.error("Invalid spatial hash cell size.")
+            raise ValueError("Invalid spatial hash cell size.")
+        
+        self._cell_size = cell_size
+        self._cells: dict[tuple[int, int], set[Hashable]] = {}
+        self._key_cells: dict[Hashable, tuple[int, int]] = {}
+    
+    @property
+    def cell_size(self) -> float:
+        """Width and height of a grid cell in pixels."""
+        return self._cell_size
+    
+    def __len__(self) -> int:
+        return len(self._key_cells)
+    
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._key_cells
+    
+    def _cell(self, x: float, y: float) -> tuple[int, int]:
+        return int(x // self._cell_size), int(y // self._cell_size)
+    
+    def move(self, key: Hashable, position: pygame.Vector2) -> None:
+        """
+        Insert the key or move it to the cell of its new position. Keys at a non finite position (off the grid) are removed.
+        
+        Args:
+            key (Hashable): The key to move.
+            position (pygame.Vector2): The key's new position.
+        """
+        # Non finite coordinates fail the int conversion - much cheaper than checking every finite one
+        try:
+            cell = self._cell(position.x, position.y)
+        except (ValueError, OverflowError):
+            self.remove(key)
+            return
+        
+        old_cell = self._key_cells.get(key)
+        if cell == old_cell:
+            return
+        
+        if old_cell is not None:
+            self._discard(key, old_cell)
+        self._key_cells[key] = cell
+        bucket = self._cells.get(cell)
+        if bucket is None:
+            self._cells[cell] = {key}
+        else:
+            bucket.add(key)
+    
+    def remove(self, key: Hashable) -> None:
+        """Remove the key. Keys that are not in the hash are ignored."""
+        cell = self._key_cells.pop(key, None)
+        if cell is not None:
+            self._discard(key, cell)
+    
+    def _discard(self, key: Hashable, cell: tuple[int, int]) -> None:
+        """Remove the key from a bucket, dropping the bucket once it's empty."""
+        bucket = self._cells[cell]
+        bucket.discard(key)
+        if not bucket:
+            del self._cells[cell]
+    
+    def query(self, position: pygame.Vector2, radius: float) -> list[Hashable]:
+        """
+        Get the keys in every cell the square of the given radius around position overlaps. \n
+        Every key within the radius on both axes is returned, along with some further away - exact checks are up to the caller.
+        
+        Args:
+            position (pygame.Vector2): Center of the queried square.
+            radius (float): Half the width of the queried square.
+        """
+        min_x, min_y = self._cell(position.x - radius, position.y - radius)
+        max_x, max_y = self._cell(position.x + radius, position.y + radius)
+        cells = self._cells
+        keys = []
+        for cell_x in range(min_x, max_x + 1):
+            for cell_y in range(min_y, max_y + 1):
+                bucket = cells.get((cell_x, cell_y))
+                if bucket:
+                    keys.extend(bucket)
+        return keys
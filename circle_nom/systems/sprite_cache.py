@@ -0,0 +1,224 @@
+from circle_nom.systems.logging import get_logger
+from collections import OrderedDict
+from typing import Sequence
+from bisect import bisect_left
+import pygame
+
+def prerotate(images: tuple[pygame.Surface, ...], angles: tuple[int, ...]) -> dict[int, tuple[pygame.Surface, ...]]:
+    """
+    Rotate every image by every angle ahead of time. Image order is kept for each angle.
+    
+    Args:
+        images (tuple[pygame.Surface, ...]): The source images.
+        angles (tuple[int, ...]): The angles in degrees to rotate by.
+    
+    Returns:
+        dict[int, tuple[pygame.Surface, ...]]: The rotated images keyed by their angle.
+    """
+    return {angle: tuple(pygame.transform.rotate(image, angle) for image in images) for angle in angles}
+
+class SpriteCache:
+    
+    # Logger reference
+    _LOGGER = get_logger(name=__name__)
+    
+    def __init__(self, capacity: int = 128) -> None:
+        """
+        LRU cache for transformed surfaces. Entries are keyed by the source image and the target size, \n
+        so drawing the same image at the same (quantized) size only pays for the transform once.
+        
+        Args:
+            capacity (int): Maximum number of cached surfaces before the least recently used one is evicted.
+        """
+        if capacity <= 0:
+            self._LOGGER.error("Invalid sprite cache capacity.")
+            raise ValueError("Invalid sprite cache capacity.")
+        
+        self._capacity = capacity
+        self._scaled: OrderedDict[tuple[pygame.Surface, tuple[int, int]], pygame.Surface] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        
+        self._LOGGER.info(f"Sprite cache with capacity {capacity} initialized successfully.")
+    
+    @property
+    def hits(self) -> int:
+        """Number of lookups served from the cache."""
+        return self._hits
+    
+    @property
+    def misses(self) -> int:
+        """Number of lookups that required a new transform."""
+        return self._misses
+    
+    def __len__(self) -> int:
+        return len(self._scaled)
+    
+    def scale(self, image: pygame.Surface, size: tuple[int | float, int | float]) -> pygame.Surface:
+        """
+        Get the given image smoothscaled to size. Sizes are rounded to whole pixels before the lookup. \n
+        NOTE: The returned surface is shared, do not draw on it!
+        
+        Args:
+            image (pygame.Surface): The source image.
+            size (tuple[int | float, int | float]): The target width and height.
+        """
+        key = (image, (round(size[0]), round(size[1])))
+        scaled = self._scaled.get(key)
+        
+        # Cache hit - mark as most recently used
+        if scaled is not None:
+            self._scaled.move_to_end(key)
+            self._hits += 1
+            return scaled
+        
+        # Cache miss - transform, store and evict the least recently used entry if full
+        scaled = pygame.transform.smoothscale(image, key[1])
+        self._scaled[key] = scaled
+        self._misses += 1
+        if len(self._scaled) > self._capacity:
+            self._scaled.popitem(last=False)
+        return scaled
+    
+    def clear(self) -> None:
+        """Drop every cached surface and reset the hit/miss counters."""
+        self._scaled.clear()
+        self._hits = 0
+        self._misses = 0
+
+class RotationAtlas:
+    
+    # Logger reference
+    _LOGGER = get_logger(name=__name__)
+    
+    def __init__(self, image: pygame.Surface, sizes: tuple[int, ...], angle_step: int | float) -> None:
+        """
+        Table of pre-rendered scaled and rotated versions of a square image. \n
+        Every size is rotated in angle_step increments, lookups snap to the nearest size and angle.
+        
+        Args:
+            image (pygame.Surface): The source image.
+            sizes (tuple[int, ...]): The square pixel sizes to pre-render.
+            angle_step (int | float): The angle increment in degrees. Must evenly divide 360.
+        """
+        if not sizes or min(sizes) <= 0:
+            self._LOGGER.error("Invalid rotation atlas sizes.")
+            raise ValueError("Invalid rotation atlas sizes.")
+        
+        if angle_step <= 0 or 360 % angle_step:
+            self._LOGGER.error(f"Invalid rotation atlas angle step {angle_step}, must evenly divide 360.")
+            raise ValueError(f"Invalid rotation atlas angle step {angle_step}, must evenly divide 360.")
+        
+        self._sizes = tuple(sorted(sizes))
+        self._angle_step = angle_step
+        self._angle_count = int(360 // angle_step)
+        
+        # Rows are sizes, columns are angles
+        self._frames: tuple[tuple[pygame.Surface, ...], ...] = tuple(
+            tuple(
+                pygame.transform.rotate(scaled, idx * angle_step) for idx in range(self._angle_count)
+            )
+            for scaled in (pygame.transform.smoothscale(image, (size, size)) for size in self._sizes)
+        )
+    
+    @property
+    def sizes(self) -> tuple[int, ...]:
+        """The pre-rendered sizes in ascending order."""
+        return self._sizes
+    
+    def get(self, size: int | float, angle: int | float) -> pygame.Surface:
+        """
+        Get the pre-rendered frame closest to the given size and angle. \n
+        NOTE: The returned surface is shared, do not draw on it!
+        
+        Args:
+            size (int | float): The wanted square size in pixels.
+            angle (int | float): The wanted rotation angle in degrees. Any value is accepted.
+        """
+        size_idx = bisect_left(self._sizes, size)
+        if size_idx == len(self._sizes):
+            size_idx -= 1
+        elif size_idx > 0 and size - self._sizes[size_idx - 1] < self._sizes[size_idx] - size:
+            size_idx -= 1
+        
+        angle_idx = round(angle / self._angle_step) % self._angle_count
+        return self._frames[size_idx][angle_idx]
+
+class TextureAtlas:
+    
+    # Logger reference
+    _LOGGER = get_logger(name=__name__)
+    
+    def __init__(self, groups: dict[str, Sequence[pygame.Surface]], page_size: int = 2048, padding: int = 1) -> None:
+        """
+        Small images packed into a few large pages at load time. Every image becomes a subsurface of its page, \n
+        so sprites drawn in the same frame are blitted from the same few surfaces. \n
+        Images are packed tallest first on shelves, left to right and top to bottom, a page is started once one is full. \n
+        Get a group's images back in their order with atlas[name].
+        
+        Args:
+            groups (dict[str, Sequence[pygame.Surface]]): The images to pack by their group name.
+            page_size (int): Width and maximum height of a page in pixels. Wider images get a shelf of their own.
+            padding (int): Transparent pixels left between the images.
+        """
+        if page_size <= 0 or padding < 0:
+            self._LOGGER.error("Invalid texture atlas page size or padding.")
+            raise ValueError("Invalid texture atlas page size or padding.")
+        
+        # Shelf packing - positions of every (group, index) by page
+        images = sorted(
+            ((name, idx, image) for name, group in groups.items() for idx, image in enumerate(group)),
+            key=lambda item: (item[2].height, item[2].width), reverse=True
+        )
+        placed: list[list[tuple[str, int, pygame.Surface, int, int]]] = [[]]
+        x = y = shelf_height = 0
+        for name, idx, image in images:
+            if x and x + image.width > page_size:
+                x, y, shelf_height = 0, y + shelf_height + padding, 0
+            if y and y + image.height > page_size:
+                placed.append([])
+                x = y = shelf_height = 0
+            placed[-1].append((name, idx, image, x, y))
+            x += image.width + padding
+            shelf_height = max(shelf_height, image.height)
+        
+        # Pages are cropped to their images and use the display's pixel format when there is one
+        self._pages: list[pygame.Surface] = []
+        rects: dict[str, dict[int, tuple[int, pygame.Rect]]] = {name: {} for name in groups}
+        for page_idx, page_images in enumerate(placed):
+            width = max((x + image.width for _, _, image, x, _ in page_images), default=1)
+            height = max((y + image.height for _, _, image, _, y in page_images), default=1)
+            page = pygame.Surface((width, height), pygame.SRCALPHA)
+            if pygame.display.get_surface() is not None:
+                page = page.convert_alpha()
+            page.fill((0, 0, 0, 0))
+            for name, idx, image, x, y in page_images:
+                page.blit(image, (x, y))
+                rects[name][idx] = (page_idx, pygame.Rect((x, y), image.size))
+            self._pages.append(page)
+        
+        self._rects = {name: tuple(group[idx] for idx in range(len(group))) for name, group in rects.items()}
+        self._groups = {
+            name: tuple(self._pages[page_idx].subsurface(rect) for page_idx, rect in group) for name, group in self._rects.items()
+        }
+        
+        self._LOGGER.info(f"Texture atlas with {len(images)} images packed into {len(self._pages)} page/s.")
+    
+    @property
+    def pages(self) -> tuple[pygame.Surface, ...]:
+        """The atlas pages, every packed image is a part of one."""
+        return tuple(self._pages)
+    
+    def __contains__(self, name: str) -> bool:
+        return name in self._groups
+    
+    def __getitem__(self, name: str) -> tuple[pygame.Surface, ...]:
+        """
+        Get a group's images as subsurfaces of their pages, in the given order. \n
+        NOTE: The returned surfaces share the pages' pixels, do not draw on them!
+        """
+        return self._groups[name]
+    
+    def rects(self, name: str) -> tuple[tuple[int, pygame.Rect], ...]:
+        """Get the page index and area of every image of a group, for blitting straight from the pages."""
+        return self._rects[name]
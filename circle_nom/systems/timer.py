@@ -1,20 +1,28 @@
 from circle_nom.systems.logging import get_logger
+from typing import NamedTuple
 import threading
 import time
 
+class FrameTime(NamedTuple):
+    """Immutable snapshot of a Timer, taken once per frame with Timer.snapshot()."""
+    now: float  # Elapsed timer time in seconds
+    dt: float   # Elapsed timer time since the previous snapshot in seconds
+    frame: int  # Snapshot index, starts from 0 after every reset
+
 class Timer:
     
     # Logger reference
     _LOGGER = get_logger(name=__name__)
     
-    def __init__(self, name: str | None = None) -> None:
+    def __init__(self, name: str | None = None, threaded: bool = True) -> None:
         """
-        A thread-safe Timer that runs in a background thread. \n
-        Allows starting, stopping, resetting, and retrieving elapsed time. \n
-        Starts a background thread that continuously updates the elapsed time.
+        A thread-safe Timer. Allows starting, stopping, resetting, and retrieving elapsed time. \n
+        In threaded mode it starts a background thread that continuously updates the elapsed time (~60 Hz resolution). \n
+        In thread-free mode the elapsed time is computed from the monotonic time.perf_counter() clock when asked.
         
         Args:
-            name (str): Optional arg to set a custom thread name.
+            name (str): Optional arg to set a custom thread name. Also used to identify the timer in logs.
+            threaded (bool): Use the background thread. Set to False for the thread-free mode.
         """
         self._start_time = 0.00                   # Timestamp when the timer was started
         self._elapsed = 0                         # Total elapsed time in seconds
@@ -22,11 +30,18 @@ class Timer:
         self._formatted_last_output = "0 seconds" # Cache used in formatted time to avoid recompute
         self._running = False                     # Flag indicating if the timer is running
         self._lock = threading.Lock()             # Lock to ensure thread-safe access
-        self._thread = threading.Thread(target=self._run, daemon=True)
-        if name: self._thread.name = name
-        self._thread.start()
-        self._LOGGER.info(msg=f"Thread '{self._thread.name}' started. Timer object id {id(self)} created.")
-
+        self._snapshot = FrameTime(0.00, 0.00, -1)  # Last snapshot, frame -1 means none taken yet
+        self._threaded = threaded
+        if threaded:
+            self._thread = threading.Thread(target=self._run, daemon=True)
+            if name: self._thread.name = name
+            self._thread.start()
+            self._name = self._thread.name
+            self._LOGGER.info(msg=f"Thread '{self._name}' started. Timer object id {id(self)} created.")
+        else:
+            self._name = name if name else f"Timer-{id(self)}"
+            self._LOGGER.info(msg=f"Thread-free timer '{self._name}' with object id {id(self)} created.")
+    
     def _run(self) -> None:
         """
         Background thread method that updates the elapsed time while running.
@@ -34,9 +49,22 @@ class Timer:
         while True:
             if self._running:
                 with self._lock:
-                    self._elapsed = time.time() - self._start_time
+                    self._elapsed = time.perf_counter() - self._start_time
             time.sleep(0.016)  # Update every 16ms or ~60fps - less hinders performance, more breaks animations based on time
-
+    
+    def _get_elapsed(self) -> float:
+        """
+        Internal helper returning the elapsed time for the current mode. Caller must hold the lock in threaded mode.
+        """
+        if not self._threaded and self._running:
+            return time.perf_counter() - self._start_time
+        return self._elapsed
+    
+    @property
+    def threaded(self) -> bool:
+        """True if the timer is updated by a background thread, False if it's thread-free."""
+        return self._threaded
+    
     def start(self) -> None:
         """
         Starts or resumes the timer.
@@ -44,10 +72,10 @@ class Timer:
         """
         with self._lock:
             if not self._running:
-                self._start_time = time.time() - self._elapsed
+                self._start_time = time.perf_counter() - self._elapsed
                 self._running = True
-        self._LOGGER.info(msg=f"Thread '{self._thread.name}' has started its timer.")
-
+        self._LOGGER.info(msg=f"Timer '{self._name}' has started.")
+    
     def stop(self) -> None:
         """
         Stops or pauses the timer.
@@ -55,25 +83,26 @@ class Timer:
         """
         with self._lock:
             if self._running:
-                self._elapsed = time.time() - self._start_time
+                self._elapsed = time.perf_counter() - self._start_time
                 self._running = False
-        self._LOGGER.info(msg=f"Thread '{self._thread.name}' has stopped its timer.")
-
+        self._LOGGER.info(msg=f"Timer '{self._name}' has stopped.")
+    
     def reset(self) -> None:
         """
-        Resets the timer to zero.
+        Resets the timer and its snapshots to zero.
         If running, continues from zero.
         If stopped, clears the start time.
         """
         with self._lock:
-            self._start_time = time.time()
+            self._start_time = time.perf_counter()
             self._elapsed = 0
             self._formatted_last_elapsed = -1
             self._formatted_last_output = "0 seconds"
+            self._snapshot = FrameTime(0.00, 0.00, -1)
             if not self._running:
                 self._start_time = 0.00
-        self._LOGGER.info(msg=f"Thread '{self._thread.name}' has reset its timer.")
-
+        self._LOGGER.info(msg=f"Timer '{self._name}' has been reset.")
+    
     def get_time(self) -> float:
         """
         Returns the current elapsed time in seconds as a float.
@@ -82,9 +111,30 @@ class Timer:
         Returns:
             float: The current elapsed time in seconds.
         """
+        if not self._threaded:
+            return self._get_elapsed()
         with self._lock:
             return self._elapsed
+    
+    def snapshot(self) -> FrameTime:
+        """
+        Samples the timer once and returns it as a FrameTime, meant to be called once per frame. \n
+        Everything that receives the snapshot sees the same time for the whole frame.
         
+        Returns:
+            FrameTime: The current time, time since the previous snapshot and the snapshot index.
+        """
+        with self._lock:
+            now = self._get_elapsed()
+            last = self._snapshot
+            self._snapshot = FrameTime(now, now - last.now if last.frame >= 0 else 0.00, last.frame + 1)
+            return self._snapshot
+    
+    @property
+    def last_snapshot(self) -> FrameTime:
+        """The last snapshot taken with snapshot(). Frame index is -1 if none was taken since the last reset."""
+        return self._snapshot
+    
     def get_formatted_time(self) -> str:
         """
         Returns the elapsed time as a string in a fancier string format.
@@ -93,14 +143,15 @@ class Timer:
             str: The formatted time, e.g."2 hr, 24 min and 48 sec".
         """
         with self._lock:
+            elapsed = self._get_elapsed()
             
             # Check if formatted time is not cached already
             # if one ore more seconds have passed create new string and recache
-            if self._elapsed - self._formatted_last_elapsed >= 1:
-                self._formatted_last_elapsed = self._elapsed
+            if elapsed - self._formatted_last_elapsed >= 1:
+                self._formatted_last_elapsed = elapsed
                 
                 # Calculate hours, minutes and seconds
-                total_seconds = int(self._elapsed)
+                total_seconds = int(elapsed)
                 hours = total_seconds // 3600
                 minutes = (total_seconds % 3600) // 60
                 seconds = total_seconds % 60
@@ -115,4 +166,4 @@ class Timer:
                 return formatted
             
             # If it is, return cache to avoid calcs above
-            return self._formatted_last_output
\ No newline at end of file
+            return self._formatted_last_output
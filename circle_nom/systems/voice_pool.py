@@ -0,0 +1,104 @@
+from circle_nom.systems.logging import get_logger
+import pygame
+
+class VoicePool:
+    """
+    Fixed pool of mixer channels the game's sound effects are played on, with a voice limit per sound category. \n
+    A sound played over its category's limit, or with every channel busy, steals the channel of the oldest voice \n
+    or is dropped, by its category's policy - many Daggers or Players never play dozens of overlapping clips at once. \n
+    The pool's channels are reserved, so sounds played with Sound.play() (like the Menu's) use the channels after them. \n
+    All of its methods are classmethods, like ConfigReader. Sounds are only played once the mixer is initialized.
+    """
+    
+    # Policies for a sound over its category's limit or with every channel busy
+    STEAL_OLDEST = "steal_oldest"   # Stop the oldest voice of the category (of the pool if the category has none) for it
+    DROP = "drop"                   # Don't play it
+    
+    # Mixer channels of the pool, and the ones left for sounds played outside of it
+    CHANNELS = 8
+    FREE_CHANNELS = 4
+    
+    # Voice limit and policy of every category - Dagger whooshes start in bursts, a dropped one isn't missed
+    CATEGORIES = {
+        "eat": (2, STEAL_OLDEST),
+        "hit": (2, STEAL_OLDEST),
+        "dash": (2, STEAL_OLDEST),
+        "dagger": (3, DROP)
+    }
+    
+    # Pool channels, and the (start order, category) of the voice last started on every one of them
+    _channels: list[pygame.mixer.Channel] = []
+    _voices: list[tuple[int, str] | None] = []
+    
+    # Started, stolen and dropped voice counts
+    _started = 0
+    _stolen = 0
+    _dropped = 0
+    
+    # Logger reference
+    _LOGGER = get_logger(name=__name__)
+    
+    @classmethod
+    def _init_channels(cls) -> bool:
+        """Reserve the pool's channels on first use. False if the mixer isn't initialized."""
+        if not pygame.mixer.get_init():
+            return False
+        if not cls._channels:
+            pygame.mixer.set_num_channels(max(pygame.mixer.get_num_channels(), cls.CHANNELS + cls.FREE_CHANNELS))
+            pygame.mixer.set_reserved(cls.CHANNELS)
+            cls._channels = [pygame.mixer.Channel(idx) for idx in range(cls.CHANNELS)]
+            cls._voices = [None] * cls.CHANNELS
+            cls._LOGGER.info(f"Voice pool with {cls.CHANNELS} channels initialized successfully.")
+        return True
+    
+    @classmethod
+    def play(cls, category: str, sound: pygame.mixer.Sound) -> pygame.mixer.Channel | None:
+        """
+        Play a sound effect on a pool channel, within its category's voice limit.
+        
+        Args:
+            category (str): One of the CATEGORIES keys.
+            sound (pygame.mixer.Sound): The sound to play.
+        
+        Returns:
+            pygame.mixer.Channel | None: The channel playing the sound, None if it was dropped or the mixer isn't initialized.
+        """
+        if category not in cls.CATEGORIES:
+            cls._LOGGER.error(f"Invalid sound category '{category}'! Can be one of {tuple(cls.CATEGORIES)}.")
+            raise ValueError(f"Invalid sound category '{category}'! Can be one of {tuple(cls.CATEGORIES)}.")
+        
+        if not cls._init_channels():
+            return None
+        
+        limit, policy = cls.CATEGORIES[category]
+        busy = [idx for idx, channel in enumerate(cls._channels) if channel.get_busy() and cls._voices[idx] is not None]
+        category_busy = [idx for idx in busy if cls._voices[idx][1] == category]
+        
+        # Over the category's limit - its oldest voice or nothing
+        if len(category_busy) >= limit:
+            if policy == cls.DROP:
+                cls._dropped += 1
+                return None
+            idx = min(category_busy, key=lambda idx: cls._voices[idx][0])
+            cls._stolen += 1
+        
+        # A free channel, or the oldest voice of the category (of the pool if the category has none) once every one is busy
+        elif len(busy) < cls.CHANNELS:
+            idx = next(idx for idx in range(cls.CHANNELS) if idx not in busy)
+        elif policy == cls.DROP:
+            cls._dropped += 1
+            return None
+        else:
+            idx = min(category_busy or busy, key=lambda idx: cls._voices[idx][0])
+            cls._stolen += 1
+        
+        channel = cls._channels[idx]
+        channel.play(sound)
+        cls._started += 1
+        cls._voices[idx] = (cls._started, category)
+        return channel
+    
+    @classmethod
+    def get_stats(cls) -> tuple[int, int, int]:
+        """Get the number of voices started, stolen from older voices and dropped so far."""
+        return cls._started, cls._stolen, cls._dropped
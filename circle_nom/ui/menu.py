@@ -5,6 +5,7 @@ from circle_nom.core.engine import CircleNom
 
 # Game Systems & Helpers
 from circle_nom.systems.asset_loader import AssetLoader 
+from circle_nom.systems.music import MusicService
 from circle_nom.systems.oscillator import Oscillator
 import circle_nom.helpers.other_utils as other_utils
 from circle_nom.helpers.asset_bank import AssetBank
@@ -12,7 +13,7 @@ from circle_nom.systems.logging import get_logger
 from circle_nom.systems.timer import Timer
 
 # Builtins & Third-party
-from random import choice, randint
+from random import choice, randint, randrange
 from typing import Union
 import webbrowser
 import pygame
@@ -20,9 +21,6 @@ import sys
 
 class Menu:
     
-    # Get Pygame window size
-    WIDTH, HEIGHT = pygame.display.get_window_size()
-    
     # Logger reference
     _LOGGER = get_logger(name=__name__)
     
@@ -74,12 +72,11 @@ class Menu:
         ("30", "#ff0000"), ("60", "#ff0039"), ("75", "#ff075f"), ("120", "#ff207d"), 
         ("144", "#ff2a9a"), ("240", "#ff2db8"), ("360", "#ff22dd"), ("Unlimited", "#f942ff")
     )
-    PLAY_MODES = (("Singleplayer", "#94f21c"), ("Multiplayer", "#0acffa"))
+    PLAY_MODES = (("Singleplayer", "#94f21c"), ("Multiplayer", "#0acffa"), ("Stress", "#f2541c"))
     SCREEN_MODES = (("Windowed", "#fa0a35"), ("Fullscreen", "#adff00"))
     VSYNC_MODES = (("Off", "#ff0000"), ("On", "#00ff00"))
     
-    # Aura and Player in Menu consts
-    AURA_MENU_POS = pygame.Vector2(WIDTH / 2, HEIGHT / 5)
+    # Player in Menu consts
     PLAYER_MENU_SCALE = (180, 180)
     
     # Menus clicks sound cooldown const (85 ms)
@@ -105,7 +102,7 @@ class Menu:
         """
         
         # Create a new Timer and start it
-        self.menu_timer = Timer(name="MenuTimerThread")
+        self.menu_timer = Timer(name="MenuTimer", threaded=False)
         self.menu_timer.start()
         
         # Pygame clock for framerate
@@ -114,8 +111,10 @@ class Menu:
         # Delta time
         self.dt = 0.00
         
-        # Setup pygame screen
+        # Setup pygame screen and the screen size dependent positions
         self.screen = screen
+        self.WIDTH, self.HEIGHT = screen.get_size()
+        self.AURA_MENU_POS = pygame.Vector2(self.WIDTH / 2, self.HEIGHT / 5)
         self._setup_screen()
         self._get_new_rand_images()
         
@@ -151,9 +150,9 @@ class Menu:
         # Aura rotation angle
         self.player_aura_angle = 0
 
-        # Load random menu theme song
-        self.song_name, self.song_path = choice(self._AB.menu_themes)
-        self._AL.load_music(self.song_path)
+        # Load random menu theme song - the music service reads the other themes ahead of time
+        self._music = MusicService(self._AB.menu_themes, self._AL)
+        self.song_name = self._music.load(randrange(len(self._music)))
         
         # End event for music autoplay
         pygame.mixer.music.set_endevent(pygame.USEREVENT)
@@ -210,11 +209,7 @@ class Menu:
         
         # Set volumes
         pygame.mixer.music.set_volume(volume)
-        for sound in self._AB.menu_click_sounds.values(): sound.set_volume(volume)
-        for sound in self._AB.player_eat_sounds: sound.set_volume(volume)
-        for sound in self._AB.dagger_sounds: sound.set_volume(volume)
-        for sound in self._AB.player_hit_sounds: sound.set_volume(volume)
-        for sound in self._AB.dash_sounds: sound.set_volume(volume)
+        self._AB.set_sound_volume(volume)  # Sounds not loaded yet get it once they are
         
     def _play_menu_click(self, type: str) -> None:
         """
@@ -412,6 +407,9 @@ class Menu:
         # Limit fps and get dt
         self.dt = self.clock.tick(self.fps_cap) / 1000
         
+        # Load a game asset behind the Menu, see AssetBank.preload()
+        self._AB.preload((AssetBank.GAME,), limit=1)
+        
         # Return generated options items rects
         return credits_rects
         
@@ -508,9 +506,7 @@ class Menu:
                             
                 # Music end event - Choose new one
                 elif event.type == pygame.USEREVENT:
-                    self.song_name, self.song_path = choice(self._AB.menu_themes)
-                    self._AL.load_music(self.song_path)
-                    pygame.mixer.music.play()
+                    self.song_name = self._music.play(randrange(len(self._music)))
     
     def _draw_options(self) -> list[pygame.Rect]:
         """
@@ -594,6 +590,9 @@ class Menu:
         # Limit fps and get dt
         self.dt = self.clock.tick(self.fps_cap) / 1000
         
+        # Load a game asset behind the Menu, see AssetBank.preload()
+        self._AB.preload((AssetBank.GAME,), limit=1)
+        
         # Return generated options items rects
         return option_rects
     
@@ -680,9 +679,7 @@ class Menu:
                             
                 # Music end event - Choose new one
                 elif event.type == pygame.USEREVENT:
-                    self.song_name, self.song_path = choice(self._AB.menu_themes)
-                    self._AL.load_music(self.song_path)
-                    pygame.mixer.music.play()
+                    self.song_name = self._music.play(randrange(len(self._music)))
     
     def _draw_main_menu(self) -> tuple[list[pygame.Rect], pygame.Rect]:
         """
@@ -738,6 +735,9 @@ class Menu:
         # Limit fps and get dt
         self.dt = self.clock.tick(self.fps_cap) / 1000
         
+        # Load a game asset behind the Menu, see AssetBank.preload()
+        self._AB.preload((AssetBank.GAME,), limit=1)
+        
         # Return generated menu items rects
         return main_menu_rects, title_rect
     
@@ -844,9 +844,7 @@ class Menu:
 
                 # Music end event - Choose new one
                 elif event.type == pygame.USEREVENT:
-                    self.song_name, self.song_path = choice(self._AB.menu_themes)
-                    self._AL.load_music(self.song_path)
-                    pygame.mixer.music.play()
+                    self.song_name = self._music.play(randrange(len(self._music)))
                     
     def start_game(self) -> None:
         """Start the Circle Nom game."""
@@ -854,6 +852,9 @@ class Menu:
         # Stop the Menu timer before entering the game
         self.menu_timer.stop()
         
+        # Load the game assets the Menu didn't get to yet
+        self._AB.preload((AssetBank.GAME,))
+        
         # Declare a new Circle Nom game object
         game = CircleNom(
             screen=self.screen,
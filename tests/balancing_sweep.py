@@ -0,0 +1,108 @@
+import sys
+from pathlib import Path
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from circle_nom.helpers.config_reader import ConfigReader
+from concurrent.futures import ProcessPoolExecutor
+from itertools import product
+import argparse
+import numpy as np
+import csv
+import os
+
+# Monte-Carlo balancing sweep - simulates headless singleplayer games with a scripted bot in parallel, for every
+# PREY_DIFFICULTY x DAGGER_DIFFICULTY pair, and reports the survival time and points distributions of each pair.
+# Every pair plays the same game seeds, so differences between pairs come from the settings and not from luck.
+#
+# Usage:
+#   python tests/balancing_sweep.py                                 # Sweep the config.ini values
+#   python tests/balancing_sweep.py --prey 2.4 1.8 --dagger 0.7     # Sweep custom values
+#   python tests/balancing_sweep.py --games 500 --csv results.csv   # More games, save every game result
+
+def init_worker() -> None:
+    """Runs once in every worker process. Headless pygame setup, only errors are logged."""
+    os.chdir(Path(__file__).resolve().parent.parent) # Asset paths are relative to the project root
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    import logging
+    logging.disable(logging.WARNING)
+    import pygame
+    pygame.font.init()
+    pygame.mixer.init()
+
+def play_game(task: tuple[float, float, int, float, float]) -> tuple[float, int, bool]:
+    """
+    Simulates one game in the worker process.
+
+    Args:
+        task (tuple): Prey spawned duration, Dagger spawnrate, game seed, simulated time limit and bot reaction time.
+
+    Returns:
+        tuple: Survived time in seconds, points and whether the game ended before the time limit.
+    """
+    # Imported here - the engine loads the assets on import, which needs the worker's pygame setup
+    from circle_nom.systems.controls import ChaseBot
+    from circle_nom.core.engine import CircleNom
+    import pygame
+
+    prey_cd, dagger_cd, seed, max_time, reaction_time = task
+    game = CircleNom(
+        screen=pygame.Surface(ConfigReader.get_screen()), fps_cap=0, difficulty=1, play_mode=0,
+        player_accessory=None, background_image=pygame.Surface((1, 1)),
+        headless=True, input_source=ChaseBot(reaction_time=reaction_time),
+        prey_cd=prey_cd, dagger_cd=dagger_cd, seed=seed
+    )
+    result = game.simulate(max_time=max_time)
+    return result.time, result.points[0], result.game_over
+
+def percentiles(values: np.ndarray) -> str:
+    """Format the mean, 10th, 50th and 90th percentiles of values."""
+    p10, p50, p90 = np.percentile(values, (10, 50, 90))
+    return f"{values.mean():8.1f} {p10:8.1f} {p50:8.1f} {p90:8.1f}"
+
+if __name__ == "__main__":
+
+    # Arguments - the config values are the default sweep
+    parser = argparse.ArgumentParser(description="Parallel Monte-Carlo balancing sweep over the Prey and Dagger difficulty values.")
+    parser.add_argument("--prey", type=float, nargs="+", default=ConfigReader.get_prey_difficulty(), help="Prey spawned durations in seconds.")
+    parser.add_argument("--dagger", type=float, nargs="+", default=ConfigReader.get_dagger_difficulty(), help="Dagger spawnrates in seconds.")
+    parser.add_argument("--games", type=int, default=50, help="Games per setting pair.")
+    parser.add_argument("--max-time", type=float, default=300, help="Simulated time limit per game in seconds.")
+    parser.add_argument("--reaction", type=float, default=0.15, help="Bot reaction time in seconds.")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the first game, the rest count up from it.")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes. Defaults to the CPU count.")
+    parser.add_argument("--csv", type=str, default=None, help="Optional path to save every game result to.")
+    args = parser.parse_args()
+    if args.games < 1 or args.max_time <= 0:
+        parser.error("--games and --max-time must be positive.")
+
+    # One task per game - setting pairs in sweep order, games of a pair share their seeds with every other pair
+    settings = tuple(product(args.prey, args.dagger))
+    tasks = [
+        (prey_cd, dagger_cd, args.seed + game, args.max_time, args.reaction)
+        for prey_cd, dagger_cd in settings for game in range(args.games)
+    ]
+    print(f"Simulating {len(tasks)} games, {args.games} for each of the {len(settings)} setting pairs...")
+
+    # Simulate in parallel - map keeps the task order
+    with ProcessPoolExecutor(max_workers=args.workers, initializer=init_worker) as executor:
+        results = list(executor.map(play_game, tasks, chunksize=max(1, args.games // 4)))
+
+    # Optionally save every game result
+    if args.csv:
+        with open(args.csv, "w", newline="") as file:
+            writer = csv.writer(file)
+            writer.writerow(("prey_cd", "dagger_cd", "seed", "time", "points", "game_over"))
+            writer.writerows(task[:3] + result for task, result in zip(tasks, results))
+        print(f"Saved every game result to '{args.csv}'.")
+
+    # Report the distributions of every setting pair
+    print(f"\n{'':19} {'Survival time (s)':^35} | {'Points':^35} |")
+    print(f"{'prey_cd':>9} {'dagger_cd':>9} {'mean':>8} {'p10':>8} {'p50':>8} {'p90':>8} | "
+          f"{'mean':>8} {'p10':>8} {'p50':>8} {'p90':>8} | {'timeouts':>8}")
+    for idx, (prey_cd, dagger_cd) in enumerate(settings):
+        setting_results = results[idx * args.games:(idx + 1) * args.games]
+        times = np.array([result[0] for result in setting_results])
+        points = np.array([result[1] for result in setting_results])
+        timeouts = sum(not result[2] for result in setting_results)
+        print(f"{prey_cd:9.2f} {dagger_cd:9.2f} {percentiles(times)} | {percentiles(points)} | {timeouts / args.games:8.0%}")
@@ -0,0 +1,56 @@
+import sys
+from pathlib import Path
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+import argparse
+import time
+import os
+
+# Replay runner - plays a replay saved by the game again, as fast as possible. Headless by default, rendered with --render.
+# Runs under the profiler when it's enabled in the config, so the same replay gives the same workload before and after a change.
+#
+# Usage:
+#   python tests/replay_runner.py replays/2025-01-01_12-00-00.cnr             # Headless
+#   python tests/replay_runner.py replays/2025-01-01_12-00-00.cnr --render    # Rendered
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Play a Circle Nom replay again, as fast as possible.")
+    parser.add_argument("path", type=str, help="The replay file's path.")
+    parser.add_argument("--render", action="store_true", help="Render the replay in a window.")
+    args = parser.parse_args()
+    replay_path = os.path.abspath(args.path)
+
+    # Asset paths are relative to the project root
+    os.chdir(Path(__file__).resolve().parent.parent)
+    if not args.render:
+        os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+    # Pygame init - a display is only needed for rendered replays
+    import pygame
+    pygame.font.init()
+    pygame.mixer.init()
+
+    from circle_nom.systems.replay import Replay
+    from circle_nom.helpers.profile import profile
+    replay = Replay.load(replay_path)
+    screen = None
+    if args.render:
+        pygame.display.init()
+        screen = pygame.display.set_mode(size=replay.header.screen_size)
+
+    # The engine loads the assets on import, which needs the display set up first
+    from circle_nom.core.engine import CircleNom
+    game = CircleNom.from_replay(replay, screen)
+
+    # Profiled if the profiler is enabled in the config - profile() drops the return value, so keep it here
+    results = []
+    start = time.perf_counter()
+    profile(func=lambda: results.append(game.run_replay()))
+    elapsed = time.perf_counter() - start
+    result = results[0]
+
+    # The game records itself again while replaying - a deterministic replay records the same steps and events
+    in_sync = game.replay.step_count == replay.step_count and game.replay.events == replay.events
+    print(f"Replayed {result.steps} steps ({result.time:.1f}s of game time) in {elapsed:.2f}s.")
+    print(f"Seed: {result.seed}, points: {result.points}, sizes: {result.sizes}, game over: {result.game_over}")
+    print("Replay in sync." if in_sync else "Replay out of sync - the recorded and the replayed game differ.")
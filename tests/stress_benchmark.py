@@ -0,0 +1,85 @@
+import sys
+from pathlib import Path
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+import argparse
+import time
+import os
+
+# Stress benchmark - times the update and draw paths of the engine at doubling Prey and Dagger counts.
+# Every count plays a headless singleplayer game with a scripted bot, the update time is the simulated steps' wall time,
+# the draw time is measured on the final state of the game. With --budget it fails once a count goes over the budget,
+# so it can guard the scaling of the collision and draw paths.
+#
+# Usage:
+#   python tests/stress_benchmark.py                                # 2 Preys and 1 Dagger doubled up to 1024 Preys
+#   python tests/stress_benchmark.py --max-prey 4096 --time 20      # Bigger counts, longer games
+#   python tests/stress_benchmark.py --budget 8.3                   # Fail if a step and its draw take over 8.3ms (120 Hz)
+#   python tests/stress_benchmark.py --entity-store off             # Prey and Dagger state never in NumPy entity stores
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Time the Circle Nom update and draw paths at doubling entity counts.")
+    parser.add_argument("--max-prey", type=int, default=1024, help="Largest Prey count, Dagger counts are half the Prey counts.")
+    parser.add_argument("--time", type=float, default=10, help="Simulated time per count in seconds.")
+    parser.add_argument("--draws", type=int, default=50, help="Draws timed per count.")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of every game.")
+    parser.add_argument("--budget", type=float, default=None, help="Optional update and draw budget per step in milliseconds.")
+    parser.add_argument("--entity-store", choices=("auto", "on", "off"), default="auto",
+                        help="Keep the Prey and Dagger state in NumPy entity stores. Picked by the engine from the counts if auto.")
+    args = parser.parse_args()
+    if args.max_prey < 2 or args.time <= 0 or args.draws < 1:
+        parser.error("--max-prey must be at least 2, --time and --draws must be positive.")
+    
+    # Asset paths are relative to the project root, a dummy display lets the assets convert like in the game
+    os.chdir(Path(__file__).resolve().parent.parent)
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    import logging
+    logging.disable(logging.WARNING)
+    import pygame
+    pygame.font.init()
+    pygame.mixer.init()
+    pygame.display.init()
+    
+    from circle_nom.helpers.config_reader import ConfigReader
+    screen = pygame.display.set_mode(ConfigReader.get_screen())
+    
+    # The engine loads the assets on import, which needs the display set up first
+    from circle_nom.systems.controls import ChaseBot
+    from circle_nom.helpers.asset_bank import AssetBank
+    from circle_nom.core.engine import CircleNom
+    
+    print(f"{'preys':>6} {'daggers':>7} {'store':>5} {'broadphase':>10} {'steps':>6} {'update ms':>10} {'draw ms':>8} {'total ms':>9}")
+    over_budget = []
+    prey_count = 2
+    while prey_count <= args.max_prey:
+        dagger_count = max(prey_count // 2, 1)
+        game = CircleNom(
+            screen=screen, fps_cap=0, difficulty=0, play_mode=0,
+            player_accessory=None, background_image=AssetBank().background_images[0],
+            headless=True, input_source=ChaseBot(), seed=args.seed, prey_count=prey_count, dagger_count=dagger_count,
+            entity_store={"auto": None, "on": True, "off": False}[args.entity_store]
+        )
+        
+        # Update path - the bot may lose before the time is up, the steps it played are timed either way
+        start = time.perf_counter()
+        result = game.simulate(max_time=args.time)
+        update_ms = (time.perf_counter() - start) / result.steps * 1000
+        
+        # Draw path - the game's final state drawn again and again
+        clock = pygame.Clock()
+        start = time.perf_counter()
+        for _ in range(args.draws):
+            game._render(clock, "")
+        draw_ms = (time.perf_counter() - start) / args.draws * 1000
+        
+        total_ms = update_ms + draw_ms
+        print(f"{prey_count:>6} {dagger_count:>7} {'on' if game.ENTITY_STORE else 'off':>5} {game.collisions.broadphase:>10} {result.steps:>6} "
+              f"{update_ms:>10.3f} {draw_ms:>8.3f} {total_ms:>9.3f}")
+        if args.budget is not None and total_ms > args.budget:
+            over_budget.append(prey_count)
+        prey_count *= 2
+    
+    if over_budget:
+        print(f"Over the {args.budget}ms budget at {', '.join(map(str, over_budget))} preys.")
+        sys.exit(1)